@@ -1,18 +1,34 @@
-from .base_agent import BaseAgent
-from .director import Director
-from .scraper_agent import ScraperAgent
-from .scriptwriter_agent import ScriptwriterAgent
-from .voiceover_agent import VoiceoverAgent
-from .visual_agent import VisualAgent
-from .audio_agent import AudioAgent
-from .editor_agent import EditorAgent
-from .clipper_agent import ClipperAgent
+import importlib
 
-# V1 (Backup)
-from .composer_agent import VideoComposerAgent
+# Agents are imported on first attribute access (PEP 562), so importing one agent
+# module doesn't load every other agent's dependencies (moviepy, playwright, whisper...)
+_EXPORTS = {
+    "BaseAgent": ".base_agent",
+    "Director": ".director",
+    "ScraperAgent": ".scraper_agent",
+    "ScriptwriterAgent": ".scriptwriter_agent",
+    "VoiceoverAgent": ".voiceover_agent",
+    "VisualAgent": ".visual_agent",
+    "AudioAgent": ".audio_agent",
+    "EditorAgent": ".editor_agent",
+    "ClipperAgent": ".clipper_agent",
 
-# V2 (New Architecture)
-from .asset_manager_agent import AssetManagerAgent
-from .composition_strategy_agent import CompositionStrategyAgent
-from .timeline_architect_agent import TimelineArchitectAgent
-from .director import Director
+    # V1 (Backup)
+    "VideoComposerAgent": ".composer_agent",
+
+    # V2 (New Architecture)
+    "AssetManagerAgent": ".asset_manager_agent",
+    "CompositionStrategyAgent": ".composition_strategy_agent",
+    "TimelineArchitectAgent": ".timeline_architect_agent",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -1,6 +1,9 @@
 import os
+import asyncio
 import requests
+import srt
 import whisper
+from datetime import timedelta
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
 from ..core.config import Config
@@ -22,22 +25,32 @@ class AudioAgent(BaseAgent):
         
         result = {
             "captions_path": "",
+            "subs": None,  # Parsed captions (list[srt.Subtitle]) so callers skip re-reading the SRT
             "sound_effects": []
         }
         
         # 1. Generate Captions (SRT)
         try:
-            transcription = self.whisper_model.transcribe(audio_path)
+            # Whisper is CPU/GPU bound; keep the event loop free while it runs
+            transcription = await asyncio.to_thread(self.whisper_model.transcribe, audio_path)
             srt_path = os.path.join(self.assets_dir, "captions.srt")
             
+            subs = []
             with open(srt_path, "w", encoding="utf-8") as f:
                 for i, segment in enumerate(transcription["segments"]):
                     start = self._format_timestamp(segment["start"])
                     end = self._format_timestamp(segment["end"])
                     text = segment["text"].strip()
                     f.write(f"{i+1}\n{start} --> {end}\n{text}\n\n")
+                    subs.append(srt.Subtitle(
+                        index=i + 1,
+                        start=self._to_timedelta(segment["start"]),
+                        end=self._to_timedelta(segment["end"]),
+                        content=text
+                    ))
             
             result["captions_path"] = srt_path
+            result["subs"] = subs
             print(f"Captions saved to {srt_path}")
             
         except Exception as e:
@@ -49,7 +62,7 @@ class AudioAgent(BaseAgent):
         keywords = ["funny", "pop", "woosh"]
         
         for keyword in keywords:
-            sfx_path = self._download_sfx(keyword)
+            sfx_path = await asyncio.to_thread(self._download_sfx, keyword)
             if sfx_path:
                 result["sound_effects"].append(sfx_path)
                 
@@ -63,6 +76,10 @@ class AudioAgent(BaseAgent):
         millis = int((seconds - int(seconds)) * 1000)
         return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
 
+    def _to_timedelta(self, seconds: float) -> timedelta:
+        """Same millisecond truncation as _format_timestamp, so in-memory subs match the file."""
+        return timedelta(seconds=int(seconds), milliseconds=int((seconds - int(seconds)) * 1000))
+
     def _download_sfx(self, query: str) -> str:
         """Downloads a sound effect from Pixabay."""
         # Pixabay Audio API endpoint
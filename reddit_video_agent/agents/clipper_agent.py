@@ -1,7 +1,8 @@
 import os
 import json
 import time
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional
 from moviepy.editor import VideoFileClip
 import google.generativeai as genai
 from .base_agent import BaseAgent
@@ -16,11 +17,30 @@ class ClipperAgent(BaseAgent):
         # Using the latest Flash model as requested
         self.model = genai.GenerativeModel("models/gemini-flash-latest")
 
-    async def execute(self, video_path: str) -> Dict[str, str]:
+    async def execute(self, video_path: str, clips_queue: Optional[asyncio.Queue] = None) -> Dict[str, str]:
         """
         Analyzes the video and extracts key clips (Intro, Climax, Punchline).
         Returns a dictionary of clip paths.
+        If clips_queue is given, each (key, clip_info) is also put on it as soon
+        as that clip is rendered, followed by None once clipping is done.
         """
+        on_clip = None
+        if clips_queue is not None:
+            loop = asyncio.get_running_loop()
+
+            def on_clip(key, clip_info):
+                # Called from the worker thread; blocks it while the queue is full
+                asyncio.run_coroutine_threadsafe(clips_queue.put((key, clip_info)), loop).result()
+
+        # Upload polling, Gemini call and moviepy cutting are all blocking:
+        # run them in a thread so other agents can work in the meantime.
+        try:
+            return await asyncio.to_thread(self._clip_sync, video_path, on_clip)
+        finally:
+            if clips_queue is not None:
+                await clips_queue.put(None)
+
+    def _clip_sync(self, video_path: str, on_clip=None) -> Dict[str, str]:
         print(f"ClipperAgent: Analyzing video {os.path.basename(video_path)}...")
         
         if not video_path or not os.path.exists(video_path):
@@ -128,6 +148,8 @@ class ClipperAgent(BaseAgent):
                     "description": description,
                     "duration": end - start
                 }
+                if on_clip:
+                    on_clip(key, clips[key])
                 
             original_clip.close()
             
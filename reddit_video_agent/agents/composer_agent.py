@@ -20,6 +20,9 @@ class VideoComposerAgent(BaseAgent):
         self.overlap_max_duration = 10.0
         self.clip_audio_duck_volume = 0.3
         self.fade_duration = 0.5
+        
+        # path -> exists (see _exists)
+        self._stat_cache: Dict[str, bool] = {}
     
     async def execute(self, assets: Dict) -> Dict:
         """
@@ -41,6 +44,9 @@ class VideoComposerAgent(BaseAgent):
         """
         print("VideoComposerAgent: Building multi-track timeline...")
         
+        # Fresh stat cache per run (assets may have changed)
+        self._stat_cache = {}
+        
         parsed_script = assets["parsed_script"]
         voiceover_path = assets["voiceover_path"]
         captions_path = assets["captions_path"]
@@ -99,6 +105,24 @@ class VideoComposerAgent(BaseAgent):
         
         segments = parsed_script["segments"]
         
+        # The voiceover length is the same for every segment: read it once
+        actual_audio_duration = None
+        try:
+            audio_file = AudioFileClip(voiceover_path)
+            actual_audio_duration = audio_file.duration
+            audio_file.close()
+        except Exception as e:
+            print(f"   ⚠️ Could not get audio duration: {e}")
+        
+        # Only AI images are placed on narration segments: filter them once
+        # instead of rescanning every layer type per segment
+        image_timeline = {
+            "layers": [
+                layer for layer in (visual_timeline or {}).get("layers", [])
+                if layer.get("type") == "ai_image"
+            ]
+        }
+        
         for i, segment in enumerate(segments):
             seg_type = segment["type"]
             
@@ -107,18 +131,10 @@ class VideoComposerAgent(BaseAgent):
                 text = segment["text"]
                 duration = self._get_duration_from_srt(text, srt_entries, audio_position)
                 
-                # Get actual audio duration to prevent overflow
-                try:
-                    audio_file = AudioFileClip(voiceover_path)
-                    actual_audio_duration = audio_file.duration
-                    audio_file.close()
-                    
-                    # Cap duration if it exceeds available audio
-                    if audio_position + duration > actual_audio_duration:
-                        duration = actual_audio_duration - audio_position
-                        print(f"   ⚠️ Capping segment duration to {duration:.1f}s (audio limit)")
-                except Exception as e:
-                    print(f"   ⚠️ Could not get audio duration: {e}")
+                # Cap duration if it exceeds available audio
+                if actual_audio_duration is not None and audio_position + duration > actual_audio_duration:
+                    duration = actual_audio_duration - audio_position
+                    print(f"   ⚠️ Capping segment duration to {duration:.1f}s (audio limit)")
                 
                 print(f"   Segment {i+1} ({seg_type}): {duration:.1f}s at timeline {current_time:.1f}s")
                 
@@ -143,7 +159,7 @@ class VideoComposerAgent(BaseAgent):
                     "timeline_start": current_time,
                     "timeline_end": current_time + duration,
                     "visual_timeline": self._extract_visuals_for_range(
-                        visual_timeline,
+                        image_timeline,
                         audio_position,
                         audio_position + duration
                     )
@@ -194,7 +210,7 @@ class VideoComposerAgent(BaseAgent):
                         continue
                 
                 # Verify clip exists
-                if not clip_path or not os.path.exists(clip_path):
+                if not self._exists(clip_path):
                     print(f"   ⚠️ Clip file not found: {clip_path}, skipping")
                     continue
                 
@@ -235,6 +251,16 @@ class VideoComposerAgent(BaseAgent):
         timeline["total_duration"] = current_time
         return timeline
     
+    def _exists(self, path: str) -> bool:
+        """Memoized os.path.exists (one stat per unique path)."""
+        if not path:
+            return False
+        exists = self._stat_cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            self._stat_cache[path] = exists
+        return exists
+    
     def _get_duration_from_srt(self, text: str, srt_entries: List, start_position: float) -> float:
         """
         Find duration of text segment from SRT entries.
@@ -1,12 +1,19 @@
 import os
 import json
+import re
+import time
 import asyncio
+import contextlib
+from functools import lru_cache
+from collections import defaultdict
+from dataclasses import dataclass, asdict, is_dataclass
 from typing import Dict, Any, List
-from moviepy.editor import VideoFileClip, AudioFileClip
 import srt
+import numpy as np
 import google.generativeai as genai
 from .base_agent import BaseAgent
 from ..core.config import Config
+from ..core.llm_cache import cache_path, cache_get, cache_put
 from .scraper_agent import ScraperAgent
 from .scriptwriter_agent import ScriptwriterAgent
 from .voiceover_agent import VoiceoverAgent
@@ -20,12 +27,107 @@ from .asset_manager_agent import AssetManagerAgent
 from .composition_strategy_agent import CompositionStrategyAgent
 from .timeline_architect_agent import TimelineArchitectAgent
 
+# orjson is optional: C serializer for the timeline dump / prompt context, json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_pretty(obj) -> str:
+    """2-space indented JSON (orjson when available). Dataclass records serialize as dicts."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+# Inventory records (stage 1). Slotted: small, fixed fields, read many times downstream.
+@dataclass(slots=True)
+class ClipRec:
+    name: str
+    path: str
+    duration: float
+    description: str
+
+
+@dataclass(slots=True)
+class ScreenshotRec:
+    name: str
+    path: str
+    type: str
+    description: str
+
+
+@dataclass(slots=True)
+class ImageRec:
+    name: str
+    path: str
+    description: str
+
+
+def _json_loads(text: str):
+    return orjson.loads(text) if orjson else json.loads(text)
+
+# Runs of whitespace and [VIDEO_BREAK] / *<SHOW>* / *<VISUAL>* markers, for _clean_script_for_tts
+# (group 1 is set when the run has whitespace outside the markers)
+_RE_TTS_CLEAN = re.compile(r'(?:(\s)|\[VIDEO_BREAK:.*?\]|\*<SHOW:[^>]+>\*|\*<VISUAL:[^>]+>\*)+')
+
+
+def _tts_clean_run(m: re.Match) -> str:
+    if m.group(1) is None:
+        return ''  # Markers only
+    if m.string[m.end():m.end() + 1] in ('.', ',', '!', '?'):
+        return ''  # No space before punctuation
+    return ' '
+
+
+def _existing_paths(paths) -> set:
+    """
+    Which of `paths` exist, using one os.scandir per parent directory
+    instead of one stat per path.
+    """
+    by_dir = defaultdict(list)
+    for path in paths:
+        if path:
+            by_dir[os.path.dirname(path)].append(os.path.basename(path))
+    
+    existing = set()
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            continue
+        existing.update(os.path.join(directory, name) for name in names if name in present)
+    return existing
+
+
+@lru_cache(maxsize=None)
+def _configured_model(model_name: str) -> genai.GenerativeModel:
+    """
+    Configure genai and build the model once per process, shared by every Director.
+    Only called from __init__ on the main thread; lru_cache itself is thread-safe for lookups.
+    The model keeps the gRPC client it opens on its first call, so stages 2 and 3
+    reuse one HTTP/2 channel instead of reconnecting per request.
+    """
+    genai.configure(api_key=Config.get_gemini_key(), transport="grpc")
+    return genai.GenerativeModel(model_name)
+
+
 class Director(BaseAgent):
+    # Cap on list entries serialized into the stage 3 prompt (JSON size + input tokens)
+    MAX_PROMPT_ITEMS = 20
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.api_key = Config.get_gemini_key()
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(Config.DIRECTOR_MODEL)
+        self.api_key = Config.get_gemini_key()  # Still handed to CaptionValidator
+        self.model = _configured_model(Config.DIRECTOR_MODEL)
         
         # Initialize sub-agents
         self.scraper = ScraperAgent(config)
@@ -40,193 +142,224 @@ class Director(BaseAgent):
         self.asset_manager = AssetManagerAgent(config)
         self.strategy_agent = CompositionStrategyAgent(config)
         self.timeline_architect = TimelineArchitectAgent(config)
+        
+        # Media durations per (path, mtime), filled by _probe_duration
+        self._duration_cache: Dict[tuple, float] = {}
+        # Parsed SRT and joined caption text per (path, mtime)
+        self._srt_cache: Dict[tuple, list] = {}
+        self._caption_text_cache: Dict[tuple, str] = {}
+        # Built on first use and kept, so its model (and channel) survive across runs
+        self._caption_validator = None
+        # Wall time per phase of the last run, in seconds (see _timed)
+        self._timings: Dict[str, float] = {}
 
     async def execute(self, url: str) -> str:
         """
         Orchestrates the entire video creation process with fine-tuned timeline.
         """
         print(f"🎬 Director: Starting production for {url}")
+        self._timings = {}
         
         try:
             # 1. Pre-Production: Gathering Raw Materials
-            print("\n--- Phase 1: Pre-Production ---")
-            raw_data = await self.scraper.execute(url)
+            async with self._timed("Phase 1: Pre-Production"):
+                print("\n--- Phase 1: Pre-Production ---")
+                raw_data = await self.scraper.execute(url)
             
             # 2. Scripting (with visual markers)
-            print("\n--- Phase 2: Scripting ---")
-            script_data = await self.scriptwriter.execute(raw_data)
-            
-            # Handle backward compatibility
-            if isinstance(script_data, str):
-                script = script_data
-                visual_markers = []
-            else:
-                script = script_data.get("script", "")
-                visual_markers = script_data.get("visual_markers", [])
-            
-            print(f"📝 Script generated ({len(script)} chars)")
-            if visual_markers:
-                print(f"   🎨 Found {len(visual_markers)} visual markers for context-aware images")
+            async with self._timed("Phase 2: Scripting"):
+                print("\n--- Phase 2: Scripting ---")
+                script_data = await self.scriptwriter.execute(raw_data)
+            
+                # Handle backward compatibility
+                if isinstance(script_data, str):
+                    script = script_data
+                    visual_markers = []
+                else:
+                    script = script_data.get("script", "")
+                    visual_markers = script_data.get("visual_markers", [])
+            
+                print(f"📝 Script generated ({len(script)} chars)")
+                if visual_markers:
+                    print(f"   🎨 Found {len(visual_markers)} visual markers for context-aware images")
             
             # 3. Audio Production - SINGLE TTS for Full Script
-            print("\n--- Phase 3: Audio Production (Single TTS) ---")
+            async with self._timed("Phase 3: Audio Production"):
+                print("\n--- Phase 3: Audio Production (Single TTS) ---")
             
-            # Parse script for video breaks
-            from ..core.video_break_handler import VideoBreakHandler
-            break_handler = VideoBreakHandler()
-            parsed_script = break_handler.parse_script(script)
+                # Parse script for video breaks
+                from ..core.video_break_handler import VideoBreakHandler
+                break_handler = VideoBreakHandler()
+                parsed_script = break_handler.parse_script(script)
             
-            if parsed_script["has_breaks"]:
-                print(f"   📹 Detected {sum(1 for s in parsed_script['segments'] if s['type'] == 'video_break')} video break(s)")
-                print("   Cleaning script for TTS (removing markers)...")
-            else:
-                print("   No video breaks detected - standard voiceover")
+                if parsed_script["has_breaks"]:
+                    print(f"   📹 Detected {sum(1 for s in parsed_script['segments'] if s['type'] == 'video_break')} video break(s)")
+                    print("   Cleaning script for TTS (removing markers)...")
+                else:
+                    print("   No video breaks detected - standard voiceover")
             
-            # CLEAN script for TTS (remove VIDEO_BREAK and VISUAL markers)
-            clean_script = self._clean_script_for_tts(script)
-            print(f"   Original script: {len(script)} chars")
-            print(f"   Clean script: {len(clean_script)} chars")
+                # CLEAN script for TTS (remove VIDEO_BREAK and VISUAL markers)
+                clean_script = self._clean_script_for_tts(script)
+                print(f"   Original script: {len(script)} chars")
+                print(f"   Clean script: {len(clean_script)} chars")
             
-            # Generate ONE voiceover for CLEAN script (no markers!)
-            voiceover_path = await self.voiceover.execute(clean_script)
-            if not voiceover_path:
-                raise Exception("Voiceover generation failed")
+                # Generate ONE voiceover for CLEAN script (no markers!)
+                voiceover_path = await self.voiceover.execute(clean_script)
+                if not voiceover_path:
+                    raise Exception("Voiceover generation failed")
             
-            # Generate captions from full audio
-            audio_assets = await self.audio.execute(voiceover_path)
-            captions_path = audio_assets["captions_path"]
-            
-            # Validate captions against full script
-            print("   Validating captions against script...")
-            from ..core.caption_validator import CaptionValidator
-            validator = CaptionValidator(self.api_key)
-            validated_captions_path = validator.validate_and_correct(captions_path, script)
-            captions_path = validated_captions_path
-            audio_assets["captions_path"] = validated_captions_path
+                # Generate + validate captions in the background; Phase 4 doesn't need them
+                caption_task = asyncio.create_task(self._produce_captions(voiceover_path, script))
             
             # 4. Visual Production (Clips & Images)
-            print("\n--- Phase 4: Visual Production ---")
-            
-            # Prepare full context for VisualAgent
-            full_context = {
-                "title": raw_data.get("title"),
-                "content": raw_data.get("content"),
-                "comments": raw_data.get("comments")
-            }
-            
-            # A. Video Clips (if video exists)
-            video_clips = {}
-            if raw_data.get("video_path"):
-                video_clips = await self.clipper.execute(raw_data["video_path"])
-            
-            # B. AI Images (context-aware with visual markers)
-            generated_images = await self.visual.execute(
-                script_data=script_data,  # Pass full script_data (with markers)
-                video_path=raw_data.get("video_path"),
-                full_context=full_context
-            )
+            async with self._timed("Phase 4: Visual Production"):
+                print("\n--- Phase 4: Visual Production ---")
+            
+                # Prepare full context for VisualAgent
+                full_context = {
+                    "title": raw_data.get("title"),
+                    "content": raw_data.get("content"),
+                    "comments": raw_data.get("comments")
+                }
+            
+                # A. Video Clips (if video exists) and B. AI Images (context-aware with visual markers)
+                # are independent, so they run concurrently. A failure in one keeps the other's result.
+                # Clips are handed over one by one so they get checked while Visual is still working
+                clips_queue = asyncio.Queue(maxsize=4)
+                clip_watch_task = asyncio.create_task(self._watch_clips(clips_queue))
+                if raw_data.get("video_path"):
+                    clipper_step = self.clipper.execute(raw_data["video_path"], clips_queue=clips_queue)
+                else:
+                    clips_queue.put_nowait(None)
+                    clipper_step = asyncio.sleep(0, result={})
+            
+                video_clips, generated_images = await asyncio.gather(
+                    clipper_step,
+                    self.visual.execute(
+                        script_data=script_data,  # Pass full script_data (with markers)
+                        video_path=raw_data.get("video_path"),
+                        full_context=full_context
+                    ),
+                    return_exceptions=True
+                )
+            
+                ready_clips = await clip_watch_task
+                if isinstance(video_clips, Exception):
+                    print(f"   ⚠️ Clipper failed: {video_clips}")
+                    video_clips = {}
+                else:
+                    # Drop clips whose file did not make it to disk
+                    video_clips = {k: v for k, v in video_clips.items() if k in ready_clips}
+                if isinstance(generated_images, Exception):
+                    print(f"   ⚠️ Visual production failed: {generated_images}")
+                    generated_images = []
+            
+                # Captions are needed from Phase 5 on
+                captions_path, audio_assets = await caption_task
             
             # 5. AUDIO-DRIVEN TIMELINE (Keyword-Based)
-            print("\n--- Phase 5: Audio-Driven Timeline Generation ---")
-            
-            from ..core.timeline_builder import AudioDrivenTimelineBuilder
-            
-            builder = AudioDrivenTimelineBuilder()
-            
-            # Get audio duration
-            if os.path.exists(voiceover_path):
-                audio = AudioFileClip(voiceover_path)
-                audio_duration = audio.duration
-                audio.close()
-            else:
-                audio_duration = 60.0  # Fallback
-            
-            # Prepare assets dict for builder
-            builder_assets = {
-                "post_screenshot": raw_data.get("post_screenshot"),
-                "comment_screenshots": raw_data.get("comment_screenshots", []),
-                "images": generated_images,
-                "video_clips": video_clips,
-                "video_path": raw_data.get("video_path")
-            }
-            
-            # Build timeline based on SRT keywords
-            timeline = builder.build_timeline(
-                srt_path=captions_path,
-                assets=builder_assets,
-                total_duration=audio_duration
-            )
-            
-            # Add SFX markers
-            timeline = builder.add_sfx_markers(timeline, [])  # Keywords not used yet, but method signature requires it
-            
-            # Save timeline for debugging
-            timeline_path = os.path.join(Config.ASSETS_DIR, "timeline.json")
-            with open(timeline_path, 'w') as f:
-                json.dump(timeline, f, indent=2)
-            print(f"   ✅ Timeline saved to {timeline_path}")
+            async with self._timed("Phase 5: Timeline"):
+                print("\n--- Phase 5: Audio-Driven Timeline Generation ---")
+            
+                from ..core.timeline_builder import AudioDrivenTimelineBuilder
+            
+                builder = AudioDrivenTimelineBuilder()
+            
+                # Get audio duration
+                if os.path.exists(voiceover_path):
+                    audio_duration = await self._probe_duration(voiceover_path)
+                else:
+                    audio_duration = 60.0  # Fallback
+            
+                # Prepare assets dict for builder
+                builder_assets = {
+                    "post_screenshot": raw_data.get("post_screenshot"),
+                    "comment_screenshots": raw_data.get("comment_screenshots", []),
+                    "images": generated_images,
+                    "video_clips": video_clips,
+                    "video_path": raw_data.get("video_path")
+                }
+            
+                # Build timeline based on SRT keywords
+                timeline = builder.build_timeline(
+                    srt_path=captions_path,
+                    assets=builder_assets,
+                    total_duration=audio_duration
+                )
+            
+                # Add SFX markers
+                timeline = builder.add_sfx_markers(timeline, [])  # Keywords not used yet, but method signature requires it
+            
+                # Save timeline for debugging
+                timeline_path = Config.PATHS.TIMELINE
+                with open(timeline_path, 'w', encoding='utf-8') as f:
+                    f.write(_json_pretty(timeline))
+                print(f"   ✅ Timeline saved to {timeline_path}")
             
             # 6. Video Composition V2 (Multi-Agent Pipeline)
-            print("\n--- Phase 6: Video Composition V2 ---")
-            
-            # Step 6.1: Asset Management
-            print("   Step 1: Asset Organization...")
-            raw_assets = {
-                "script": script,
-                "parsed_script": parsed_script,
-                "voiceover_path": voiceover_path,
-                "captions_path": captions_path,
-                "video_clips": video_clips,
-                "images": generated_images,
-                "video_path": raw_data.get("video_path"),
-                "sound_effects": []  # TODO: Add SFX support
-            }
-            
-            asset_catalog = await self.asset_manager.execute(raw_assets)
-            
-            # Step 6.2: Composition Strategy
-            print("   Step 2: Strategy Selection...")
-            strategy_input = {
-                "script": script,
-                "parsed_script": parsed_script,
-                "asset_catalog": asset_catalog
-            }
-            
-            composition_strategy = await self.strategy_agent.execute(strategy_input)
-            
-            # Step 6.3: Timeline Architecture
-            print("   Step 3: Timeline Building...")
-            timeline_input = {
-                "script": script,
-                "parsed_script": parsed_script,
-                "asset_catalog": asset_catalog,
-                "strategy": composition_strategy
-            }
-            
-            professional_timeline = await self.timeline_architect.execute(timeline_input)
+            async with self._timed("Phase 6: Composition"):
+                print("\n--- Phase 6: Video Composition V2 ---")
+            
+                # Step 6.1: Asset Management
+                print("   Step 1: Asset Organization...")
+                raw_assets = {
+                    "script": script,
+                    "parsed_script": parsed_script,
+                    "voiceover_path": voiceover_path,
+                    "captions_path": captions_path,
+                    "video_clips": video_clips,
+                    "images": generated_images,
+                    "video_path": raw_data.get("video_path"),
+                    "sound_effects": []  # TODO: Add SFX support
+                }
+            
+                asset_catalog = await self.asset_manager.execute(raw_assets)
+            
+                # Step 6.2: Composition Strategy
+                print("   Step 2: Strategy Selection...")
+                strategy_input = {
+                    "script": script,
+                    "parsed_script": parsed_script,
+                    "asset_catalog": asset_catalog
+                }
+            
+                composition_strategy = await self.strategy_agent.execute(strategy_input)
+            
+                # Step 6.3: Timeline Architecture
+                print("   Step 3: Timeline Building...")
+                timeline_input = {
+                    "script": script,
+                    "parsed_script": parsed_script,
+                    "asset_catalog": asset_catalog,
+                    "strategy": composition_strategy
+                }
+            
+                professional_timeline = await self.timeline_architect.execute(timeline_input)
             
             # 7. Final Edit (Render from Timeline)
-            print("\n--- Phase 7: Final Edit ---")
-            
-            # Prepare assets dict for Editor
-            assets = {
-                "video_path": raw_data.get("video_path"),
-                "voiceover_path": voiceover_path,
-                "captions_path": captions_path,
-                "images": generated_images,
-                "post_screenshot": raw_data.get("post_screenshot"),
-                "comment_screenshots": raw_data.get("comment_screenshots", []),
-                "video_clips": video_clips,
-                "sound_effects": audio_assets.get("sound_effects", []),
-                "timeline": timeline,  # Visual timeline (legacy)
-                "parsed_script": parsed_script,
-                "script": script,
-                "professional_timeline": professional_timeline  # V2 Timeline!
-            }
-            
-            final_video = await self.editor.execute(assets)
+            async with self._timed("Phase 7: Final Edit"):
+                print("\n--- Phase 7: Final Edit ---")
+            
+                # Prepare assets dict for Editor
+                assets = {
+                    "video_path": raw_data.get("video_path"),
+                    "voiceover_path": voiceover_path,
+                    "captions_path": captions_path,
+                    "images": generated_images,
+                    "post_screenshot": raw_data.get("post_screenshot"),
+                    "comment_screenshots": raw_data.get("comment_screenshots", []),
+                    "video_clips": video_clips,
+                    "sound_effects": audio_assets.get("sound_effects", []),
+                    "timeline": timeline,  # Visual timeline (legacy)
+                    "parsed_script": parsed_script,
+                    "script": script,
+                    "professional_timeline": professional_timeline  # V2 Timeline!
+                }
+            
+                final_video = await self.editor.execute(assets)
             
             print(f"\n✅ Production Complete! Video: {final_video}")
+            self._save_timings()
             return final_video
 
         except Exception as e:
@@ -235,6 +368,114 @@ class Director(BaseAgent):
             traceback.print_exc()
             return None
 
+    @contextlib.asynccontextmanager
+    async def _timed(self, name: str):
+        """Record the wall time of a phase in self._timings."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = time.perf_counter() - start
+            print(f"   ⏱️ {name}: {self._timings[name]:.2f}s")
+
+    def _save_timings(self):
+        """Print the per-phase summary and write it next to timeline.json."""
+        print("\n⏱️ Phase timings:")
+        for name, seconds in self._timings.items():
+            print(f"   {name}: {seconds:.2f}s")
+        try:
+            with open(os.path.join(Config.ASSETS_DIR, "timings.json"), 'w', encoding='utf-8') as f:
+                f.write(_json_pretty(self._timings))
+        except OSError as e:
+            print(f"   ⚠️ Could not save timings: {e}")
+
+    async def _probe_duration(self, path: str) -> float:
+        """
+        Media duration in seconds via ffprobe (no moviepy reader, no event-loop stall).
+        Cached per (path, mtime).
+        """
+        key = (path, os.path.getmtime(path))
+        if key in self._duration_cache:
+            return self._duration_cache[key]
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=nw=1:nk=1",
+                path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            out, _ = await proc.communicate()
+            duration = float(out.decode().strip())
+        except Exception as e:
+            # Fallback: let moviepy read it (off the event loop)
+            print(f"   ⚠️ ffprobe failed for {os.path.basename(path)} ({e}), using moviepy")
+            duration = await asyncio.to_thread(self._moviepy_duration, path)
+        
+        self._duration_cache[key] = duration
+        return duration
+
+    @staticmethod
+    def _moviepy_duration(path: str) -> float:
+        from moviepy.editor import AudioFileClip
+        audio = AudioFileClip(path)
+        duration = audio.duration
+        audio.close()
+        return duration
+
+    def _load_subs(self, path: str) -> list:
+        """Parse an SRT file once per (path, mtime)."""
+        key = (path, os.path.getmtime(path))
+        if key not in self._srt_cache:
+            with open(path, 'r') as f:
+                self._srt_cache[key] = list(srt.parse(f.read()))
+        return self._srt_cache[key]
+
+    async def _watch_clips(self, clips_queue: asyncio.Queue) -> set:
+        """Validate clips as the Clipper hands them over. Returns the keys of usable clips."""
+        ready = set()
+        while True:
+            item = await clips_queue.get()
+            if item is None:
+                return ready
+            key, clip_info = item
+            if os.path.exists(clip_info["path"]):
+                ready.add(key)
+                print(f"   🎞️ Clip ready: {key} ({clip_info['duration']:.1f}s)")
+            else:
+                print(f"   ⚠️ Clip {key} missing on disk: {clip_info['path']}")
+
+    async def _produce_captions(self, voiceover_path: str, script: str):
+        """
+        Generate captions from the full audio and validate them against the script.
+        Returns (captions_path, audio_assets).
+        """
+        audio_assets = await self.audio.execute(voiceover_path)
+        captions_path = audio_assets["captions_path"]
+        
+        # Validate captions against full script (blocking Gemini call -> worker thread)
+        print("   Validating captions against script...")
+        if self._caption_validator is None:
+            from ..core.caption_validator import CaptionValidator
+            self._caption_validator = CaptionValidator(self.api_key)
+        subs = audio_assets.pop("subs", None)
+        if subs:
+            # Validate the in-memory captions; the result seeds the SRT cache so
+            # stage 1 / stage 2 never parse the validated file again
+            validated_captions_path, validated_subs = await asyncio.to_thread(
+                self._caption_validator.validate_and_correct_subs, subs, script, captions_path
+            )
+            self._srt_cache[(validated_captions_path, os.path.getmtime(validated_captions_path))] = validated_subs
+        else:
+            validated_captions_path = await asyncio.to_thread(
+                self._caption_validator.validate_and_correct, captions_path, script
+            )
+        audio_assets["captions_path"] = validated_captions_path
+        
+        return validated_captions_path, audio_assets
+
     async def _stage1_inventory_assets(
         self, raw_data: Dict, video_clips: Dict, images: List[str], 
         voiceover_path: str, captions_path: str
@@ -250,7 +491,14 @@ class Director(BaseAgent):
             "caption_segments": []
         }
         
+        # One directory listing per asset folder instead of a stat per asset
+        clip_paths = [info.get("path") if isinstance(info, dict) else info for info in video_clips.values()]
+        existing = _existing_paths(
+            clip_paths + raw_data.get("comment_screenshots", []) + list(images) + [voiceover_path, captions_path]
+        )
+        
         # Video Clips
+        pending = []
         for clip_type, clip_info in video_clips.items():
             # Handle new format: {path, description, duration}
             if isinstance(clip_info, dict):
@@ -263,77 +511,90 @@ class Director(BaseAgent):
                 description = f"{clip_type} clip"
                 clip_duration = 0
             
-            if clip_path and os.path.exists(clip_path):
-                try:
-                    if clip_duration == 0:
-                        # Get duration from file if not provided
-                        clip = VideoFileClip(clip_path)
-                        clip_duration = clip.duration
-                        clip.close()
-                    
-                    inventory["video_clips"].append({
-                        "name": clip_type,
-                        "path": clip_path,
-                        "duration": clip_duration,
-                        "description": description
-                    })
-                except Exception as e:
-                    print(f"   ⚠️ Failed to process clip {clip_type}: {e}")
+            if clip_path and clip_path in existing:
+                pending.append((clip_type, clip_path, description, clip_duration))
+        
+        # Get missing durations from the files, all probes at once (bounded ffprobe spawns)
+        probe_slots = asyncio.Semaphore(8)
+        
+        async def clip_duration_of(clip_path, clip_duration):
+            if clip_duration:
+                return clip_duration
+            async with probe_slots:
+                return await self._probe_duration(clip_path)
+        
+        durations = await asyncio.gather(
+            *[clip_duration_of(path, duration) for _, path, _, duration in pending],
+            return_exceptions=True
+        )
+        
+        for (clip_type, clip_path, description, _), clip_duration in zip(pending, durations):
+            if isinstance(clip_duration, Exception):
+                print(f"   ⚠️ Failed to process clip {clip_type}: {clip_duration}")
+                continue
+            
+            inventory["video_clips"].append(ClipRec(
+                name=clip_type,
+                path=clip_path,
+                duration=clip_duration,
+                description=description
+            ))
         
         # Screenshots
         if raw_data.get("post_screenshot"):
-            inventory["screenshots"].append({
-                "name": "post_screenshot",
-                "path": raw_data["post_screenshot"],
-                "type": "post",
-                "description": "Main Reddit post screenshot"
-            })
+            inventory["screenshots"].append(ScreenshotRec(
+                name="post_screenshot",
+                path=raw_data["post_screenshot"],
+                type="post",
+                description="Main Reddit post screenshot"
+            ))
         
         for i, comment_shot in enumerate(raw_data.get("comment_screenshots", [])):
-            if os.path.exists(comment_shot):
-                inventory["screenshots"].append({
-                    "name": f"comment_thread_{i}",
-                    "path": comment_shot,
-                    "type": "comment",
-                    "description": f"Comment thread {i+1}"
-                })
+            if comment_shot in existing:
+                inventory["screenshots"].append(ScreenshotRec(
+                    name=f"comment_thread_{i}",
+                    path=comment_shot,
+                    type="comment",
+                    description=f"Comment thread {i+1}"
+                ))
         
         # AI Images
         for i, img_path in enumerate(images):
-            if os.path.exists(img_path):
-                inventory["ai_images"].append({
-                    "name": f"ai_image_{i}",
-                    "path": img_path,
-                    "description": f"AI generated image {i+1}"
-                })
+            if img_path in existing:
+                inventory["ai_images"].append(ImageRec(
+                    name=f"ai_image_{i}",
+                    path=img_path,
+                    description=f"AI generated image {i+1}"
+                ))
         
         # Audio
-        if os.path.exists(voiceover_path):
-            audio = AudioFileClip(voiceover_path)
+        if voiceover_path in existing:
+            original_duration = await self._probe_duration(voiceover_path)
             # Account for 1.2x speed
-            actual_duration = audio.duration / 1.2
+            actual_duration = original_duration / 1.2
             inventory["audio"] = {
                 "path": voiceover_path,
-                "original_duration": audio.duration,
+                "original_duration": original_duration,
                 "playback_duration": actual_duration,
                 "speed": 1.2
             }
-            audio.close()
         
         # Caption Segments
-        if os.path.exists(captions_path):
-            with open(captions_path, 'r') as f:
-                subs = list(srt.parse(f.read()))
-                for sub in subs:
-                    # Adjust for 1.2x speed
-                    start = sub.start.total_seconds() / 1.2
-                    end = sub.end.total_seconds() / 1.2
-                    inventory["caption_segments"].append({
-                        "text": sub.content,
-                        "start": start,
-                        "end": end,
-                        "duration": end - start
-                    })
+        if captions_path in existing:
+            subs = self._load_subs(captions_path)
+            count = len(subs)
+            
+            # Adjust for 1.2x speed in one vectorized division
+            starts = np.fromiter((sub.start.total_seconds() for sub in subs), dtype=np.float64, count=count) / 1.2
+            ends = np.fromiter((sub.end.total_seconds() for sub in subs), dtype=np.float64, count=count) / 1.2
+            durations = ends - starts
+            
+            # SoA view for numeric consumers; the dict list stays for prompts / JSON
+            inventory["caption_arrays"] = {"starts": starts, "ends": ends, "durations": durations}
+            inventory["caption_segments"] = [
+                {"text": sub.content, "start": start, "end": end, "duration": duration}
+                for sub, start, end, duration in zip(subs, starts.tolist(), ends.tolist(), durations.tolist())
+            ]
         
         return inventory
 
@@ -344,9 +605,10 @@ class Director(BaseAgent):
         # Get caption text for context
         caption_text = ""
         if os.path.exists(captions_path):
-            with open(captions_path, 'r') as f:
-                subs = list(srt.parse(f.read()))
-                caption_text = " ".join([sub.content for sub in subs])
+            key = (captions_path, os.path.getmtime(captions_path))
+            if key not in self._caption_text_cache:
+                self._caption_text_cache[key] = " ".join(sub.content for sub in self._load_subs(captions_path))
+            caption_text = self._caption_text_cache[key]
         
         prompt = f"""
         Analyze this viral video script and identify key narrative beats.
@@ -376,12 +638,20 @@ class Director(BaseAgent):
         ]
         """
         
+        # Beats only depend on the script and captions: reuse them across reruns
+        llm_cache_path = cache_path("stage2", Config.DIRECTOR_MODEL, script, caption_text)
+        beats = cache_get(llm_cache_path)
+        if beats is not None:
+            print("   ✅ Narrative beats loaded from cache")
+            return {"beats": beats}
+        
         try:
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 prompt,
                 generation_config={"response_mime_type": "application/json"}
             )
-            beats = json.loads(response.text)
+            beats = _json_loads(response.text)
+            cache_put(llm_cache_path, beats)
             return {"beats": beats}
         except Exception as e:
             print(f"   ⚠️ Narrative analysis failed: {e}")
@@ -393,30 +663,23 @@ class Director(BaseAgent):
         """
         Stage 3: Generate precise timeline mapping assets to exact timestamps.
         """
-        # Prepare comprehensive context for Gemini
-        context = f"""
-        SCRIPT:
-        {script}
-        
-        AVAILABLE ASSETS:
-        
-        Video Clips ({len(inventory['video_clips'])}):
-        {json.dumps(inventory['video_clips'], indent=2)}
-        
-        Screenshots ({len(inventory['screenshots'])}):
-        {json.dumps(inventory['screenshots'], indent=2)}
-        
-        AI Images ({len(inventory['ai_images'])}):
-        {json.dumps(inventory['ai_images'], indent=2)}
-        
-        Caption Segments ({len(inventory['caption_segments'])}):
-        {json.dumps(inventory['caption_segments'][:10], indent=2)}  # First 10 for brevity
-        
-        Narrative Beats:
-        {json.dumps(narrative['beats'], indent=2)}
-        
-        Audio Duration: {inventory['audio']['playback_duration']:.2f}s (at 1.2x speed)
-        """
+        # Prepare comprehensive context for Gemini (lists are capped before serializing)
+        cap = self.MAX_PROMPT_ITEMS
+        parts = ["SCRIPT:\n", script, "\n\nAVAILABLE ASSETS:\n"]
+        sections = (
+            ("Video Clips", inventory['video_clips'], cap),
+            ("Screenshots", inventory['screenshots'], cap),
+            ("AI Images", inventory['ai_images'], cap),
+            ("Caption Segments", inventory['caption_segments'], 10),
+        )
+        for label, items, limit in sections:
+            if items:  # Empty sections are left out entirely
+                parts += ["\n", label, " (", str(len(items)), "):\n", _json_pretty(items[:limit]), "\n"]
+        parts += [
+            "\nNarrative Beats:\n", _json_pretty(narrative['beats']),
+            f"\n\nAudio Duration: {inventory['audio']['playback_duration']:.2f}s (at 1.2x speed)\n",
+        ]
+        context = "".join(parts)
         
         prompt = f"""
         You are a professional video editor. Create a PRECISE timeline for this viral short video.
@@ -461,11 +724,11 @@ class Director(BaseAgent):
         """
         
         try:
-            response = self.model.generate_content(
+            response = await self.model.generate_content_async(
                 prompt,
                 generation_config={"response_mime_type": "application/json"}
             )
-            timeline = json.loads(response.text)
+            timeline = _json_loads(response.text)
             return timeline
         except Exception as e:
             print(f"   ⚠️ Timeline generation failed: {e}")
@@ -485,23 +748,32 @@ class Director(BaseAgent):
         # Sort layers by start time
         layers = sorted(timeline["layers"], key=lambda x: x.get("start", 0))
         
-        # Check for conflicts and gaps
-        for i, layer in enumerate(layers):
+        # Asset existence for every layer in one scandir per directory
+        existing = _existing_paths(layer.get("asset_path") for layer in layers)
+        
+        # Check for conflicts in a single sweep: a layer may not start before the
+        # previous layer of the same type ended (O(N) after the sort)
+        last_end_by_type = {}
+        for layer in layers:
             # Validate times
             start = max(0, float(layer.get("start", 0)))
             end = min(total_duration, float(layer.get("end", start + 2)))
             
+            layer_type = layer.get("type")
+            start = max(start, last_end_by_type.get(layer_type, 0))
+            
             if end <= start:
-                continue  # Skip invalid layers
+                continue  # Skip invalid / fully overlapped layers
             
             # Validate asset exists
             asset_path = layer.get("asset_path")
-            if asset_path and not os.path.exists(asset_path):
+            if asset_path and asset_path not in existing:
                 print(f"   ⚠️ Asset not found: {asset_path}, skipping layer")
                 continue
             
             layer["start"] = start
             layer["end"] = end
+            last_end_by_type[layer_type] = end
             validated_layers.append(layer)
         
         timeline["layers"] = validated_layers
@@ -516,12 +788,12 @@ class Director(BaseAgent):
         
         # Post screenshot intro
         if inventory["screenshots"]:
-            post_shot = next((s for s in inventory["screenshots"] if s["type"] == "post"), None)
+            post_shot = next((s for s in inventory["screenshots"] if s.type == "post"), None)
             if post_shot:
                 layers.append({
                     "type": "screenshot",
-                    "asset_name": post_shot["name"],
-                    "asset_path": post_shot["path"],
+                    "asset_name": post_shot.name,
+                    "asset_path": post_shot.path,
                     "start": 0.0,
                     "end": 5.0,
                     "position": "center_top",
@@ -534,8 +806,8 @@ class Director(BaseAgent):
             for i, img in enumerate(inventory["ai_images"]):
                 layers.append({
                     "type": "ai_image",
-                    "asset_name": img["name"],
-                    "asset_path": img["path"],
+                    "asset_name": img.name,
+                    "asset_path": img.path,
                     "start": (i + 1) * interval,
                     "end": (i + 1) * interval + 2.0,
                     "position": "center",
@@ -552,22 +824,6 @@ class Director(BaseAgent):
         Input:  "Judulnya Float... [VIDEO_BREAK: duration=15s, clip=action] *<VISUAL:spinning_bar|...>* Musuhnya udah..."
         Output: "Judulnya Float... Musuhnya udah..."
         """
-        import re
-        
-        # Remove [VIDEO_BREAK: ...] markers
-        clean = re.sub(r'\[VIDEO_BREAK:.*?\]', '', script)
-        
-        # Remove *<SHOW:...>* markers (screenshots)
-        clean = re.sub(r'\*<SHOW:[^>]+>\*', '', clean)
-        
-        # Remove *<VISUAL:certainty|id|description>* markers (new format)
-        clean = re.sub(r'\*<VISUAL:[^>]+>\*', '', clean)
-
-        
-        # Clean up multiple spaces
-        clean = re.sub(r'\s+', ' ', clean)
-        
-        # Clean up spaces before punctuation
-        clean = re.sub(r'\s+([.,!?])', r'\1', clean)
-        
-        return clean.strip()
+        # One pass over runs of whitespace and markers:
+        # markers vanish, whitespace collapses to one space, and no space is kept before punctuation
+        return _RE_TTS_CLEAN.sub(_tts_clean_run, script).strip()
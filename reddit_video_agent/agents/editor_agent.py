@@ -1,5 +1,6 @@
 import os
 import re
+import hashlib
 import subprocess
 from typing import Dict, Any, List, Tuple
 from moviepy.editor import (VideoFileClip, AudioFileClip, ImageClip, TextClip, 
@@ -17,6 +18,8 @@ class EditorAgent(BaseAgent):
         self.output_dir = Config.OUTPUT_DIR
         self.resolution = (720, 1280)  # 9:16 vertical (720p for testing)
         self.fps = 24
+        self._stat_cache: Dict[str, bool] = {}  # path -> exists (see _exists)
+        self._listed_dirs = set()  # directories fully known from os.listdir
 
     async def execute(self, assets: Dict[str, Any]) -> str:
         """
@@ -853,6 +856,9 @@ class EditorAgent(BaseAgent):
         
         print(f"   Rendering from multi-track timeline ({total_duration:.1f}s)...")
         
+        # Prime stat cache with ONE listdir instead of a stat per asset
+        self._prime_stat_cache(self.assets_dir)
+        
         # === BUILD VIDEO LAYERS WITH Z-INDEX ===
         all_visual_clips = []  # List of (z_index, clip)
         
@@ -870,7 +876,7 @@ class EditorAgent(BaseAgent):
         if "overlay_images" in timeline["tracks"]:
             for img_info in timeline["tracks"]["overlay_images"]:
                 try:
-                    if os.path.exists(img_info["source"]):
+                    if self._exists(img_info["source"]):
                         img = ImageClip(img_info["source"])
                         
                         # Resize logic (fit to screen with padding)
@@ -1001,7 +1007,7 @@ class EditorAgent(BaseAgent):
         if "sfx" in timeline["tracks"]:
             for sfx_info in timeline["tracks"]["sfx"]:
                 try:
-                    if os.path.exists(sfx_info["source"]):
+                    if self._exists(sfx_info["source"]):
                         audio = AudioFileClip(sfx_info["source"])
                         audio = audio.volumex(sfx_info.get("volume", 0.7))
                         audio = audio.set_start(sfx_info["timeline_start"])
@@ -1044,22 +1050,24 @@ class EditorAgent(BaseAgent):
         
         # Create background
         video_path = assets.get("video_path")
-        if video_path and os.path.exists(video_path):
-            bg = VideoFileClip(video_path)
+        if video_path and self._exists(video_path):
+            # Darken for narration, bright for attention_cue
+            darken = segment_type != "attention_cue"
+            prescaled_path = self._prescale_source(video_path, darken=darken)
+
+            bg = VideoFileClip(prescaled_path or video_path)
             if bg.duration < duration:
                 bg = bg.loop(duration=duration)
             else:
                 bg = bg.subclip(0, duration)
-            bg = bg.resize(height=self.resolution[1])
-            if bg.w > self.resolution[0]:
-                bg = bg.crop(x1=bg.w/2 - self.resolution[0]/2, width=self.resolution[0])
-            
-            # Darken for narration, bright for attention_cue
-            if segment_type == "attention_cue":
-                # NO DARKENING for attention cue
-                pass
-            else:
-                bg = bg.fl_image(lambda image: 0.6 * image)
+
+            if not prescaled_path:
+                # Fallback: resize + darken per frame in MoviePy
+                bg = bg.resize(height=self.resolution[1])
+                if bg.w > self.resolution[0]:
+                    bg = bg.crop(x1=bg.w/2 - self.resolution[0]/2, width=self.resolution[0])
+                if darken:
+                    bg = bg.fl_image(lambda image: 0.6 * image)
         else:
             # Solid color fallback
             color = (50, 50, 70) if segment_type == "attention_cue" else (20, 20, 30)
@@ -1072,7 +1080,7 @@ class EditorAgent(BaseAgent):
         for visual in visual_timeline:
             if visual.get("type") == "ai_image":
                 asset_path = visual.get("asset_path")
-                if asset_path and os.path.exists(asset_path):
+                if asset_path and self._exists(asset_path):
                     try:
                         img = ImageClip(asset_path)
                         img = img.resize(height=400)
@@ -1089,7 +1097,83 @@ class EditorAgent(BaseAgent):
             return CompositeVideoClip(layers, size=self.resolution)
         else:
             return bg
-    
+
+    def _prime_stat_cache(self, directory: str):
+        """Reset the stat cache and fill it from a single directory listing."""
+        self._stat_cache = {}
+        self._listed_dirs = set()
+        try:
+            for name in os.listdir(directory):
+                self._stat_cache[os.path.join(directory, name)] = True
+            self._listed_dirs.add(directory)
+        except OSError:
+            pass
+
+    def _exists(self, path: str) -> bool:
+        """Memoized os.path.exists (one stat per unique path)."""
+        if not path:
+            return False
+        exists = self._stat_cache.get(path)
+        if exists is None:
+            # Not in a listed directory's entries -> known missing, no syscall
+            exists = False if os.path.dirname(path) in self._listed_dirs else os.path.exists(path)
+            self._stat_cache[path] = exists
+        return exists
+
+    def _prescale_source(self, video_path: str, darken: bool = False) -> str:
+        """
+        Resize/crop the background video to the output resolution ONCE with ffmpeg,
+        optionally darkening it (0.6x) in the same pass.
+        Output is cached in assets/cache/<hash>_dark.mp4 or <hash>_bright.mp4 and
+        reused across segments. Returns None if ffmpeg fails (caller falls back to MoviePy).
+        """
+        stat = os.stat(video_path)
+        key = f"{os.path.abspath(video_path)}:{stat.st_mtime_ns}:{stat.st_size}:{self.resolution}"
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()[:16]
+
+        cache_dir = os.path.join(self.assets_dir, "cache")
+        output_path = os.path.join(cache_dir, f"{digest}_{'dark' if darken else 'bright'}.mp4")
+        if os.path.exists(output_path):
+            return output_path
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        width, height = self.resolution
+        filters = f"scale=-2:{height},crop='min(iw,{width})':{height}"
+        if darken:
+            # Same as fl_image(0.6 * image), but vectorized inside libavfilter
+            filters += ",colorchannelmixer=rr=0.6:gg=0.6:bb=0.6"
+
+        # Encode to a temp name and rename on success, so a killed or failed
+        # ffmpeg run never leaves a partial file that looks like a cache hit
+        tmp_path = os.path.join(cache_dir, f"{digest}_{'dark' if darken else 'bright'}.{os.getpid()}.tmp.mp4")
+        base_cmd = ['ffmpeg', '-y']
+        encode_args = [
+            '-i', video_path,
+            '-vf', filters,
+            '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '18',
+            '-c:a', 'copy',
+            tmp_path
+        ]
+
+        # Try CUDA-accelerated decode first, then plain CPU
+        try:
+            for hwaccel in (['-hwaccel', 'cuda'], []):
+                try:
+                    subprocess.run(base_cmd + hwaccel + encode_args, check=True, capture_output=True)
+                    os.replace(tmp_path, output_path)
+                    print(f"   ✅ Prescaled background ({'dark' if darken else 'bright'}): {os.path.basename(output_path)}")
+                    return output_path
+                except Exception:
+                    continue
+        finally:
+            # Partial output from a failed attempt
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+        print(f"   ⚠️ Prescale failed for {os.path.basename(video_path)}, using MoviePy resize")
+        return None
+
     def _speed_up_audio_segment_v2(
         self,
         audio: AudioFileClip,
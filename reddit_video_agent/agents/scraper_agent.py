@@ -1,19 +1,79 @@
 import os
+import json
 import asyncio
-from typing import Dict, Any
-from playwright.async_api import async_playwright
+import requests
+import secrets
+from typing import Dict, Any, List, Optional
+from playwright.async_api import BrowserContext
 import yt_dlp
+import numpy as np
+from PIL import Image
 from .base_agent import BaseAgent
 from ..core.config import Config
+from ..core.browser_pool import BrowserPool
+from ..core.dark_bbox import detect_dark_bbox
+
+# Resource types we never need (video is downloaded separately with yt-dlp).
+# Images/fonts/stylesheets are kept: the post/comment screenshots need them.
+BLOCKED_RESOURCE_TYPES = {"media", "ping"}
+
+# Analytics / ad hosts that only slow down page load
+BLOCKED_URL_PATTERNS = (
+    "doubleclick",
+    "google-analytics",
+    "googletagmanager",
+    "googlesyndication",
+    "reddit.com/api/v2/pixel",
+    "redditstatic.com/ads",
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+def _new_id() -> str:
+    """Random id for asset filenames, unique across runs (assets/ persists, PIDs repeat)."""
+    return secrets.token_hex(4)
+
+# Comment authors that never carry real content
+SKIPPED_AUTHORS = {"[deleted]", "[removed]", "AutoModerator"}
+
+# Reads title, content and the top 3 live top-level comments in one evaluate.
+# Takes the SKIPPED_AUTHORS list, so the comments picked here (and screenshotted)
+# are the same ones the JSON API filter would keep. "index" is the position among
+# shreddit-comment[depth='0'] for the screenshot step; "id" is the t1_ fullname.
+EXTRACT_PAGE_JS = """
+(skippedAuthors) => {
+    const skipped = new Set(skippedAuthors);
+    const comments = [];
+    const elements = document.querySelectorAll("shreddit-comment[depth='0']");
+    for (let i = 0; i < elements.length && comments.length < 3; i++) {
+        const author = elements[i].getAttribute("author");
+        const text = elements[i].innerText;
+        if (skipped.has(author) || !text.trim()) continue;
+        comments.push({index: i, id: elements[i].getAttribute("thingid"), author: author, text: text});
+    }
+    return {
+        title: document.querySelector("h1")?.innerText || "",
+        content: document.querySelector("div[data-test-id='post-content']")?.innerText || "",
+        comments: comments
+    };
+}
+"""
+
 
 class ScraperAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.assets_dir = Config.ASSETS_DIR
+        
+        # Video player bbox per screenshot size, e.g. {"1080x1450": [l, t, r, b]}
+        # Persisted so the position survives restarts (fixed viewport = stable layout)
+        self._player_bbox_cache_path = os.path.join(self.assets_dir, "player_bbox_cache.json")
+        self._player_bbox_cache = self._load_player_bbox_cache()
 
-    async def execute(self, url: str) -> Dict[str, Any]:
+    async def execute(self, url: str, context: Optional[BrowserContext] = None) -> Dict[str, Any]:
         """
         Scrapes Reddit post, takes screenshots, and downloads video.
+        Pass `context` to reuse an existing browser context; defaults to the shared BrowserPool.
         """
         print(f"ScraperAgent: Processing {url}")
         
@@ -25,139 +85,161 @@ class ScraperAgent(BaseAgent):
             "video_path": None
         }
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True) # Set headless=False for debugging
-            context = await browser.new_context(
+        # 0. Fast path: text + comments from Reddit's JSON API (no JS rendering)
+        json_data = await self._fetch_json(url)
+        if json_data:
+            result["title"] = json_data["title"]
+            result["content"] = json_data["content"]
+            print(f"   ✅ Post data fetched via JSON API ({len(json_data['comments'])} comments)")
+
+        # Start the video download in a thread so it overlaps with the screenshot work
+        video_task = None
+        if json_data and not json_data["has_video"]:
+            print("   No video in post (JSON API), skipping download")
+        else:
+            video_task = asyncio.create_task(asyncio.to_thread(self._download_video_sync, url))
+
+        # Playwright is still needed for the post/comment screenshots.
+        # The browser is shared (BrowserPool); each post only opens a page.
+        if context is None:
+            context = await BrowserPool.get_context(
                 viewport={"width": 1080, "height": 1920}, # Mobile-ish view for better screenshots? Or desktop? Let's stick to desktop for clarity then crop.
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                user_agent=USER_AGENT
             )
+        
+        async with BrowserPool.slot():
             page = await context.new_page()
             try:
-                await page.goto(url, timeout=60000)
-                # Reddit is heavy, networkidle is too strict.
-                await page.wait_for_load_state("domcontentloaded", timeout=60000)
-                # Optional: wait for a specific element to ensure content is there
+                # Block heavy/irrelevant requests (trackers, media) for faster page-ready
+                await page.route("**/*", self._route_request)
                 try:
-                    await page.wait_for_selector("shreddit-post", timeout=10000)
-                except:
-                    pass
-            except Exception as e:
-                print(f"Warning: Page load timed out or failed: {e}")
-                # Continue anyway to try downloading video or extracting what's there
-
-            # 1. Extract Text
-            # Selectors might need adjustment based on Reddit's dynamic classes. 
-            # Using generic attributes where possible.
-            try:
-                # Title - usually inside an h1
-                title_element = await page.query_selector("h1")
-                if title_element:
-                    result["title"] = await title_element.inner_text()
-                
-                # Content - usually in a div with specific ID or class
-                # This is tricky on new Reddit.
-                # Let's try to grab the main post container's text if specific selector fails.
-                post_content_element = await page.query_selector("div[data-test-id='post-content']")
-                if post_content_element:
-                     result["content"] = await post_content_element.inner_text()
-            except Exception as e:
-                print(f"Error extracting text: {e}")
+                    await page.goto(url, timeout=60000)
+                    # Reddit is heavy, networkidle is too strict.
+                    await page.wait_for_load_state("domcontentloaded", timeout=60000)
+                    # Optional: wait for a specific element to ensure content is there
+                    try:
+                        await page.wait_for_selector("shreddit-post", timeout=10000)
+                    except:
+                        pass
+                except Exception as e:
+                    print(f"Warning: Page load timed out or failed: {e}")
+                    # Continue anyway to try downloading video or extracting what's there
 
-            # 2. Screenshots
-            # Post Screenshot
-            # We want to capture the header and the body.
-            try:
-                # Wait for the post content to load
-                await page.wait_for_selector("shreddit-post", timeout=10000)
+                # 1. Post Screenshot
+                # We want to capture the header and the body.
+                try:
+                    # Wait for the post content to load
+                    await page.wait_for_selector("shreddit-post", timeout=10000)
                 
-                # Take screenshot of the main post container
-                post_element = await page.query_selector("shreddit-post")
-                if post_element:
-                    import uuid
-                    unique_id = str(uuid.uuid4())[:8]
-                    screenshot_path = os.path.join(self.assets_dir, f"post_screenshot_{unique_id}.png")
-                    await post_element.screenshot(path=screenshot_path)
-                    result["post_screenshot"] = screenshot_path
-            except Exception as e:
-                print(f"Error taking post screenshot: {e}")
+                    # Take screenshot of the main post container
+                    post_element = await page.query_selector("shreddit-post")
+                    if post_element:
+                        unique_id = _new_id()
+                        screenshot_path = os.path.join(self.assets_dir, f"post_screenshot_{unique_id}.png")
+                        await post_element.screenshot(path=screenshot_path)
+                        result["post_screenshot"] = screenshot_path
+                except Exception as e:
+                    print(f"Error taking post screenshot: {e}")
 
-            # 2. Extract Comments (Text & Screenshots)
-            print("   Scraping comments...")
-            comments_data = [] # To store text for scriptwriter
-            comment_screenshots = []
-            
-            try:
-                # Wait for comments to load
-                await page.wait_for_selector("shreddit-comment", timeout=10000)
+                # 2. Extract Text & Comments in ONE DOM read (single CDP round trip)
+                print("   Scraping comments...")
+                comments_data = [] # To store text for scriptwriter
+                comment_screenshots = []
                 
-                # Get all top-level comments (or comment trees)
-                # In new Reddit, shreddit-comment-tree often wraps the thread
-                # But shreddit-comment is the individual comment.
-                # We want to capture the visual "block" of a conversation.
-                
-                # Strategy: Find top-level comments, check if they are not deleted, 
-                # then take a screenshot of the thread (or the comment + its first reply).
+                try:
+                    # Wait for comments to load
+                    await page.wait_for_selector("shreddit-comment", timeout=10000)
+                except Exception as e:
+                    print(f"   ⚠️ Comments did not load: {e}")
                 
-                comment_elements = await page.query_selector_all("shreddit-comment[depth='0']")
+                try:
+                    page_data = await page.evaluate(EXTRACT_PAGE_JS, sorted(SKIPPED_AUTHORS))
+                except Exception as e:
+                    print(f"Error extracting text: {e}")
+                    page_data = {"title": "", "content": "", "comments": []}
                 
-                count = 0
-                for i, comment in enumerate(comment_elements):
-                    if count >= 3: # Limit to top 3 threads
-                        break
-                        
-                    # Check for deleted/removed
-                    author = await comment.get_attribute("author")
-                    if author == "[deleted]" or author == "[removed]":
-                        continue
-                        
-                    # Extract text content for Scriptwriter
-                    # The text is usually in a slot="comment" or specific div
-                    text_content = await comment.inner_text()
-                    
-                    # Clean up text (remove UI elements like "Reply", "Share")
-                    lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-                    # Heuristic: Take the longest line or combine lines that look like content
-                    clean_text = " ".join(lines[:5]) # Take first few lines
-                    
-                    # Check for nested replies (children)
-                    # We want to capture the conversation flow
-                    # Try to find the next sibling or nested tree
-                    # Taking screenshot of the 'comment' element usually captures children if they are expanded.
+                # Text (only if the JSON fast path failed)
+                if not json_data:
+                    result["title"] = page_data["title"]
+                    result["content"] = page_data["content"]
+
+                # 3. Comment Screenshots
+                # Strategy: Top-level comments (already filtered by SKIPPED_AUTHORS in JS),
+                # screenshot of the 'comment' element usually captures children if they are expanded.
+                try:
+                    comment_elements = await page.query_selector_all("shreddit-comment[depth='0']")
                     
-                    # Screenshot
-                    import uuid
-                    unique_id = str(uuid.uuid4())[:8]
-                    screenshot_filename = f"comment_thread_{count}_{unique_id}.png"
-                    screenshot_path = os.path.join(self.assets_dir, screenshot_filename)
+                    async def shoot(comment, count):
+                        unique_id = _new_id()
+                        screenshot_filename = f"comment_thread_{count}_{unique_id}.png"
+                        screenshot_path = os.path.join(self.assets_dir, screenshot_filename)
                     
-                    # Scroll into view
-                    await comment.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(500) # Wait for render
+                        # Scroll into view
+                        await comment.scroll_into_view_if_needed()
+                        # Wait until layout settles instead of a blind sleep
+                        await comment.wait_for_element_state("stable")
+                        if count == 0:
+                            await page.wait_for_timeout(50) # Absorb the initial lazy-load
                     
-                    await comment.screenshot(path=screenshot_path)
-                    comment_screenshots.append(screenshot_path)
+                        await comment.screenshot(path=screenshot_path)
+                        print(f"   ✅ Captured comment thread {count + 1}")
+                        return screenshot_path
                     
-                    comments_data.append({
-                        "author": author,
-                        "text": clean_text
-                    })
+                    # Text first, so a failed screenshot doesn't lose the narration
+                    for comment_info in page_data["comments"]:
+                        comments_data.append({
+                            "author": comment_info["author"],
+                            "text": self._comment_text(comment_info, json_data)
+                        })
                     
-                    count += 1
-                    print(f"   ✅ Captured comment thread {count}")
+                    # Screenshots run concurrently (Playwright queues the capture itself per page);
+                    # return_exceptions: one failed capture doesn't drop the others
+                    targets = [comment_elements[info["index"]] for info in page_data["comments"]]
+                    shots = await asyncio.gather(
+                        *[shoot(comment, count) for count, comment in enumerate(targets)],
+                        return_exceptions=True
+                    )
+                    for count, shot in enumerate(shots):
+                        if isinstance(shot, BaseException):
+                            print(f"   ⚠️ Error capturing comment thread {count + 1}: {shot}")
+                        else:
+                            comment_screenshots.append(shot)
             
-            except Exception as e:
-                print(f"   ⚠️ Error scraping comments: {e}")
-
-            result["comments_text"] = comments_data
-            result["comment_screenshots"] = comment_screenshots
+                except Exception as e:
+                    print(f"   ⚠️ Error scraping comments: {e}")
 
-            await browser.close()
+                # No comments from the page (so no screenshots): narrate the API's top 3
+                if not page_data["comments"] and json_data:
+                    comments_data = [
+                        {"author": c["author"], "text": c["text"]} for c in json_data["comments"][:3]
+                    ]
+                result["comments_text"] = comments_data
+                result["comment_screenshots"] = comment_screenshots
+            finally:
+                await page.close()
             
-        # 3. Download Video (if applicable)
+        # 4. Wait for the video download and process thumbnail insertion
+        if video_task:
+            video_path = await video_task
+            if video_path:
+                result["video_path"] = video_path
+                
+                if result["post_screenshot"] and os.path.exists(result["post_screenshot"]):
+                    try:
+                        self._insert_video_thumbnail(video_path, result["post_screenshot"])
+                    except Exception as e:
+                        print(f"Failed to insert video thumbnail: {e}")
+
+        return result
+
+    def _download_video_sync(self, url: str) -> Optional[str]:
+        """
+        Download the post video with yt-dlp (blocking, run via asyncio.to_thread).
+        Returns the downloaded file path, or None if there is no video.
+        """
         # We use yt-dlp which handles Reddit videos very well
         try:
-            import uuid
-            unique_id = str(uuid.uuid4())[:8]
+            unique_id = _new_id()
             
             ydl_opts = {
                 'outtmpl': os.path.join(self.assets_dir, f'video_{unique_id}.%(ext)s'),
@@ -172,25 +254,100 @@ class ScraperAgent(BaseAgent):
                 
                 if info.get('vcodec') != 'none':
                     ydl.download([url])
-                    # Find the file (since extension might vary)
-                    # We forced mp4 preference but yt-dlp might still use mkv if mp4 unavailable
-                    # Let's look for the file with our unique_id
-                    import glob
-                    potential_files = glob.glob(os.path.join(self.assets_dir, f'video_{unique_id}.*'))
-                    if potential_files:
-                        video_path = potential_files[0]
-                        result["video_path"] = video_path
-                        
-                        # 4. Process Thumbnail Insertion
-                        if result["post_screenshot"] and os.path.exists(result["post_screenshot"]):
-                            try:
-                                self._insert_video_thumbnail(video_path, result["post_screenshot"])
-                            except Exception as e:
-                                print(f"Failed to insert video thumbnail: {e}")
+                    # Ask yt-dlp for the real output path (extension might vary:
+                    # we prefer mp4 but yt-dlp might still use mkv if mp4 unavailable)
+                    video_path = ydl.prepare_filename(info)
+                    if os.path.exists(video_path):
+                        return video_path
         except Exception as e:
             print(f"Video download failed or no video found: {e}")
 
-        return result
+        return None
+
+    async def run_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several posts concurrently on the shared browser.
+        Concurrency is bounded by BrowserPool.concurrency.
+        """
+        return await asyncio.gather(*[self.execute(url) for url in urls])
+
+    async def _fetch_json(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch title, selftext, video info and top comments from Reddit's JSON API.
+        Returns None on any failure (403, rate limit, unexpected shape) so the
+        caller falls back to DOM scraping.
+        """
+        json_url = url.split('?')[0].rstrip('/') + '.json'
+        
+        def fetch():
+            response = requests.get(
+                json_url,
+                params={"limit": 20, "raw_json": 1},
+                headers={"User-Agent": USER_AGENT},
+                timeout=15
+            )
+            response.raise_for_status()
+            return response.json()
+        
+        try:
+            data = await asyncio.to_thread(fetch)
+            post = data[0]["data"]["children"][0]["data"]
+            
+            comments = []  # Every live top-level comment, in API order
+            for child in data[1]["data"]["children"]:
+                if child.get("kind") != "t1":
+                    continue  # "more" placeholders
+                comment = child["data"]
+                author = comment.get("author")
+                if author in SKIPPED_AUTHORS or not comment.get("body"):
+                    continue
+                comments.append({
+                    "id": comment.get("name"),  # t1_ fullname, the DOM's thingid
+                    "author": author,
+                    "text": " ".join(comment["body"].split())
+                })
+            
+            # Crossposts carry their media on the original post
+            media_posts = [post] + (post.get("crosspost_parent_list") or [])[:1]
+            
+            return {
+                "title": post.get("title", ""),
+                "content": post.get("selftext", ""),
+                "has_video": any(p.get("is_video") or p.get("secure_media") for p in media_posts),
+                "video_url": post.get("url_overridden_by_dest") or post.get("url"),
+                "comments": comments
+            }
+        except Exception as e:
+            print(f"   ⚠️ JSON API fetch failed ({e}), falling back to page scraping")
+            return None
+
+    @staticmethod
+    def _comment_text(comment_info: Dict[str, Any], json_data: Optional[Dict[str, Any]]) -> str:
+        """
+        Text for a comment picked (and screenshotted) from the page: the clean API
+        body of the same comment (matched by id, then author), else the element's text.
+        """
+        if json_data:
+            for comment in json_data["comments"]:
+                if comment["id"] and comment["id"] == comment_info.get("id"):
+                    return comment["text"]
+            for comment in json_data["comments"]:
+                if comment["author"] == comment_info["author"]:
+                    return comment["text"]
+        
+        # Clean up text (remove UI elements like "Reply", "Share")
+        lines = [line.strip() for line in comment_info["text"].split('\n') if line.strip()]
+        # Heuristic: Take the longest line or combine lines that look like content
+        return " ".join(lines[:5]) # Take first few lines
+
+    async def _route_request(self, route):
+        """Abort media streams and analytics/ad requests, let everything else through."""
+        request = route.request
+        
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(p in request.url for p in BLOCKED_URL_PATTERNS):
+            await route.abort()
+        else:
+            await route.continue_()
 
     def _insert_video_thumbnail(self, video_path: str, screenshot_path: str):
         """
@@ -203,66 +360,40 @@ class ScraperAgent(BaseAgent):
         3. Save as PNG with alpha channel (frame with hole)
         4. Video thumbnail will be placed in layer below during editing
         """
-        from PIL import Image, ImageDraw
-        import numpy as np
-        
         print("   Creating transparent frame from screenshot...")
         try:
-            # Load screenshot
-            screenshot = Image.open(screenshot_path).convert("RGBA")
+            # Load screenshot (Playwright PNGs are usually RGBA already)
+            screenshot = Image.open(screenshot_path)
+            if screenshot.mode != "RGBA":
+                screenshot = screenshot.convert("RGBA")
+            screenshot.load()
             width, height = screenshot.size
             
-            # Convert to numpy for easier processing
-            img_array = np.array(screenshot)
-            
-            # Strategy: Find large dark rectangular area (video player)
-            # Reddit video players are typically:
-            # - Black or very dark gray
-            # - Rectangular
-            # - In the middle-lower portion of the post
-            
-            # Create mask for dark pixels
-            # Dark pixels: RGB values all < 50
-            r, g, b, a = img_array[:,:,0], img_array[:,:,1], img_array[:,:,2], img_array[:,:,3]
-            dark_mask = (r < 50) & (g < 50) & (b < 50)
-            
-            # Find the largest contiguous dark region
-            # Simplified approach: Find bounding box of dark region in middle area
+            # Read-only numpy view for detection; the hole is cut on the PIL image itself
+            img_array = np.asarray(screenshot)
             
-            # Focus on middle 60% of image (where video player usually is)
-            middle_start_y = int(height * 0.2)
-            middle_end_y = int(height * 0.8)
-            
-            # Find dark pixels in middle region
-            middle_dark = dark_mask[middle_start_y:middle_end_y, :]
-            
-            # Find columns and rows with significant dark pixels
-            dark_cols = np.where(middle_dark.sum(axis=0) > (middle_end_y - middle_start_y) * 0.3)[0]
-            dark_rows = np.where(middle_dark.sum(axis=1) > width * 0.3)[0]
+            # Reuse the cached player position for this screenshot size if it still looks dark
+            size_key = f"{width}x{height}"
+            bbox = self._player_bbox_cache.get(size_key)
+            if bbox and self._is_dark_region(img_array, bbox):
+                print(f"   ✅ Reusing cached video player area for {size_key}")
+            else:
+                bbox = self._detect_player_bbox(img_array)
+                if bbox:
+                    self._player_bbox_cache[size_key] = bbox
+                    self._save_player_bbox_cache()
             
-            if len(dark_cols) > 0 and len(dark_rows) > 0:
-                # Found video player area!
-                player_left = dark_cols[0]
-                player_right = dark_cols[-1]
-                player_top = dark_rows[0] + middle_start_y
-                player_bottom = dark_rows[-1] + middle_start_y
-                
-                # Add some padding to ensure we get the whole player
-                padding = 10
-                player_left = max(0, player_left - padding)
-                player_right = min(width, player_right + padding)
-                player_top = max(0, player_top - padding)
-                player_bottom = min(height, player_bottom + padding)
+            if bbox:
+                player_left, player_top, player_right, player_bottom = bbox
                 
                 # Make this area TRANSPARENT
-                img_array[player_top:player_bottom, player_left:player_right, 3] = 0  # Set alpha to 0
+                self._clear_alpha(screenshot, (player_left, player_top, player_right, player_bottom))
                 
                 print(f"   ✅ Video player area detected: ({player_left},{player_top}) to ({player_right},{player_bottom})")
                 print(f"   ✅ Made area transparent - screenshot is now a FRAME!")
                 
-                # Save the frame
-                frame_image = Image.fromarray(img_array, 'RGBA')
-                frame_image.save(screenshot_path)
+                # Save the frame (intermediate asset, fast zlib level)
+                screenshot.save(screenshot_path, optimize=False, compress_level=1)
                 
                 # Also save the player dimensions for EditorAgent to use
                 frame_info_path = screenshot_path.replace('.png', '_frame_info.txt')
@@ -283,13 +414,76 @@ class ScraperAgent(BaseAgent):
                 right = left + rect_width
                 bottom = top + rect_height
                 
-                img_array[top:bottom, left:right, 3] = 0
-                
-                frame_image = Image.fromarray(img_array, 'RGBA')
-                frame_image.save(screenshot_path)
+                self._clear_alpha(screenshot, (left, top, right, bottom))
+                screenshot.save(screenshot_path, optimize=False, compress_level=1)
                 print(f"   ⚠️ Used fallback: Created generic transparent area in center")
             
         except Exception as e:
             print(f"   ⚠️ Error creating frame: {e}")
             import traceback
             traceback.print_exc()
+
+    def _clear_alpha(self, image, box):
+        """Set alpha to 0 inside box (left, top, right, bottom), keeping RGB untouched."""
+        alpha = image.getchannel("A")
+        alpha.paste(0, box)
+        image.putalpha(alpha)
+
+    def _detect_player_bbox(self, img_array) -> Optional[List[int]]:
+        """
+        Find the video player placeholder (large dark rectangle) in a screenshot.
+        Returns [left, top, right, bottom] including padding, or None.
+        """
+        height, width = img_array.shape[:2]
+        
+        # Strategy: Find large dark rectangular area (video player)
+        # Reddit video players are typically:
+        # - Black or very dark gray (RGB values all < 50)
+        # - Rectangular
+        # - In the middle-lower portion of the post
+        
+        # Focus on middle 60% of image (where video player usually is)
+        middle_start_y = int(height * 0.2)
+        middle_end_y = int(height * 0.8)
+        
+        # Find columns and rows with significant dark pixels (numba kernel when available)
+        found = detect_dark_bbox(
+            img_array, middle_start_y, middle_end_y,
+            (middle_end_y - middle_start_y) * 0.3, width * 0.3
+        )
+        if not found:
+            return None
+        
+        # Found video player area!
+        player_left, player_right, player_top, player_bottom = found
+        
+        # Add some padding to ensure we get the whole player
+        padding = 10
+        player_left = max(0, player_left - padding)
+        player_right = min(width, player_right + padding)
+        player_top = max(0, player_top - padding)
+        player_bottom = min(height, player_bottom + padding)
+        
+        return [player_left, player_top, player_right, player_bottom]
+
+    def _is_dark_region(self, img_array, bbox: List[int], min_density: float = 0.5) -> bool:
+        """Check that a cached bbox is still mostly dark pixels (only scans the bbox)."""
+        left, top, right, bottom = bbox
+        region = img_array[top:bottom, left:right, :3]
+        if region.size == 0:
+            return False
+        return (region < 50).all(axis=2).mean() >= min_density
+
+    def _load_player_bbox_cache(self) -> Dict[str, List[int]]:
+        try:
+            with open(self._player_bbox_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_player_bbox_cache(self):
+        try:
+            with open(self._player_bbox_cache_path, 'w') as f:
+                json.dump(self._player_bbox_cache, f)
+        except OSError as e:
+            print(f"   ⚠️ Could not save player bbox cache: {e}")
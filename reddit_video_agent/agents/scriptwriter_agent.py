@@ -1,47 +1,19 @@
+import re
+import asyncio
 import google.generativeai as genai
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List
 from .base_agent import BaseAgent
 from ..core.config import Config
 
-class ScriptwriterAgent(BaseAgent):
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        # Configure with a key initially, but we might need to re-configure per request if the library requires it.
-        # The genai library sets a global api_key. To support rotation, we might need to pass `api_key` to `GenerativeModel` or re-configure.
-        # `genai.configure` is global. 
-        # Better approach: Configure with one key, but if we want true rotation per request, we'd re-configure.
-        # For simplicity, let's pick one at init.
-        self.api_key = Config.get_gemini_key()
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(Config.SCRIPT_MODEL)
-
-    async def execute(self, post_data: Dict[str, Any]) -> str:
-        """
-        Generates a script from the Reddit post data.
-        """
-        print("ScriptwriterAgent: Generating script...")
-        
-        title = post_data.get("title", "Tanpa Judul")
-        content = post_data.get("content", "")
-        has_video = bool(post_data.get("video_path"))
-        comments = post_data.get("comments_text", [])
-        
-        # Format comments for prompt
-        comments_str = ""
-        if comments:
-            comments_str = "\nKOMENTAR NETIZEN TERATAS:\n"
-            for c in comments:
-                comments_str += f"- {c['author']}: {c['text'][:200]}...\n"
-        
-        # Validasi basic
-        if not title and not content:
-            print("⚠️ Warning: No title or content found for scripting.")
-            return "Waduh, postingannya kosong nih! Tapi kayaknya seru banget deh. Coba cek langsung aja ya!"
+# Script cleanup / marker patterns (compiled once). The classes exclude \n, like
+# the lazy `.*?` subs they replace: a block never spans lines.
+_CLEAN_RE = re.compile(r'(\[VIDEO_BREAK:[^\]\n]*\])|\[[^\]\n]*\]|\([^)\n]*\)|\*[^*\n]*\*|\*|```|Narrator:|Voiceover:')
+_SHOW_RE = re.compile(r'\*<SHOW:([^>]+)>\*')
+_VISUAL_RE = re.compile(r'\*<VISUAL:([^|>]+)\|([^|>]+)\|([^>]+)>\*')
 
-        # Contextual Prompt Construction
-        context_str = "Postingan ini berisi VIDEO." if has_video else "Postingan ini berupa TEKS/GAMBAR."
-        
-        prompt = f"""
+# Script prompt; only {title}, {content} and {comments_str} change per post
+_PROMPT_TEMPLATE = """
         Kamu adalah expert scriptwriter untuk video viral TikTok/YouTube Shorts.
         
         Tugas: Buat naskah narasi yang engaging DENGAN VIDEO BREAK yang NATURAL.
@@ -142,39 +114,76 @@ class ScriptwriterAgent(BaseAgent):
         
         Generate script dengan struktur 4 bagian + visual markers (factual/ambiguous). Output HANYA script (no explanation).
         """
+
+@lru_cache(maxsize=None)
+def _get_model(model_name: str) -> genai.GenerativeModel:
+    """One GenerativeModel per model name, shared by every ScriptwriterAgent."""
+    return genai.GenerativeModel(model_name)
+
+def _clean_script(script: str) -> str:
+    """
+    Cleanup extra formatting if Gemini adds it despite instructions, in one pass:
+    keep [VIDEO_BREAK] markers (group 1), drop other brackets/parentheses,
+    *asterisk blocks* (often used for *actions* or *emphasis*), standalone asterisks,
+    markdown code fences and "Narrator:"/"Voiceover:" labels. Whitespace is collapsed.
+    """
+    script = _CLEAN_RE.sub(lambda m: m.group(1) or '', script)
+    return ' '.join(script.split())
+
+class ScriptwriterAgent(BaseAgent):
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Pick one key at init; the model itself is looked up lazily (and cached) in execute.
+        # `genai.configure` is process-global, so the model uses whichever key was configured last.
+        self.api_key = Config.get_gemini_key()
+        self.model_name = Config.SCRIPT_MODEL
+        # Max Gemini calls in flight for execute_many
+        self.max_concurrency = config.get("max_concurrency", 8)
+
+    @property
+    def model(self) -> genai.GenerativeModel:
+        if _get_model.cache_info().currsize == 0:
+            genai.configure(api_key=self.api_key)  # First model in the process
+        return _get_model(self.model_name)
+
+    async def execute(self, post_data: Dict[str, Any]) -> str:
+        """
+        Generates a script from the Reddit post data.
+        """
+        print("ScriptwriterAgent: Generating script...")
+        
+        title = post_data.get("title", "Tanpa Judul")
+        content = post_data.get("content", "")
+        has_video = bool(post_data.get("video_path"))
+        comments = post_data.get("comments_text", [])
+        
+        # Format comments for prompt
+        comments_str = ""
+        if comments:
+            parts = ["\nKOMENTAR NETIZEN TERATAS:\n"]
+            parts.extend(f"- {c['author']}: {c['text'][:200]}...\n" for c in comments)
+            comments_str = "".join(parts)
+        
+        # Validasi basic
+        if not title and not content:
+            print("⚠️ Warning: No title or content found for scripting.")
+            return "Waduh, postingannya kosong nih! Tapi kayaknya seru banget deh. Coba cek langsung aja ya!"
+
+        # Contextual Prompt Construction
+        context_str = "Postingan ini berisi VIDEO." if has_video else "Postingan ini berupa TEKS/GAMBAR."
+        
+        prompt = _PROMPT_TEMPLATE.format_map({
+            'title': title,
+            'content': content,
+            'comments_str': comments_str
+        })
         
         try:
-            response = self.model.generate_content(prompt)
+            # The SDK call is blocking; run it in a thread so posts can overlap
+            response = await asyncio.to_thread(self.model.generate_content, prompt)
             script = response.text.strip()
             
-            # Cleanup extra formatting if Gemini adds it despite instructions
-            script = script.replace("Narrator:", "").replace("Voiceover:", "").strip()
-            
-            # PRESERVE [VIDEO_BREAK] markers but remove other brackets
-            import re
-            
-            # Temporarily replace VIDEO_BREAK markers with placeholder
-            video_breaks = re.findall(r'\[VIDEO_BREAK:.*?\]', script)
-            for i, vb in enumerate(video_breaks):
-                script = script.replace(vb, f"<<<VIDEO_BREAK_{i}>>>")
-            
-            # Now remove other brackets/parentheses
-            script = re.sub(r'\[.*?\]', '', script)
-            script = re.sub(r'\(.*?\)', '', script)
-            
-            # Remove asterisks (often used for *actions* or *emphasis*)
-            script = re.sub(r'\*.*?\*', '', script)  # Remove content inside asterisks
-            script = script.replace('*', '')  # Remove standalone asterisks
-            
-            # Restore VIDEO_BREAK markers
-            for i, vb in enumerate(video_breaks):
-                script = script.replace(f"<<<VIDEO_BREAK_{i}>>>", vb)
-            
-            # Remove markdown code blocks if present
-            script = script.replace('```', '')
-            
-            # Clean up whitespace
-            script = ' '.join(script.split())
+            script = _clean_script(script)
             
             # Extract visual markers
             visual_markers = self._extract_visual_markers(script)
@@ -191,14 +200,25 @@ class ScriptwriterAgent(BaseAgent):
                 "visual_markers": []
             }
     
+    async def execute_many(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generates scripts for several posts concurrently (bounded by max_concurrency).
+        Results are returned in the same order as `posts`.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(post_data):
+            async with semaphore:
+                return await self.execute(post_data)
+
+        return await asyncio.gather(*[run(post) for post in posts])
+
     def _extract_visual_markers(self, script: str) -> list:
         """Extract visual markers (SHOW + VISUAL) with certainty classification from script."""
-        import re
         markers = []
         
         # Pattern 1: SHOW markers (screenshots) - *<SHOW:screenshot_id>*
-        show_pattern = r'\*<SHOW:([^>]+)>\*'
-        show_matches = re.findall(show_pattern, script)
+        show_matches = _SHOW_RE.findall(script)
         
         for screenshot_id in show_matches:
             markers.append({
@@ -209,8 +229,7 @@ class ScriptwriterAgent(BaseAgent):
             })
         
         # Pattern 2: VISUAL markers - *<VISUAL:certainty|id|description>*
-        visual_pattern = r'\*<VISUAL:([^|>]+)\|([^|>]+)\|([^>]+)>\*'
-        visual_matches = re.findall(visual_pattern, script)
+        visual_matches = _VISUAL_RE.findall(script)
         
         for certainty, marker_id, description in visual_matches:
             certainty = certainty.strip().lower()
@@ -4,15 +4,60 @@ Handles beat detection, asset placement, transitions, and layer management
 """
 
 import os
-from typing import Dict, List, Any, Tuple
+import asyncio
+import bisect
+from typing import Dict, List, Any, Tuple, NamedTuple
 from .base_agent import BaseAgent
-from moviepy.editor import AudioFileClip
-import srt
 import re
+import numpy as np
+
+# Sentence-ending punctuation used for beat detection
+_SENT_END_RE = re.compile(r'[.!?]')
+
+# SRT timing line, e.g. "00:00:01,250 --> 00:00:03,900"
+_SRT_TIME_RE = re.compile(r'(\d+):(\d\d):(\d\d)[,.](\d{1,3})\s*-->\s*(\d+):(\d\d):(\d\d)[,.](\d{1,3})')
+
+
+class Cap(NamedTuple):
+    """One caption with times in seconds, plus text features computed once at parse time."""
+    start: float
+    end: float
+    content: str
+    has_sentence_end: bool
+    wordset: frozenset
+
+
+def _fast_parse_srt(text: str) -> List[Cap]:
+    """
+    Lightweight SubRip reader: emits float seconds directly instead of
+    srt.Subtitle/timedelta objects. Blocks without a timing line are skipped.
+    """
+    captions = []
+    for block in re.split(r'\n\s*\n', text.replace('\r\n', '\n').strip()):
+        lines = block.split('\n')
+        for i, line in enumerate(lines[:2]):
+            m = _SRT_TIME_RE.search(line)
+            if m:
+                h1, m1, s1, ms1, h2, m2, s2, ms2 = m.groups()
+                start = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1.ljust(3, '0')) / 1000.0
+                end = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2.ljust(3, '0')) / 1000.0
+                content = '\n'.join(lines[i + 1:]).strip()
+                captions.append(Cap(
+                    start, end, content,
+                    _SENT_END_RE.search(content) is not None,
+                    frozenset(content.lower().split())
+                ))
+                break
+    return captions
+
 
 class TimelineArchitectAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
+        # Parsed SRT per (path, mtime) so one execute parses the captions file once
+        self._captions_cache: Dict[Tuple[str, float], List[Cap]] = {}
+        # Lookup index over the current captions (see _index_captions)
+        self._caption_starts: List[float] = []
         
     async def execute(self, assets: Dict) -> Dict:
         """
@@ -36,15 +81,23 @@ class TimelineArchitectAgent(BaseAgent):
         catalog = assets.get("asset_catalog", {}).get("catalog", {})
         strategy = assets.get("strategy", {})
         
+        # Parse captions once and share them with every step below
+        narration = catalog.get("narration", {})
+        captions = []
+        if narration.get("available"):
+            captions = await self._load_captions(narration.get("captions_path"))
+        self._index_captions(captions)
+        
         # Detect beats in narration
-        beats = await self._detect_beats(catalog.get("narration", {}), strategy)
+        beats = await self._detect_beats(narration, strategy, captions)
         
         # Build timeline structure
         timeline = self._build_timeline_structure(
             parsed_script,
             catalog,
             strategy,
-            beats
+            beats,
+            captions
         )
         
         # Place assets optimally
@@ -67,66 +120,103 @@ class TimelineArchitectAgent(BaseAgent):
         
         return timeline
     
-    async def _detect_beats(self, narration: Dict, strategy: Dict) -> List[Dict]:
+    @staticmethod
+    def _read_and_parse(captions_path: str) -> List[Cap]:
+        with open(captions_path, 'r', encoding='utf-8') as f:
+            return _fast_parse_srt(f.read())
+    
+    async def _load_captions(self, captions_path: str) -> List[Cap]:
+        """Parse the SRT file off the event loop, memoized by path + mtime."""
+        if not captions_path:
+            return []
+        
+        # One stat gives both existence and the cache key
+        try:
+            key = (captions_path, os.stat(captions_path).st_mtime)
+        except OSError:
+            return []
+        if key not in self._captions_cache:
+            try:
+                self._captions_cache[key] = await asyncio.to_thread(self._read_and_parse, captions_path)
+            except Exception as e:
+                print(f"   ⚠️ Error parsing captions: {e}")
+                return []
+        
+        return self._captions_cache[key]
+    
+    def _index_captions(self, captions: List[Cap]):
+        """Precompute the start times bisected by _estimate_duration_from_text."""
+        self._caption_starts = [c.start for c in captions]
+    
+    async def _detect_beats(self, narration: Dict, strategy: Dict, captions: List[Cap]) -> List[Dict]:
         """
         Detect natural beats/pauses in narration for asset placement.
         """
-        if not narration.get("available"):
+        if not narration.get("available") or not captions:
             return []
         
-        captions_path = narration.get("captions_path")
-        if not captions_path or not os.path.exists(captions_path):
-            return []
+        # Caption times as arrays
+        count = len(captions)
+        starts = np.fromiter((c.start for c in captions), dtype=np.float64, count=count)
+        ends = np.fromiter((c.end for c in captions), dtype=np.float64, count=count)
         
-        # Load SRT
-        with open(captions_path, 'r', encoding='utf-8') as f:
-            captions = list(srt.parse(f.read()))
+        # Gap between each caption and the next one (last caption has no gap)
+        gaps = np.zeros(count, dtype=np.float64)
+        gaps[:-1] = starts[1:] - ends[:-1]
+        
+        sentence_mask = np.fromiter(
+            (c.has_sentence_end for c in captions), dtype=bool, count=count
+        )
+        pause_mask = gaps > 0.3  # 300ms pause
         
         beats = []
+        add_beat = beats.append
         
         # Detect beats based on punctuation and pauses
-        for i, caption in enumerate(captions):
-            text = caption.content
-            start_time = caption.start.total_seconds()
-            end_time = caption.end.total_seconds()
+        for i in np.flatnonzero(sentence_mask | pause_mask):
+            end_time = float(ends[i])
             
             # Beat at sentence endings
-            if any(p in text for p in ['.', '!', '?']):
-                beats.append({
+            if sentence_mask[i]:
+                add_beat({
                     "time": end_time,
                     "type": "sentence_end",
-                    "text": text,
+                    "text": captions[i].content,
                     "strength": 0.8
                 })
             
             # Beat at long pauses (gap between captions)
-            if i < len(captions) - 1:
-                next_start = captions[i + 1].start.total_seconds()
-                gap = next_start - end_time
-                
-                if gap > 0.3:  # 300ms pause
-                    beats.append({
-                        "time": end_time,
-                        "type": "pause",
-                        "gap": gap,
-                        "strength": min(1.0, gap / 0.5)
-                    })
+            if pause_mask[i]:
+                gap = float(gaps[i])
+                add_beat({
+                    "time": end_time,
+                    "type": "pause",
+                    "gap": gap,
+                    "strength": min(1.0, gap / 0.5)
+                })
         
         # Remove duplicate beats (keep strongest)
-        unique_beats = {}
+        # Captions are time-ordered, so duplicates are always adjacent
+        unique_beats = []
+        last_key = None
         for beat in beats:
-            time_key = round(beat["time"], 1)
-            if time_key not in unique_beats or beat["strength"] > unique_beats[time_key]["strength"]:
-                unique_beats[time_key] = beat
-        
-        return sorted(unique_beats.values(), key=lambda x: x["time"])
+            time_key = int(beat["time"] * 10 + 0.5)  # 100ms bucket as an int key
+            if time_key == last_key:
+                if beat["strength"] > unique_beats[-1]["strength"]:
+                    unique_beats[-1] = beat
+                continue
+            unique_beats.append(beat)
+            last_key = time_key
+        
+        return unique_beats
     
     def _build_timeline_structure(
         self,
         parsed_script: Dict,
         catalog: Dict,
         strategy: Dict,
-        beats: List[Dict]
+        beats: List[Dict],
+        captions: List[Cap]
     ) -> Dict:
         """Build basic timeline structure from script segments."""
         
@@ -158,23 +248,26 @@ class TimelineArchitectAgent(BaseAgent):
         
         narration_path = narration["path"]
         narration_duration = narration["duration"]
-        captions_path = narration.get("captions_path")
         
         # Get strategy pacing
         tempo = strategy.get("pacing", {}).get("tempo", 1.0)
+        audio_cfg = strategy.get("audio", {})
+        overlap_pct = audio_cfg.get("overlap_percentage", 0.5)
+        ducking_curve = audio_cfg.get("ducking_curve", "smooth")
         
         current_time = 0.0
         audio_position = 0.0
         
-        segments = parsed_script.get("segments", [])
+        # Pull the fields the loop needs out of the segment dicts once
+        segments = [
+            (s["type"], s.get("text", ""), s.get("break_type", "action"), s.get("duration", 10.0))
+            for s in parsed_script.get("segments", [])
+        ]
         
-        for i, segment in enumerate(segments):
-            seg_type = segment["type"]
-            
-            if seg_type in ["narration", "attention_cue"]:
+        for i, (seg_type, text, clip_type, clip_duration) in enumerate(segments):
+            if seg_type in ("narration", "attention_cue"):
                 # Calculate segment duration from SRT
-                text = segment["text"]
-                duration = self._estimate_duration_from_text(text, captions_path, audio_position)
+                duration = self._estimate_duration_from_text(text, captions, audio_position)
                 
                 # Apply tempo
                 actual_duration = duration / tempo
@@ -207,9 +300,6 @@ class TimelineArchitectAgent(BaseAgent):
                 audio_position += duration
                 
             elif seg_type == "video_break":
-                clip_type = segment.get("break_type", "action")
-                clip_duration = segment.get("duration", 10.0)
-                
                 # Get video clip
                 video_clips = catalog.get("video_clips", {})
                 clip_info = None
@@ -228,7 +318,6 @@ class TimelineArchitectAgent(BaseAgent):
                     actual_clip_duration = min(clip_duration, clip_info.get("duration", clip_duration))
                     
                     # Calculate overlap
-                    overlap_pct = strategy.get("audio", {}).get("overlap_percentage", 0.5)
                     overlap_duration = actual_clip_duration * overlap_pct
                     
                     # Add clip video
@@ -256,7 +345,7 @@ class TimelineArchitectAgent(BaseAgent):
                             "start": current_time + (actual_clip_duration - overlap_duration),
                             "end": current_time + actual_clip_duration,
                             "target_volume": duck_volume,
-                            "curve": strategy.get("audio", {}).get("ducking_curve", "smooth")
+                            "curve": ducking_curve
                         },
                         "segment_index": i
                     })
@@ -264,47 +353,47 @@ class TimelineArchitectAgent(BaseAgent):
                     # Move timeline forward (minus overlap)
                     current_time += (actual_clip_duration - overlap_duration)
         
-        # Build audio-to-timeline mapping for caption synchronization
-        audio_timeline_map = []
-        for narr_track in timeline["tracks"]["audio"]["narration"]:
-            audio_timeline_map.append({
-                "audio_start": narr_track["source_start"],
-                "audio_end": narr_track["source_end"],
-                "timeline_start": narr_track["timeline_start"],
-                "timeline_end": narr_track["timeline_end"],
-                "tempo": narr_track.get("speed", 1.0)
-            })
+        # Array (SoA) view of the tracks for the vectorized passes below
+        timeline["tracks_soa"] = self._build_tracks_soa(timeline)
+        
+        # Audio-to-timeline mapping for caption synchronization
+        # (narration segments are emitted in audio order, so audio_starts is sorted)
+        narration_soa = timeline["tracks_soa"]["narration"]
+        audio_starts = narration_soa["source_start"]
+        audio_ends = narration_soa["source_end"]
+        timeline_starts = narration_soa["timeline_start"]
+        tempos = narration_soa["speed"]
         
         # Add captions with accurate timing adjustment
-        if captions_path and os.path.exists(captions_path):
+        if captions and len(audio_starts):
             try:
-                with open(captions_path, 'r', encoding='utf-8') as f:
-                    captions = list(srt.parse(f.read()))
+                cap_starts = np.fromiter((c.start for c in captions), dtype=np.float64, count=len(captions))
                 
-                for caption in captions:
-                    audio_start = caption.start.total_seconds()
-                    audio_end = caption.end.total_seconds()
-                    
-                    # Find matching narration segment
-                    for segment in audio_timeline_map:
-                        if segment["audio_start"] <= audio_start < segment["audio_end"]:
-                            # Map audio time to timeline time with tempo adjustment
-                            offset_in_audio = audio_start - segment["audio_start"]
-                            offset_in_timeline = offset_in_audio / segment["tempo"]
-                            timeline_start = segment["timeline_start"] + offset_in_timeline
-                            
-                            # Same for end time
-                            offset_in_audio_end = min(audio_end, segment["audio_end"]) - segment["audio_start"]
-                            offset_in_timeline_end = offset_in_audio_end / segment["tempo"]
-                            timeline_end = segment["timeline_start"] + offset_in_timeline_end
-                            
-                            timeline["tracks"]["text"]["captions"].append({
-                                "text": caption.content,
-                                "timeline_start": timeline_start,
-                                "timeline_end": timeline_end,
-                                "z_index": 100
-                            })
-                            break
+                # Captions are time-ordered: drop everything starting after the last narration segment
+                in_range = int(np.searchsorted(cap_starts, audio_ends[-1], side='left'))
+                cap_starts = cap_starts[:in_range]
+                cap_ends = np.fromiter((c.end for c in captions[:in_range]), dtype=np.float64, count=in_range)
+                
+                # Find matching narration segment for every caption at once
+                # (vectorized bisect_right: last segment with audio_start <= caption start)
+                idx = np.searchsorted(audio_starts, cap_starts, side='right') - 1
+                matched = idx >= 0
+                idx = np.clip(idx, 0, None)
+                matched &= cap_starts < audio_ends[idx]
+                
+                # Map audio time to timeline time with tempo adjustment (end clipped to the segment)
+                seg_starts = audio_starts[idx]
+                caption_timeline_starts = timeline_starts[idx] + (cap_starts - seg_starts) / tempos[idx]
+                caption_timeline_ends = timeline_starts[idx] + (np.minimum(cap_ends, audio_ends[idx]) - seg_starts) / tempos[idx]
+                
+                add_caption = timeline["tracks"]["text"]["captions"].append
+                for i in np.flatnonzero(matched):
+                    add_caption({
+                        "text": captions[i].content,
+                        "timeline_start": float(caption_timeline_starts[i]),
+                        "timeline_end": float(caption_timeline_ends[i]),
+                        "z_index": 100
+                    })
                 
                 print(f"   ✅ Added {len(timeline['tracks']['text']['captions'])} captions with tempo adjustment")
             except Exception as e:
@@ -313,6 +402,28 @@ class TimelineArchitectAgent(BaseAgent):
         timeline["total_duration"] = current_time
         return timeline
     
+    def _build_tracks_soa(self, timeline: Dict) -> Dict:
+        """
+        Parallel numpy arrays per field for narration and video clip tracks.
+        Same data as timeline["tracks"], which stays the source of truth for consumers.
+        """
+        narration = timeline["tracks"]["audio"]["narration"]
+        clips = timeline["tracks"]["video"]["clips"]
+        
+        def column(items, key, default=0.0):
+            return np.fromiter((item.get(key, default) for item in items), dtype=np.float64, count=len(items))
+        
+        return {
+            "narration": {
+                key: column(narration, key, 1.0 if key == "speed" else 0.0)
+                for key in ("source_start", "source_end", "timeline_start", "timeline_end", "speed")
+            },
+            "clips": {
+                key: column(clips, key)
+                for key in ("timeline_start", "timeline_end")
+            }
+        }
+    
     def _place_assets(
         self,
         timeline: Dict,
@@ -338,8 +449,9 @@ class TimelineArchitectAgent(BaseAgent):
         # Place images at beats
         images = catalog.get("images", [])
         if images and beats:
-            image_duration = strategy.get("visual", {}).get("image_duration", 2.0)
-            placement_style = strategy.get("visual", {}).get("image_placement", "beat_synchronized")
+            visual_cfg = strategy.get("visual", {})
+            image_duration = visual_cfg.get("image_duration", 2.0)
+            placement_style = visual_cfg.get("image_placement", "beat_synchronized")
             
             # Select beats for image placement (not too close together)
             selected_beats = self._select_image_beats(beats, len(images), image_duration)
@@ -387,14 +499,14 @@ class TimelineArchitectAgent(BaseAgent):
         narration_segments = timeline["tracks"]["audio"]["narration"]
         video_clips = timeline["tracks"]["video"]["clips"]
         
-        for clip in video_clips:
-            clip_start = clip["timeline_start"]
-            
-            # Find narration segment before this clip
-            prev_narration = None
-            for narr in narration_segments:
-                if narr["timeline_end"] <= clip_start:
-                    prev_narration = narr
+        # Narration segments are emitted in timeline order, so their ends are sorted
+        soa = timeline.get("tracks_soa") or self._build_tracks_soa(timeline)
+        
+        # Find narration segment before each clip (last one ending at or before the clip start)
+        prev_indices = np.searchsorted(soa["narration"]["timeline_end"], soa["clips"]["timeline_start"], side='right') - 1
+        
+        for clip, idx in zip(video_clips, prev_indices):
+            prev_narration = narration_segments[idx] if idx >= 0 else None
             
             if prev_narration:
                 # Add transition
@@ -408,32 +520,25 @@ class TimelineArchitectAgent(BaseAgent):
         
         return timeline
     
-    def _estimate_duration_from_text(self, text: str, captions_path: str, start_position: float) -> float:
-        """Estimate duration from text using SRT."""
-        if not captions_path or not os.path.exists(captions_path):
+    def _estimate_duration_from_text(self, text: str, captions: List[Cap], start_position: float) -> float:
+        """Estimate duration from text using the parsed SRT."""
+        if not captions:
             # Fallback: estimate from word count
             words = len(text.split())
             return (words / 150) * 60  # 150 words per minute
         
-        # Load SRT and find matching captions
-        with open(captions_path, 'r', encoding='utf-8') as f:
-            captions = list(srt.parse(f.read()))
-        
-        # Find captions that match this text
-        text_words = set(text.lower().split())
-        matching_captions = []
+        # Find captions that match this text, starting at the first caption >= start_position
+        text_words = frozenset(text.lower().split())
+        target_len = len(text) * 0.8
+        covered_len = -1  # Length of the matched captions joined with spaces
         
-        for caption in captions:
-            if caption.start.total_seconds() >= start_position:
-                caption_words = set(caption.content.lower().split())
-                if text_words & caption_words:  # Has common words
-                    matching_captions.append(caption)
-                    
-                    # Check if we've covered most of the text
-                    covered_text = " ".join([c.content for c in matching_captions])
-                    if len(covered_text) >= len(text) * 0.8:
-                        last_caption = matching_captions[-1]
-                        return last_caption.end.total_seconds() - start_position
+        for idx in range(bisect.bisect_left(self._caption_starts, start_position), len(captions)):
+            if text_words & captions[idx].wordset:  # Has common words
+                covered_len += len(captions[idx].content) + 1
+                
+                # Check if we've covered most of the text
+                if covered_len >= target_len:
+                    return captions[idx].end - start_position
         
         # Fallback
         words = len(text.split())
@@ -459,8 +564,4 @@ class TimelineArchitectAgent(BaseAgent):
     
     def _count_timeline_assets(self, timeline: Dict) -> int:
         """Count total assets in timeline."""
-        count = 0
-        for track_type in timeline["tracks"].values():
-            for track in track_type.values():
-                count += len(track)
-        return count
+        return sum(len(track) for track_type in timeline["tracks"].values() for track in track_type.values())
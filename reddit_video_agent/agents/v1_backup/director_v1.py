@@ -2,9 +2,6 @@ import os
 import json
 import asyncio
 from typing import Dict, Any, List
-from moviepy.editor import VideoFileClip, AudioFileClip
-import srt
-import google.generativeai as genai
 from .base_agent import BaseAgent
 from ..core.config import Config
 from .scraper_agent import ScraperAgent
@@ -19,6 +16,10 @@ from .composer_agent import VideoComposerAgent
 class Director(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
+        # moviepy / google.generativeai / srt are imported where they are used,
+        # so importing this module stays cheap
+        import google.generativeai as genai
+        
         self.api_key = Config.get_gemini_key()
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(Config.DIRECTOR_MODEL)
@@ -116,6 +117,7 @@ class Director(BaseAgent):
             
             # Get audio duration
             if os.path.exists(voiceover_path):
+                from moviepy.editor import AudioFileClip
                 audio = AudioFileClip(voiceover_path)
                 audio_duration = audio.duration
                 audio.close()
@@ -202,6 +204,9 @@ class Director(BaseAgent):
         """
         Stage 1: Create detailed inventory of all available assets with metadata.
         """
+        import srt
+        from moviepy.editor import VideoFileClip, AudioFileClip
+        
         inventory = {
             "video_clips": [],
             "screenshots": [],
@@ -301,6 +306,8 @@ class Director(BaseAgent):
         """
         Stage 2: Analyze script to identify narrative beats and key moments.
         """
+        import srt
+        
         # Get caption text for context
         caption_text = ""
         if os.path.exists(captions_path):
@@ -1,27 +1,136 @@
 import os
+import re
+import json
+import time
+import asyncio
+import base64
+import shutil
+import struct
 import requests
-from typing import Dict, Any, List
-from rembg import remove
+from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import io
 import google.generativeai as genai
 from .base_agent import BaseAgent
 from ..core.config import Config
+from ..core.log import get_logger
+from ..core.llm_cache import cache_path, cache_get, cache_put
+
+# pyvips is optional: libvips shrink-on-load + vectorized resize for the thumbnail step,
+# PIL otherwise
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+logger = get_logger(__name__)
+
+_IMAGEN_URL = "https://aistudio.google.com/app/prompts/new_chat?model=gemini-2.5-flash-image"
+
+# AI Studio selectors. CSS (native querySelector) instead of absolute XPath chains,
+# which break on any layout change. Chat-turn index varies, so images match any turn.
+_PROMPT_SELECTOR = "ms-prompt-input-wrapper ms-autosize-textarea textarea"
+_RUN_BUTTON_SELECTOR = "ms-prompt-input-wrapper ms-run-button button"
+_RUN_BUTTON_NAME = re.compile(r"^\s*Run", re.I)
+_IMAGE_SELECTOR = "ms-chat-turn ms-image-chunk img"
+# Newest matching <img> has a src and is fully loaded
+_IMAGE_READY_JS = """
+(selector) => {
+    const images = document.querySelectorAll(selector);
+    const img = images[images.length - 1];
+    return !!(img && img.getAttribute("src") && img.complete);
+}
+"""
+
+# The answer is a short JSON list (<= 5 prompts). The token cap is a safety net
+# well above that; lower temperature keeps reruns consistent.
+_EXTRACT_CONFIG = {
+    "temperature": 0.4,
+    "max_output_tokens": 2048,
+    "response_mime_type": "application/json",
+    "response_schema": list[str],
+}
+
+# Cached prompt extractions older than this (seconds) are asked again
+PROMPT_CACHE_MAX_AGE = 24 * 3600
+
+# Longest side of processed images
+THUMBNAIL_SIZE = 800
+_RESAMPLE = Image.Resampling.BICUBIC
+
+def _data_url_payload(url: str) -> Optional[str]:
+    """
+    Base64 part of a `data:<mime>;base64,<data>` URL, or None.
+    partition stops at the first ';base64,', so the multi-MB payload is never scanned.
+    """
+    prefix, sep, payload = url.partition(";base64,")
+    if sep and prefix.startswith("data:"):
+        return payload
+    return None
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_size(path: str) -> Optional[Tuple[int, int]]:
+    """(width, height) from the PNG IHDR chunk (first 24 bytes), or None if not a PNG."""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or not header.startswith(_PNG_SIGNATURE) or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+# Fixed part of the _extract_prompts request; the per-video CONTEXT block is appended after it
+_PROMPT_INSTRUCTIONS = """
+        You are an expert Art Director for viral videos.
+        
+        TASK: Create 3-5 highly specific image prompts based on the video script and context below.
+        
+        STYLE GUIDE:
+        - Analyze the TONE of the content (e.g., Extreme Sports, Funny, Tech, Heartwarming).
+        - Choose a visual style that fits (e.g., Realistic Action, Cartoon, Minimalist, Watercolor).
+        - If the script mentions specific brands (e.g., "Red Bull"), INCLUDE them.
+        - If there's a punchline, visualize it.
+        
+        CRITICAL REQUIREMENT FOR COMPOSITING:
+        - All subjects must be CENTERED.
+        - All subjects must have a WHITE BACKGROUND.
+        - All subjects must have 50px PADDING on all sides (offset).
+        - Subjects must be ISOLATED (easy to remove background).
+        
+        OUTPUT FORMAT:
+        Return ONLY a JSON list of strings.
+        Example:
+        [
+            "Realistic action shot of a snowboarder doing a backflip, Red Bull helmet visible, centered, isolated on white background, 50px padding, 8k resolution",
+            "Close up of a shocked cartoon face, exaggerated expression, centered, isolated on white background, 50px padding"
+        ]
+        """
+
 
 class VisualAgent(BaseAgent):
+    # Extracted prompts per cache key (see llm_cache), shared by all instances
+    _prompt_cache: Dict[str, List[str]] = {}
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_key = Config.get_gemini_key()
         self.assets_dir = Config.ASSETS_DIR
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(Config.SCRIPT_MODEL)  # For keyword extraction
+        # Image generations in flight at once (one AI Studio tab each)
+        self.max_parallel = config.get("max_parallel_images", 4)
+        # Rewrite marker descriptions with Gemini (one batched call for all markers)
+        self.enrich_marker_prompts = config.get("enrich_marker_prompts", False)
 
     async def execute(self, script_data: Any, video_path: str = None, full_context: Dict = None) -> List[str]:
         """
         Generates visual assets based on the script and context.
         Supports both old format (string) and new format (dict with markers).
         """
-        print("VisualAgent: Generating visuals...")
+        logger.info("VisualAgent: Generating visuals...")
         
         # Handle backward compatibility
         if isinstance(script_data, str):
@@ -36,46 +145,60 @@ class VisualAgent(BaseAgent):
         
         # 1. Extract prompts (prioritize markers if available)
         if visual_markers:
-            # Filter out screenshot markers (they're already available)
-            screenshot_markers = [m for m in visual_markers if m["type"] == "screenshot"]
-            image_markers = [m for m in visual_markers if m["type"] != "screenshot"]
+            # Filter out screenshot markers (they're already available), in one pass
+            screenshot_markers, image_markers = [], []
+            for m in visual_markers:
+                (screenshot_markers if m["type"] == "screenshot" else image_markers).append(m)
             
             if screenshot_markers:
-                print(f"   Found {len(screenshot_markers)} screenshot markers (using existing screenshots)")
+                logger.info(f"   Found {len(screenshot_markers)} screenshot markers (using existing screenshots)")
             
             if image_markers:
-                print(f"   Using {len(image_markers)} context-aware visual markers")
+                logger.info(f"   Using {len(image_markers)} context-aware visual markers")
                 prompts = self._create_prompts_from_markers(image_markers, full_context)
             else:
-                print("   No visual markers found, using generic extraction")
+                logger.info("   No visual markers found, using generic extraction")
                 prompts = self._extract_prompts(script, full_context)
         else:
-            print("   No visual markers found, using generic extraction")
+            logger.info("   No visual markers found, using generic extraction")
             prompts = self._extract_prompts(script, full_context)
         
-        print(f"   Extracted {len(prompts)} visual prompts")
+        logger.info(f"   Extracted {len(prompts)} visual prompts")
         
-        generated_images = []
+        # 2. Generate Images (concurrently, bounded; each call is mostly waiting on AI Studio)
+        semaphore = asyncio.Semaphore(self.max_parallel)
         
-        # 2. Generate Images
-        for i, prompt in enumerate(prompts):
-            print(f"\n📸 Generating image {i+1}/{len(prompts)}: {prompt[:80]}...")
-            image_path = await self._generate_image(prompt, i)
-            if image_path:
-                # 3. Process Image (Remove Background & Resize)
-                processed_path = self._process_image(image_path)
-                generated_images.append(processed_path)
-            else:
-                print(f"   ⚠️  Failed to generate image for: {prompt}")
+        async def run(prompt: str, i: int):
+            async with semaphore:
+                logger.info(f"\n📸 Generating image {i+1}/{len(prompts)}: {prompt[:80]}...")
+                image_path = await self._generate_image(prompt, i)
+            if not image_path:
+                logger.info(f"   ⚠️  Failed to generate image for: {prompt}")
+                return None
+            # 3. Process Image (Remove Background & Resize) off the event loop
+            return await asyncio.to_thread(self._process_image, image_path)
+        
+        results = await asyncio.gather(
+            *(run(prompt, i) for i, prompt in enumerate(prompts)),
+            return_exceptions=True
+        )
+        
+        # Keep prompt order
+        generated_images = []
+        for prompt, result in zip(prompts, results):
+            if isinstance(result, Exception):
+                logger.info(f"   ⚠️  Image task failed for: {prompt[:80]} ({result})")
+            elif result:
+                generated_images.append(result)
                 
-        print(f"\n✅ Generated {len(generated_images)} images total")
+        logger.info(f"\n✅ Generated {len(generated_images)} images total")
         return generated_images
 
     def _extract_prompts(self, text: str, full_context: Dict = None) -> List[str]:
         """
         Extract visual prompts using Gemini, now with FULL CONTEXT.
         """
-        print("   🧠 VisualAgent: Analyzing text for visual prompts...")
+        logger.info("   🧠 VisualAgent: Analyzing text for visual prompts...")
         
         # Default context if not provided
         if not full_context:
@@ -85,255 +208,279 @@ class VisualAgent(BaseAgent):
                 "comments": "No comments"
             }
             
-        prompt = f"""
-        You are an expert Art Director for viral videos.
-        
-        TASK: Create 3-5 highly specific image prompts based on this video script and context.
-        
+        context = f"""
         CONTEXT:
         Title: {full_context.get('title')}
         Content: {full_context.get('content')}
         Script: {text}
         Comments: {full_context.get('comments')}
+        """
         
-        STYLE GUIDE:
-        - Analyze the TONE of the content (e.g., Extreme Sports, Funny, Tech, Heartwarming).
-        - Choose a visual style that fits (e.g., Realistic Action, Cartoon, Minimalist, Watercolor).
-        - If the script mentions specific brands (e.g., "Red Bull"), INCLUDE them.
-        - If there's a punchline, visualize it.
-        
-        CRITICAL REQUIREMENT FOR COMPOSITING:
-        - All subjects must be CENTERED.
-        - All subjects must have a WHITE BACKGROUND.
-        - All subjects must have 50px PADDING on all sides (offset).
-        - Subjects must be ISOLATED (easy to remove background).
+        # Same inputs -> same prompts: skip the API on reruns (in-process first, then disk)
+        cache_key = cache_path("visual_prompts", Config.SCRIPT_MODEL, context)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is None:
+            cached = cache_get(cache_key, max_age=PROMPT_CACHE_MAX_AGE)
+            if cached is not None:
+                self._prompt_cache[cache_key] = cached
+        if cached is not None:
+            logger.info("   ✅ Visual prompts reused from cache")
+            return list(cached)
         
-        OUTPUT FORMAT:
-        Return ONLY a JSON list of strings.
-        Example:
-        [
-            "Realistic action shot of a snowboarder doing a backflip, Red Bull helmet visible, centered, isolated on white background, 50px padding, 8k resolution",
-            "Close up of a shocked cartoon face, exaggerated expression, centered, isolated on white background, 50px padding"
-        ]
-        """
+        # Static instructions first, per-video context last, so repeated calls share a prefix
+        prompt = _PROMPT_INSTRUCTIONS + context
         
         try:
-            response = self.model.generate_content(prompt)
-            
-            # Try to parse JSON first
-            import json
-            try:
-                # Clean up markdown code blocks if present
-                clean_text = response.text.replace('```json', '').replace('```', '').strip()
-                prompts = json.loads(clean_text)
-                if isinstance(prompts, list):
-                    return prompts[:5]
-            except:
-                pass
-                
-            # Fallback to pipe splitting if JSON fails
-            keywords = [k.strip() for k in response.text.split('|')]
-            keywords = [k.replace('```', '').replace('*', '').strip() for k in keywords]
-            keywords = [k for k in keywords if k and len(k) > 10]
-            return keywords[:5]
+            # JSON mode + schema: the reply is always a list of strings, no markdown to strip
+            response = self.model.generate_content(prompt, generation_config=_EXTRACT_CONFIG)
+            prompts = [p for p in json.loads(response.text) if isinstance(p, str) and p.strip()][:5]
+            if not prompts:
+                raise ValueError("empty prompt list")
+            self._remember_prompts(cache_key, prompts)
+            return prompts
             
         except Exception as e:
-            print(f"   ⚠️ Prompt extraction failed: {e}")
+            logger.info(f"   ⚠️ Prompt extraction failed: {e}")
             return ["Dramatic action scene, cinematic, white background",
                     "Surprised expression close-up, intense, white background",
                     "Epic wide shot, heroic moment, white background"]
 
+    def _remember_prompts(self, cache_key: str, prompts: List[str]):
+        self._prompt_cache[cache_key] = prompts
+        cache_put(cache_key, prompts)
+
     async def _generate_image(self, prompt: str, index: int) -> str:
         """Generates an image using Playwright automation in AI Studio - FULLY AUTOMATED."""
         from ..core.browser_manager import BrowserManager
         
         try:
-            page = await BrowserManager.ensure_logged_in()
-            
-            # Navigate to Imagen model URL
-            print("   Navigating to Imagen model...")
-            await page.goto("https://aistudio.google.com/app/prompts/new_chat?model=gemini-2.5-flash-image")
-            await page.wait_for_load_state("domcontentloaded")
-            await page.wait_for_timeout(3000)
-            
-            # Enter prompt in textarea
-            print(f"   Entering prompt: '{prompt[:50]}...'")
-            try:
-                prompt_textarea = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-prompt-renderer/ms-chunk-editor/section/footer/ms-prompt-input-wrapper/div/div/div/div[2]/ms-chunk-input/section/div/ms-text-chunk/ms-autosize-textarea/textarea")
-                await prompt_textarea.click(timeout=5000)
-                await prompt_textarea.fill(f"{prompt}")
-                print("   ✅ Prompt entered")
-            except Exception as e:
-                print(f"   ⚠️  Could not enter prompt: {e}")
+            # One tab per concurrent generation, kept warm across images
+            page = await BrowserManager.acquire_page(self.max_parallel)
+        except Exception as e:
+            logger.info(f"   ❌ Error in image generation: {e}")
+            return None
+        
+        # Only a tab that produced an image goes back to the pool: after a failure
+        # (None, or an exception) it may be mid-navigation or showing an error dialog
+        reusable = False
+        try:
+            result = await self._generate_image_on_page(page, prompt, index)
+            reusable = result is not None
+            return result
+        finally:
+            await BrowserManager.release_page(page, reusable=reusable)
+
+    async def _generate_image_on_page(self, page, prompt: str, index: int) -> str:
+        try:
+            if not await self._submit(page, prompt):
                 return None
-            
-            await page.wait_for_timeout(500)
-            
-            # Click Run button
-            print("   Clicking Run button...")
+            return await self._await_result(page, index)
+        except Exception as e:
+            logger.info(f"   ❌ Error in image generation: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    async def _submit(self, page, prompt: str) -> bool:
+        """
+        Stage 1: open a new chat, enter the prompt and press Run (a few seconds of UI work).
+        Returns False if the prompt could not be submitted.
+        """
+        # Navigate to Imagen model URL
+        logger.info("   Navigating to Imagen model...")
+        # A new chat every time (a reused tab still shows the previous turn). On a warm
+        # tab the app shell is cached, so wait for the prompt box instead of a fixed 3s.
+        await page.goto(_IMAGEN_URL)
+        await page.wait_for_load_state("domcontentloaded")
+        try:
+            await page.locator(_PROMPT_SELECTOR).first.wait_for(state="visible", timeout=15000)
+        except PlaywrightTimeoutError:
+            pass  # The click below reports the real problem
+        
+        # Enter prompt in textarea
+        logger.info(f"   Entering prompt: '{prompt[:50]}...'")
+        try:
+            prompt_textarea = page.locator(_PROMPT_SELECTOR).first
+            await prompt_textarea.click(timeout=5000)
+            await prompt_textarea.fill(f"{prompt}")
+            logger.info("   ✅ Prompt entered")
+        except Exception as e:
+            logger.info(f"   ⚠️  Could not enter prompt: {e}")
+            return False
+        
+        # Click Run button (click() waits for it to become enabled, no settle delay needed)
+        logger.info("   Clicking Run button...")
+        try:
+            run_button = page.locator(_RUN_BUTTON_SELECTOR).or_(
+                page.get_by_role("button", name=_RUN_BUTTON_NAME)
+            ).first
+            await run_button.click(timeout=5000)
+            logger.info("   ✅ Run button clicked")
+        except Exception as e:
+            logger.info(f"   ⚠️  Could not click Run: {e}")
+            return False
+        return True
+
+    async def _await_result(self, page, index: int) -> Optional[str]:
+        """
+        Stage 2: wait for the server to render the image (30-60s) and save it.
+        Other slots submit their prompts while this one waits.
+        """
+        # Wait for image generation
+        logger.info("   Waiting for image generation (up to 60 seconds)...")
+        
+        # Wait for the image element to appear (event-driven, no polling)
+        img_selector = _IMAGE_SELECTOR
+        max_wait = 60
+        started = time.perf_counter()
+        
+        async def report_progress():
+            for waited in range(10, max_wait, 10):
+                await asyncio.sleep(10)
+                logger.info(f"   ... still waiting ({waited}s)")
+        
+        progress_task = asyncio.create_task(report_progress())
+        try:
+            # Get the last (most recent) image
+            await page.locator(img_selector).last.wait_for(state="visible", timeout=max_wait * 1000)
+            image_found = True
+            logger.info(f"   ✅ Image appeared at {time.perf_counter() - started:.1f}s")
+        except PlaywrightTimeoutError:
+            image_found = False
+        finally:
+            progress_task.cancel()
+        
+        if not image_found:
+            logger.info("   ⚠️  Image generation timeout")
+            return None
+        
+        # Download the image
+        logger.info("   Downloading image...")
+        filename = f"gen_image_{index}.png"
+        output_path = os.path.join(self.assets_dir, filename)
+        
+        try:
+            # Wait until the newest image has a src and has finished decoding
             try:
-                run_button = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-prompt-renderer/ms-chunk-editor/section/footer/ms-prompt-input-wrapper/div/div/div/div[4]/ms-run-button/button")
-                await run_button.click(timeout=5000)
-                print("   ✅ Run button clicked")
-            except Exception as e:
-                print(f"   ⚠️  Could not click Run: {e}")
+                await page.wait_for_function(
+                    _IMAGE_READY_JS, arg=_IMAGE_SELECTOR, timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                pass  # Still try whatever src is there
+            src = await page.locator(_IMAGE_SELECTOR).last.get_attribute("src", timeout=5000)
+            
+            if not src:
+                logger.info("   ⚠️  Could not get image src")
                 return None
             
-            # Wait for image generation
-            print("   Waiting for image generation (up to 60 seconds)...")
-            import asyncio
+            logger.info(f"   Found image src: {src[:80]}...")
             
-            # Wait for the image element to appear
-            image_found = False
-            wait_time = 0
-            max_wait = 60
+            if src.startswith("data:"):
+                # Data URL (base64)
+                logger.info("   ✅ Data URL detected, extracting...")
+                b64_data = _data_url_payload(src)
+                if b64_data:
+                    size = await asyncio.to_thread(self._save_base64, b64_data, output_path)
+                    logger.info(f"   ✅ Image saved! ({size} bytes)")
+                    return output_path
+                else:
+                    logger.info("   ⚠️  Could not parse data URL")
+                    return None
             
-            while wait_time < max_wait and not image_found:
-                await asyncio.sleep(1)
-                wait_time += 1
-                
-                # Try to find the generated image
-                try:
-                    # Use a more flexible selector since chat-turn index might vary
-                    img_selector = "ms-chat-turn ms-image-chunk img"
-                    img_element = page.locator(img_selector).last  # Get the last (most recent) image
-                    
-                    if await img_element.is_visible(timeout=100):
-                        image_found = True
-                        print(f"   ✅ Image appeared at {wait_time}s")
-                        break
-                except:
-                    pass
-                
-                if wait_time % 10 == 0:
-                    print(f"   ... still waiting ({wait_time}s)")
+            elif src.startswith("http"):
+                # HTTP URL
+                logger.info("   Downloading from URL...")
+                from ..core.browser_manager import BrowserManager
+                api_request = await BrowserManager.api_request()
+                response = await api_request.get(src)
+                image_data = await response.body()
+                await asyncio.to_thread(self._write_bytes, output_path, image_data)
+                logger.info(f"   ✅ Image saved! ({len(image_data)} bytes)")
+                return output_path
             
-            if not image_found:
-                print("   ⚠️  Image generation timeout")
-                return None
+            elif src.startswith("blob:"):
+                # Blob URL - extract via JavaScript
+                logger.info("   Blob URL detected, extracting via JavaScript...")
+                # window.__blobToBase64 comes from the tab's init script (BrowserManager.new_page).
+                # The data-URL header is cut in the page, so Python never copies the payload
+                # out of a larger string. Base64 stays: evaluate() results travel as JSON, where
+                # a byte array would be ~3x larger.
+                b64_data = await page.evaluate("url => window.__blobToBase64(url)", src)
+                if b64_data:
+                    size = await asyncio.to_thread(self._save_base64, b64_data, output_path)
+                    logger.info(f"   ✅ Image saved from blob! ({size} bytes)")
+                    return output_path
             
-            # Download the image
-            print("   Downloading image...")
-            filename = f"gen_image_{index}.png"
-            output_path = os.path.join(self.assets_dir, filename)
+            logger.info("   ⚠️  Unknown src format")
+            return None
             
-            try:
-                # Wait a bit more to ensure image is fully loaded
-                await asyncio.sleep(2)
-                
-                # Get the image src - try multiple times
-                img_element = None
-                src = None
-                
-                for attempt in range(3):
-                    try:
-                        img_element = page.locator("ms-chat-turn ms-image-chunk img").last
-                        src = await img_element.get_attribute("src", timeout=5000)
-                        if src:
-                            break
-                        await asyncio.sleep(1)
-                    except:
-                        if attempt < 2:
-                            print(f"   Retry {attempt + 1}/3...")
-                            await asyncio.sleep(2)
-                        continue
-                
-                if not src:
-                    print("   ⚠️  Could not get image src after retries")
-                    return None
-                
-                print(f"   Found image src: {src[:80]}...")
-                
-                if src.startswith("data:"):
-                    # Data URL (base64)
-                    print("   ✅ Data URL detected, extracting...")
-                    import base64
-                    import re
-                    match = re.match(r'data:.*?;base64,(.*)', src)
-                    if match:
-                        image_bytes = base64.b64decode(match.group(1))
-                        with open(output_path, "wb") as f:
-                            f.write(image_bytes)
-                        print(f"   ✅ Image saved! ({len(image_bytes)} bytes)")
-                        return output_path
-                    else:
-                        print("   ⚠️  Could not parse data URL")
-                        return None
-                
-                elif src.startswith("http"):
-                    # HTTP URL
-                    print("   Downloading from URL...")
-                    response = await page.request.get(src)
-                    image_data = await response.body()
-                    with open(output_path, "wb") as f:
-                        f.write(image_data)
-                    print(f"   ✅ Image saved! ({len(image_data)} bytes)")
-                    return output_path
-                
-                elif src.startswith("blob:"):
-                    # Blob URL - extract via JavaScript
-                    print("   Blob URL detected, extracting via JavaScript...")
-                    js_code = f"""
-                    async function getBlobData() {{
-                        const response = await fetch('{src}');
-                        const blob = await response.blob();
-                        const reader = new FileReader();
-                        return new Promise((resolve) => {{
-                            reader.onloadend = () => resolve(reader.result);
-                            reader.readAsDataURL(blob);
-                        }});
-                    }}
-                    getBlobData();
-                    """
-                    base64_data = await page.evaluate(js_code)
-                    if base64_data:
-                        import base64
-                        import re
-                        match = re.match(r'data:.*?;base64,(.*)', base64_data)
-                        if match:
-                            image_bytes = base64.b64decode(match.group(1))
-                            with open(output_path, "wb") as f:
-                                f.write(image_bytes)
-                            print(f"   ✅ Image saved from blob! ({len(image_bytes)} bytes)")
-                            return output_path
-                
-                print("   ⚠️  Unknown src format")
-                return None
-                
-            except Exception as e:
-                print(f"   ⚠️  Error downloading image: {e}")
-                return None
-
         except Exception as e:
-            print(f"   ❌ Error in image generation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.info(f"   ⚠️  Error downloading image: {e}")
             return None
 
+    @staticmethod
+    def _write_bytes(path: str, data: bytes):
+        """Write data with os.write over a memoryview (no intermediate copies)."""
+        view = memoryview(data)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _save_base64(cls, b64_data: str, path: str) -> int:
+        """Decode base64 image data and write it to path. Returns the byte count."""
+        image_bytes = base64.b64decode(b64_data)
+        cls._write_bytes(path, image_bytes)
+        return len(image_bytes)
+
     def _process_image(self, image_path: str) -> str:
         """Resize image (background removal disabled to preserve details)."""
         try:
-            print(f"   Processing image: {os.path.basename(image_path)}")
+            logger.info(f"   Processing image: {os.path.basename(image_path)}")
             output_path = image_path.replace(".png", "_processed.png")
             
+            # Already small enough: thumbnail() would only decode and re-encode it
+            size = _png_size(image_path)
+            if size and max(size) <= THUMBNAIL_SIZE:
+                if output_path != image_path:
+                    # A real copy, not a hardlink: gen_image_N.png is rewritten in place
+                    # (O_TRUNC) on the next run, which would change this file too
+                    shutil.copyfile(image_path, output_path)
+                logger.info(f"   ✅ Image already {size[0]}x{size[1]}, kept as is: {os.path.basename(output_path)}")
+                return output_path
+            
             # Skip background removal - it removes important details
-            # Just resize to reasonable size
-            with Image.open(image_path) as img:
-                # Resize while maintaining aspect ratio
-                img.thumbnail((800, 800))
-                img.save(output_path)
+            # Just resize to reasonable size (never upscales, keeps aspect ratio)
+            if pyvips:
+                thumb = pyvips.Image.thumbnail(image_path, THUMBNAIL_SIZE, height=THUMBNAIL_SIZE, size="down")
+                thumb.write_to_file(output_path)
+            else:
+                with Image.open(image_path) as img:
+                    # JPEG data: let libjpeg decode at the nearest 1/2, 1/4, 1/8 scale that
+                    # still covers the target (no-op for PNG)
+                    img.draft(img.mode, (THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+                    img.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), _RESAMPLE)
+                    img.save(output_path)
             
-            print(f"   ✅ Image processed: {os.path.basename(output_path)}")
+            logger.info(f"   ✅ Image processed: {os.path.basename(output_path)}")
             return output_path
             
         except Exception as e:
-            print(f"   ⚠️  Error processing image: {e}")
+            logger.info(f"   ⚠️  Error processing image: {e}")
             return image_path  # Return original if processing fails
 
     def _create_prompts_from_markers(self, markers: List[Dict], full_context: Dict = None) -> List[str]:
         """
         Create context-aware image prompts from visual markers.
         """
+        if self.enrich_marker_prompts:
+            enriched = self._enrich_marker_descriptions(markers, full_context)
+            if enriched:
+                return enriched
+        
         prompts = []
         
         for marker in markers:
@@ -349,6 +496,42 @@ class VisualAgent(BaseAgent):
             """
             
             prompts.append(enhanced_prompt.strip())
-            print(f"   Created prompt for marker '{marker_id}': {description}")
+            logger.info(f"   Created prompt for marker '{marker_id}': {description}")
         
         return prompts
+
+    def _enrich_marker_descriptions(self, markers: List[Dict], full_context: Dict = None) -> List[str]:
+        """
+        Turn all marker descriptions into detailed image prompts with ONE Gemini call.
+        Returns [] if the call or the parse fails (caller uses the template prompts).
+        """
+        title = (full_context or {}).get("title", "")
+        descriptions = "\n".join(
+            f"{i + 1}. {marker.get('description', '')}" for i, marker in enumerate(markers)
+        )
+        prompt = f"""
+        You are an expert Art Director for viral videos about: {title}
+        
+        Rewrite each of these {len(markers)} image descriptions into a highly detailed image prompt.
+        Every prompt must describe a CENTERED subject, ISOLATED on a WHITE BACKGROUND,
+        with 50px PADDING on all sides (for video compositing).
+        
+        DESCRIPTIONS:
+        {descriptions}
+        
+        Return ONLY a JSON list of {len(markers)} strings, one per description, in the same order.
+        """
+        
+        try:
+            response = self.model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"}
+            )
+            prompts = json.loads(response.text)
+            if isinstance(prompts, list) and len(prompts) == len(markers) and all(isinstance(p, str) for p in prompts):
+                logger.info(f"   ✅ Enriched {len(prompts)} marker prompts in one call")
+                return prompts
+            logger.info("   ⚠️ Marker enrichment returned an unexpected shape, using templates")
+        except Exception as e:
+            logger.info(f"   ⚠️ Marker enrichment failed: {e}")
+        return []
@@ -1,9 +1,169 @@
 import os
+import re
+import logging
+import asyncio
 import base64
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
 from ..core.config import Config
+from ..core.log import get_logger
+
+logger = get_logger(__name__)
+
+AUDIO_TIMEOUT_MS = 180_000
+
+
+# Polled inside the browser (on animation frames) rather than from Python. A src
+# is required, not visibility: the player can be present without visible controls.
+_AUDIO_READY_JS = "() => { const audio = document.querySelector('audio'); return !!(audio && audio.src); }"
+
+
+def _is_audio_response(response) -> bool:
+    """True for network responses that look like the generated audio."""
+    # The URL test only accepts early (no header lookup); anything else, e.g. audio
+    # from a CDN or blob URL, is judged by its Content-Type
+    url = response.url.lower()
+    if "wav" in url or "mp3" in url or "audio" in url:
+        return True
+    return "audio" in response.headers.get("content-type", "")
+
+
+def _has_audio_content_type(response) -> bool:
+    """Stricter test that ends the generation wait: the body is served as audio."""
+    # A URL substring match ("audio" in a script or XHR path) must not stop the wait early
+    return "audio" in response.headers.get("content-type", "")
+
+
+def _content_length(response) -> Optional[int]:
+    value = response.headers.get("content-length")
+    return int(value) if value and value.isdigit() else None
+
+
+def _response_rank(response):
+    """Full 200 bodies before 206 range chunks, larger bodies first."""
+    return (response.status == 200, _content_length(response) or 0)
+
+
+def _data_url_payload(url: str) -> Optional[str]:
+    """Base64 part of a `data:<mime>;base64,<data>` URL, or None (no regex over the payload)."""
+    if not url.startswith("data:"):
+        return None
+    _, sep, payload = url.partition(",")
+    return payload if sep else None
+
+
+# Constant source with the URL as an argument: nothing is interpolated into the
+# script, and the same source is sent every time
+_BLOB_TO_DATA_URL_JS = """
+async (src) => {
+    const blob = await (await fetch(src)).blob();
+    return await new Promise((resolve) => {
+        const reader = new FileReader();
+        reader.onloadend = () => resolve(reader.result);
+        reader.readAsDataURL(blob);
+    });
+}
+"""
+
+# Base64 chars decoded per write (multiple of 4 -> 48KB of audio per chunk)
+_B64_CHUNK = 64 * 1024
+
+
+def _write_base64(path: str, b64_data: str) -> int:
+    """Decode base64 straight to disk chunk by chunk, so the decoded audio is never held whole."""
+    written = 0
+    with open(path, "wb") as f:
+        for i in range(0, len(b64_data), _B64_CHUNK):
+            written += f.write(base64.b64decode(b64_data[i:i + _B64_CHUNK]))
+    return written
+
+
+# AI Studio speech-prompt controls by logical name. Accessible role/name first, with
+# the Angular component tag as fallback; both survive layout changes that broke the
+# old absolute XPaths (each miss cost a 5s timeout).
+_STEP_LOCATORS = {
+    "model_selector": lambda page: page.locator("ms-model-selector-v3 button").or_(
+        page.get_by_role("button", name=re.compile("model", re.I))),
+    "model_search": lambda page: page.get_by_placeholder(re.compile("search", re.I)).or_(
+        page.locator("ms-model-carousel input")),
+    # Filtered on the label so it waits for the search results instead of a fixed sleep
+    "tts_model": lambda page: page.locator("ms-model-carousel-row button").filter(
+        has_text=re.compile("tts", re.I)),
+    "single_speaker": lambda page: page.get_by_role("button", name=re.compile("single-speaker", re.I)).or_(
+        page.locator("ms-tts-mode-selector ms-toggle-button button")),
+    "temperature_toggle": lambda page: page.locator("ms-speech-run-settings > div:nth-of-type(3) button"),
+    "temperature_slider": lambda page: page.get_by_role("slider", name=re.compile("temperature", re.I)).or_(
+        page.locator("ms-speech-run-settings ms-slider input")),
+    "voice_selector": lambda page: page.get_by_role("combobox", name=re.compile("voice", re.I)).or_(
+        page.locator("ms-voice-selector mat-form-field")),
+    "voice_option": lambda page, voice: page.get_by_role("option", name=re.compile(voice, re.I)),
+    "style_textarea": lambda page: page.locator("ms-speech-prompt ms-autosize-textarea"),
+    "script_textarea": lambda page: page.get_by_placeholder("Start writing or paste text here to generate speech"),
+    "run_button": lambda page: page.locator("ms-speech-prompt ms-run-button button").or_(
+        page.get_by_role("button", name=re.compile(r"^\s*run", re.I))),
+}
+
+
+# Steps 1-9 in a single evaluate() round-trip. Each step waits for its element with a
+# MutationObserver instead of a sleep. Returns how many steps completed, in order.
+_SETUP_JS = """
+async ({voice, temperature, timeout}) => {
+    const find = (selectors, text) => {
+        for (const sel of selectors) {
+            for (const el of document.querySelectorAll(sel)) {
+                if (!text || text.test(el.textContent)) return el;
+            }
+        }
+        return null;
+    };
+    const waitFor = (selectors, text) => new Promise((resolve) => {
+        const el = find(selectors, text);
+        if (el) return resolve(el);
+        const observer = new MutationObserver(() => {
+            const found = find(selectors, text);
+            if (found) { observer.disconnect(); clearTimeout(timer); resolve(found); }
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        const timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeout);
+    });
+    const setValue = (el, value) => {
+        el.value = value;
+        el.dispatchEvent(new Event("input", {bubbles: true}));
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+    };
+    const click = async (selectors, text) => {
+        const el = await waitFor(selectors, text);
+        if (!el) return false;
+        el.click();
+        return true;
+    };
+    const fill = async (selectors, value) => {
+        const el = await waitFor(selectors);
+        if (!el) return false;
+        setValue(el, value);
+        return true;
+    };
+    const steps = [
+        () => click(["ms-model-selector-v3 button"]),
+        () => fill(["ms-model-carousel input"], "tts"),
+        () => click(["ms-model-carousel-row button"], /tts/i),
+        () => click(["ms-tts-mode-selector ms-toggle-button button"]),
+        () => click(["ms-speech-run-settings > div:nth-of-type(3) button"]),
+        () => fill(["ms-speech-run-settings ms-slider input"], temperature),
+        () => click(["ms-voice-selector [role=combobox]", "ms-voice-selector mat-form-field"]),
+        () => click(["mat-option"], new RegExp(voice, "i")),
+        () => fill(["ms-speech-prompt ms-autosize-textarea textarea"], ""),
+    ];
+    let done = 0;
+    for (const step of steps) {
+        if (!(await step())) break;
+        done++;
+    }
+    return done;
+}
+"""
+
 
 class VoiceoverAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
@@ -12,287 +172,321 @@ class VoiceoverAgent(BaseAgent):
         self.assets_dir = Config.ASSETS_DIR
         self.model_name = Config.TTS_MODEL
         self.voice_name = Config.TTS_VOICE
+        # Built locators by (name, *args). Locators are lazy and re-query on every action,
+        # so they stay valid across navigations; only a different page invalidates them.
+        self._locator_cache = {}
+        self._locator_page = None
+
+    def _locate(self, page, name: str, *args):
+        """First element matching the named control (cached per page)."""
+        if page is not self._locator_page:
+            self._locator_cache.clear()
+            self._locator_page = page
+        key = (name, *args)
+        locator = self._locator_cache.get(key)
+        if locator is None:
+            locator = self._locator_cache[key] = _STEP_LOCATORS[name](page, *args).first
+        return locator
+
+    async def _setup_in_page(self, page) -> int:
+        """Run setup steps 1-9 via _SETUP_JS. Returns the number of steps completed."""
+        try:
+            return await page.evaluate(
+                _SETUP_JS,
+                {"voice": self.voice_name, "temperature": "0.8", "timeout": 5000}
+            )
+        except Exception as e:
+            logger.warning("   ⚠️  In-page setup failed, falling back to step-by-step: %s", e)
+            return 0
+
+    async def _configure_panel(self, page, done: int):
+        """Steps 5-8 (temperature, voice). Sequential: the voice dropdown's overlay swallows other clicks."""
+        # STEP 5: Open temperature dropdown
+        if done < 5:
+            logger.info("VoiceoverAgent: Step 5 - Opening temperature settings...")
+            try:
+                temp_dropdown = self._locate(page, "temperature_toggle")
+                await temp_dropdown.click(timeout=5000)
+                logger.info("   ✅ Temperature dropdown opened")
+            except Exception as e:
+                logger.warning("   ⚠️  Could not open temperature: %s", e)
+        
+        # STEP 6: Set temperature to 0.8
+        if done < 6:
+            logger.info("VoiceoverAgent: Step 6 - Setting temperature to 0.8...")
+            try:
+                temp_slider = self._locate(page, "temperature_slider")
+                await temp_slider.fill("0.8", timeout=5000)
+                logger.info("   ✅ Temperature set to 0.8")
+            except Exception as e:
+                logger.warning("   ⚠️  Could not set temperature: %s", e)
+        
+        # STEP 7: Open voice selector
+        if done < 7:
+            logger.info("VoiceoverAgent: Step 7 - Opening voice selector...")
+            try:
+                voice_selector = self._locate(page, "voice_selector")
+                await voice_selector.click(timeout=5000)
+                logger.info("   ✅ Voice selector opened")
+            except Exception as e:
+                logger.warning("   ⚠️  Could not open voice selector: %s", e)
+        
+        # STEP 8: Select the configured voice (Config.TTS_VOICE)
+        if done < 8:
+            logger.info("VoiceoverAgent: Step 8 - Selecting %s voice...", self.voice_name)
+            try:
+                voice_option = self._locate(page, "voice_option", self.voice_name)
+                await voice_option.click(timeout=5000)
+                logger.info("   ✅ %s voice selected", self.voice_name)
+            except Exception as e:
+                logger.warning("   ⚠️  Could not select %s: %s", self.voice_name, e)
+
+    async def _enter_script(self, page, text: str):
+        """Step 10, on the script textarea only; safe to run alongside _configure_panel."""
+        logger.info("VoiceoverAgent: Step 10 - Entering script text...")
+        try:
+            # fill() focuses the textarea itself; a click could land on the voice
+            # dropdown's backdrop while the panel steps run alongside
+            script_textarea = self._locate(page, "script_textarea")
+            await script_textarea.fill(text, timeout=5000)
+            logger.info("   ✅ Script text entered")
+        except Exception as e:
+            logger.warning("   ⚠️  Could not enter text: %s", e)
 
     async def execute(self, text: str, output_filename: str = "voiceover.mp3") -> str:
         """
         Generates audio using Playwright - FULLY AUTOMATED with exact XPaths.
         """
-        print(f"VoiceoverAgent: Starting FULLY AUTOMATED audio generation for {output_filename}...")
+        logger.info("VoiceoverAgent: Starting FULLY AUTOMATED audio generation for %s...", output_filename)
         from ..core.browser_manager import BrowserManager
         
         try:
             page = await BrowserManager.ensure_logged_in()
             
-            print("VoiceoverAgent: Navigating to AI Studio...")
+            logger.info("VoiceoverAgent: Navigating to AI Studio...")
             await page.goto("https://aistudio.google.com/app/prompts/new_chat")
             await page.wait_for_load_state("domcontentloaded")
-            await page.wait_for_timeout(3000)
+            
+            # Steps 1-9 run as one in-page script; the Playwright steps below only
+            # pick up from wherever it stopped (0 = script unavailable / nothing done)
+            done = await self._setup_in_page(page)
+            if done:
+                logger.info("VoiceoverAgent: Steps 1-%s done in one page script", done)
             
             # STEP 1: Click model selector
-            print("VoiceoverAgent: Step 1 - Opening model selector...")
-            try:
-                model_selector = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-prompt-renderer/ms-chunk-editor/ms-right-side-panel/div/ms-run-settings/div[2]/div/ms-prompt-run-settings-switcher/ms-prompt-run-settings/div[1]/div/ms-model-selector-v3/button")
-                await model_selector.click(timeout=5000)
-                await page.wait_for_timeout(1000)
-                print("   ✅ Model selector opened")
-            except Exception as e:
-                print(f"   ⚠️  Could not open model selector: {e}")
+            if done < 1:
+                logger.info("VoiceoverAgent: Step 1 - Opening model selector...")
+                try:
+                    model_selector = self._locate(page, "model_selector")
+                    await model_selector.click(timeout=5000)
+                    logger.info("   ✅ Model selector opened")
+                except Exception as e:
+                    logger.warning("   ⚠️  Could not open model selector: %s", e)
             
             # STEP 2: Search for TTS
-            print("VoiceoverAgent: Step 2 - Searching for TTS...")
-            try:
-                search_input = page.locator("xpath=/html/body/div[3]/div/div[2]/mat-dialog-container/div/div/mat-dialog-content/ms-model-carousel/ms-input-field/div/input")
-                await search_input.fill("tts", timeout=5000)
-                await page.wait_for_timeout(1000)
-                print("   ✅ Searched for 'tts'")
-            except Exception as e:
-                print(f"   ⚠️  Could not search: {e}")
+            if done < 2:
+                logger.info("VoiceoverAgent: Step 2 - Searching for TTS...")
+                try:
+                    search_input = self._locate(page, "model_search")
+                    await search_input.fill("tts", timeout=5000)
+                    logger.info("   ✅ Searched for 'tts'")
+                except Exception as e:
+                    logger.warning("   ⚠️  Could not search: %s", e)
             
             # STEP 3: Select gemini-pro-preview-tts
-            print("VoiceoverAgent: Step 3 - Selecting TTS model...")
-            try:
-                tts_model = page.locator("xpath=/html/body/div[3]/div/div[2]/mat-dialog-container/div/div/mat-dialog-content/ms-model-carousel/div/ms-model-carousel-row[1]/button")
-                await tts_model.click(timeout=5000)
-                await page.wait_for_timeout(2000)
-                print("   ✅ TTS model selected")
-            except Exception as e:
-                print(f"   ⚠️  Could not select TTS model: {e}")
+            if done < 3:
+                logger.info("VoiceoverAgent: Step 3 - Selecting TTS model...")
+                try:
+                    tts_model = self._locate(page, "tts_model")
+                    await tts_model.click(timeout=5000)
+                    logger.info("   ✅ TTS model selected")
+                except Exception as e:
+                    logger.warning("   ⚠️  Could not select TTS model: %s", e)
             
             # STEP 4: Select single-speaker audio
-            print("VoiceoverAgent: Step 4 - Selecting single-speaker mode...")
-            try:
-                single_speaker = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/ms-right-side-panel/div/ms-run-settings/div[2]/div/ms-speech-run-settings/div[2]/ms-tts-mode-selector/ms-toggle-button[1]/button")
-                await single_speaker.click(timeout=5000)
-                await page.wait_for_timeout(500)
-                print("   ✅ Single-speaker mode selected")
-            except Exception as e:
-                print(f"   ⚠️  Could not select single-speaker: {e}")
+            if done < 4:
+                logger.info("VoiceoverAgent: Step 4 - Selecting single-speaker mode...")
+                try:
+                    single_speaker = self._locate(page, "single_speaker")
+                    await single_speaker.click(timeout=5000)
+                    logger.info("   ✅ Single-speaker mode selected")
+                except Exception as e:
+                    logger.warning("   ⚠️  Could not select single-speaker: %s", e)
             
-            # STEP 5: Open temperature dropdown
-            print("VoiceoverAgent: Step 5 - Opening temperature settings...")
-            try:
-                temp_dropdown = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/ms-right-side-panel/div/ms-run-settings/div[2]/div/ms-speech-run-settings/div[3]/div/button")
-                await temp_dropdown.click(timeout=5000)
-                await page.wait_for_timeout(500)
-                print("   ✅ Temperature dropdown opened")
-            except Exception as e:
-                print(f"   ⚠️  Could not open temperature: {e}")
+            # STEP 9: Clear style instruction placeholder
+            # Takes focus, so it runs on its own before the concurrent steps
+            if done < 9:
+                logger.info("VoiceoverAgent: Step 9 - Clearing style instruction placeholder...")
+                try:
+                    style_textarea = self._locate(page, "style_textarea")
+                    await style_textarea.fill("", timeout=5000)
+                    if await style_textarea.input_value():
+                        # Framework kept the old value; select-all works on any OS here
+                        await style_textarea.press("ControlOrMeta+A")
+                        await style_textarea.press("Delete")
+                    logger.info("   ✅ Style instruction cleared")
+                except Exception as e:
+                    logger.warning("   ⚠️  Could not clear style: %s", e)
             
-            # STEP 6: Set temperature to 0.8
-            print("VoiceoverAgent: Step 6 - Setting temperature to 0.8...")
-            try:
-                temp_slider = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/ms-right-side-panel/div/ms-run-settings/div[2]/div/ms-speech-run-settings/div[4]/div[2]/ms-slider/div/input")
-                await temp_slider.fill("0.8", timeout=5000)
-                await page.wait_for_timeout(500)
-                print("   ✅ Temperature set to 0.8")
-            except Exception as e:
-                print(f"   ⚠️  Could not set temperature: {e}")
+            # Steps 5-8 (run-settings panel) and step 10 (script textarea) touch
+            # disjoint elements, so their round-trips overlap
+            await asyncio.gather(
+                self._configure_panel(page, done),
+                self._enter_script(page, text),
+            )
             
-            # STEP 7: Open voice selector
-            print("VoiceoverAgent: Step 7 - Opening voice selector...")
-            try:
-                voice_selector = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/ms-right-side-panel/div/ms-run-settings/div[2]/div/ms-speech-run-settings/div[5]/ms-voice-selector/div/mat-form-field/div[1]")
-                await voice_selector.click(timeout=5000)
-                await page.wait_for_timeout(1000)
-                print("   ✅ Voice selector opened")
-            except Exception as e:
-                print(f"   ⚠️  Could not open voice selector: {e}")
+            # STEP 11: Click Run button
+            # Arm both waits before clicking so an early response can't be missed
+            audio_response_task = asyncio.create_task(page.wait_for_event(
+                "response", predicate=_has_audio_content_type, timeout=AUDIO_TIMEOUT_MS))
+            audio_elem_task = asyncio.create_task(page.wait_for_function(
+                _AUDIO_READY_JS, timeout=AUDIO_TIMEOUT_MS))
             
-            # STEP 8: Select Algeiba voice
-            print("VoiceoverAgent: Step 8 - Selecting Algeiba voice...")
-            try:
-                algeiba_voice = page.locator("xpath=/html/body/div[3]/div/div[2]/div/mat-option[17]")
-                await algeiba_voice.click(timeout=5000)
-                await page.wait_for_timeout(500)
-                print("   ✅ Algeiba voice selected")
-            except Exception as e:
-                print(f"   ⚠️  Could not select Algeiba: {e}")
+            # Every candidate audio response by URL (broad URL test): range requests repeat the same resource as
+            # 206 chunks plus a final 200, and only one of them needs downloading
+            audio_responses_by_url = {}
             
-            # STEP 9: Clear style instruction placeholder
-            print("VoiceoverAgent: Step 9 - Clearing style instruction placeholder...")
-            try:
-                style_textarea = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/section/div[1]/div/ms-autosize-textarea")
-                await style_textarea.click(timeout=5000)
-                await page.keyboard.press("Meta+A")  # Command+A on Mac
-                await page.keyboard.press("Backspace")
-                await page.wait_for_timeout(300)
-                print("   ✅ Style instruction cleared")
-            except Exception as e:
-                print(f"   ⚠️  Could not clear style: {e}")
+            def collect_audio(response):
+                if not _is_audio_response(response):
+                    return
+                kept = audio_responses_by_url.get(response.url)
+                if kept is None or (kept.status != 200 and response.status == 200):
+                    audio_responses_by_url[response.url] = response
             
-            # STEP 10: Enter script text in the CORRECT textarea
-            print("VoiceoverAgent: Step 10 - Entering script text...")
-            try:
-                # Use the exact selector for script narasi textarea
-                script_textarea = page.locator("textarea[placeholder='Start writing or paste text here to generate speech']")
-                await script_textarea.click(timeout=5000)
-                await script_textarea.fill(text)
-                print(f"   ✅ Script text entered")
-                await page.wait_for_timeout(500)
-            except Exception as e:
-                print(f"   ⚠️  Could not enter text: {e}")
+            page.on("response", collect_audio)
             
-            # STEP 11: Click Run button
-            print("VoiceoverAgent: Step 11 - Clicking Run button...")
+            logger.info("VoiceoverAgent: Step 11 - Clicking Run button...")
             try:
-                run_button = page.locator("xpath=/html/body/app-root/ms-app/div/div/div[3]/div/span/ms-speech-prompt/section/div[2]/div/div[2]/ms-run-button/button")
+                run_button = self._locate(page, "run_button")
                 await run_button.click(timeout=5000)
-                print("   ✅ Run button clicked")
+                logger.info("   ✅ Run button clicked")
             except Exception as e:
-                print(f"   ⚠️  Could not click Run: {e}")
+                logger.warning("   ⚠️  Could not click Run: %s", e)
+                audio_response_task.cancel()
+                audio_elem_task.cancel()
+                page.remove_listener("response", collect_audio)
                 return None
             
             # STEP 12: Wait for audio generation and scrape from preview
-            print("VoiceoverAgent: Step 12 - Waiting for audio generation...")
+            logger.info("VoiceoverAgent: Step 12 - Waiting for audio generation...")
             output_path = os.path.join(self.assets_dir, output_filename)
             
-            # Set up network listener to capture ALL audio-related requests
-            audio_urls = []
+            # Resolves as soon as either the audio response or the <audio> player shows up
+            logger.info("   Waiting for audio generation (up to %s seconds)...", AUDIO_TIMEOUT_MS // 1000)
+            started = asyncio.get_running_loop().time()
+            pending = {audio_response_task, audio_elem_task}
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() is None for task in finished):
+                    break
+            for task in pending:
+                task.cancel()
+            page.remove_listener("response", collect_audio)
+            elapsed = asyncio.get_running_loop().time() - started
             
-            async def handle_response(response):
-                nonlocal audio_urls
-                url = response.url
-                content_type = response.headers.get("content-type", "")
-                
-                # Log all responses for debugging
-                if "audio" in content_type or "wav" in url.lower() or "mp3" in url.lower():
-                    print(f"   🔍 Audio response detected:")
-                    print(f"      URL: {url[:100]}...")
-                    print(f"      Content-Type: {content_type}")
-                    audio_urls.append(url)
+            if audio_response_task.done() and not audio_response_task.cancelled() \
+                    and audio_response_task.exception() is None:
+                response = audio_response_task.result()
+                logger.info("   🔍 Audio response detected after %.1fs:", elapsed)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("      URL: %s...", response.url[:100])
+                    logger.debug("      Content-Type: %s", response.headers.get('content-type', ''))
+            if audio_elem_task.done() and not audio_elem_task.cancelled() \
+                    and audio_elem_task.exception() is None:
+                logger.info("   ✅ Audio player appeared at %.1fs", elapsed)
             
-            page.on("response", handle_response)
-            
-            # Wait for audio to be generated
-            print("   Waiting for audio generation (up to 180 seconds)...")
-            import asyncio
-            wait_time = 0
-            max_wait = 180
-            
-            while wait_time < max_wait:
-                await asyncio.sleep(1)
-                wait_time += 1
-                
-                # Check if audio element appeared
-                try:
-                    audio_elem = page.locator("audio").first
-                    if await audio_elem.is_visible(timeout=100):
-                        print(f"   ✅ Audio player appeared at {wait_time}s")
-                        break
-                except:
-                    pass
-                    
-                if wait_time % 10 == 0:
-                    print(f"   ... still waiting ({wait_time}s)")
+            # Skip bodies the headers already say are too small to be the audio
+            audio_responses = sorted(
+                (r for r in audio_responses_by_url.values()
+                 if (_content_length(r) or 1001) > 1000),
+                key=_response_rank, reverse=True
+            )
             
-            page.remove_listener("response", handle_response)
-            
-            # Try to download from captured URLs
+            # Use the body the browser already received; re-request only if it's gone
             downloaded = False
-            if audio_urls:
-                print(f"   Found {len(audio_urls)} audio URL(s), trying to download...")
-                for url in audio_urls:
+            if audio_responses:
+                logger.info("   Found %s audio response(s), reading body...", len(audio_responses))
+                for response in audio_responses:
                     try:
-                        print(f"   Attempting download from: {url[:80]}...")
-                        response = await page.request.get(url)
-                        audio_data = await response.body()
+                        try:
+                            audio_data = await response.body()
+                        except Exception:
+                            logger.info("   Body no longer cached, re-downloading: %s...", response.url[:80])
+                            audio_data = await (await page.request.get(response.url)).body()
                         
                         if len(audio_data) > 1000:  # Valid audio file
                             with open(output_path, "wb") as f:
                                 f.write(audio_data)
-                            print(f"   ✅ Audio downloaded! ({len(audio_data)} bytes)")
+                            logger.info("   ✅ Audio downloaded! (%s bytes)", len(audio_data))
                             downloaded = True
                             break
                     except Exception as e:
-                        print(f"   ⚠️  Failed: {e}")
+                        logger.warning("   ⚠️  Failed: %s", e)
                         continue
             
             # Fallback 1: Try to get from audio element src
             if not downloaded:
-                print("   Trying to get audio from <audio> element...")
+                logger.info("   Trying to get audio from <audio> element...")
                 try:
-                    audio_element = page.locator("audio").first
-                    if await audio_element.is_visible(timeout=5000):
-                        src = await audio_element.get_attribute("src")
-                        if src:
-                            print(f"   Found audio src: {src[:80]}...")
-                            
-                            if src.startswith("data:"):
-                                # Data URL (base64 encoded)
-                                print("   ✅ Data URL detected, extracting base64...")
-                                try:
-                                    import base64
-                                    import re
-                                    # Extract base64 data from data URL
-                                    match = re.match(r'data:.*?;base64,(.*)', src)
-                                    if match:
-                                        audio_bytes = base64.b64decode(match.group(1))
-                                        with open(output_path, "wb") as f:
-                                            f.write(audio_bytes)
-                                        print(f"   ✅ Downloaded from data URL! ({len(audio_bytes)} bytes)")
+                    audio_element = page.locator("audio[src]").first
+                    # The player gets its src once the audio is ready; wait for that, not visibility
+                    await audio_element.wait_for(state="attached", timeout=5000)
+                    src = await audio_element.get_attribute("src")
+                    if src:
+                        logger.info("   Found audio src: %s...", src[:80])
+                        
+                        if src.startswith("data:"):
+                            # Data URL (base64 encoded)
+                            logger.info("   ✅ Data URL detected, extracting base64...")
+                            try:
+                                b64_data = _data_url_payload(src)
+                                if b64_data:
+                                    size = _write_base64(output_path, b64_data)
+                                    logger.info("   ✅ Downloaded from data URL! (%s bytes)", size)
+                                    downloaded = True
+                                else:
+                                    logger.warning("   ⚠️  Could not parse data URL")
+                            except Exception as e:
+                                logger.warning("   ⚠️  Data URL extraction failed: %s", e)
+                                
+                        elif src.startswith("http"):
+                            response = await page.request.get(src)
+                            audio_data = await response.body()
+                            with open(output_path, "wb") as f:
+                                f.write(audio_data)
+                            logger.info("   ✅ Downloaded from audio element!")
+                            downloaded = True
+                        elif src.startswith("blob:"):
+                            logger.warning("   ⚠️  Blob URL detected, trying alternative method...")
+                            # Try to use CDP to resolve blob URL
+                            try:
+                                # Fetch the blob in the page and read it back as a data URL
+                                base64_data = await page.evaluate(_BLOB_TO_DATA_URL_JS, src)
+                                if base64_data:
+                                    # Remove data URL prefix
+                                    b64_data = _data_url_payload(base64_data)
+                                    if b64_data:
+                                        _write_base64(output_path, b64_data)
+                                        logger.info("   ✅ Downloaded blob via JavaScript!")
                                         downloaded = True
-                                    else:
-                                        print("   ⚠️  Could not parse data URL")
-                                except Exception as e:
-                                    print(f"   ⚠️  Data URL extraction failed: {e}")
-                                    
-                            elif src.startswith("http"):
-                                response = await page.request.get(src)
-                                audio_data = await response.body()
-                                with open(output_path, "wb") as f:
-                                    f.write(audio_data)
-                                print(f"   ✅ Downloaded from audio element!")
-                                downloaded = True
-                            elif src.startswith("blob:"):
-                                print("   ⚠️  Blob URL detected, trying alternative method...")
-                                # Try to use CDP to resolve blob URL
-                                try:
-                                    # Execute JavaScript to fetch blob data
-                                    js_code = f"""
-                                    async function getBlobData() {{
-                                        const response = await fetch('{src}');
-                                        const blob = await response.blob();
-                                        const reader = new FileReader();
-                                        return new Promise((resolve) => {{
-                                            reader.onloadend = () => resolve(reader.result);
-                                            reader.readAsDataURL(blob);
-                                        }});
-                                    }}
-                                    getBlobData();
-                                    """
-                                    base64_data = await page.evaluate(js_code)
-                                    if base64_data:
-                                        # Remove data URL prefix
-                                        import base64
-                                        import re
-                                        match = re.match(r'data:.*?;base64,(.*)', base64_data)
-                                        if match:
-                                            audio_bytes = base64.b64decode(match.group(1))
-                                            with open(output_path, "wb") as f:
-                                                f.write(audio_bytes)
-                                            print(f"   ✅ Downloaded blob via JavaScript!")
-                                            downloaded = True
-                                except Exception as e:
-                                    print(f"   ⚠️  Blob extraction failed: {e}")
+                            except Exception as e:
+                                logger.warning("   ⚠️  Blob extraction failed: %s", e)
                 except Exception as e:
-                    print(f"   ⚠️  Audio element method failed: {e}")
+                    logger.warning("   ⚠️  Audio element method failed: %s", e)
             
             # Check result
             if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
                 size = os.path.getsize(output_path)
-                print(f"\n✅ SUCCESS! Audio generated: {size} bytes")
+                logger.info("\n✅ SUCCESS! Audio generated: %s bytes", size)
                 return output_path
             else:
-                print("\n❌ FAILED: Could not capture audio automatically")
-                print("   Debug info:")
-                print(f"   - Audio URLs captured: {len(audio_urls)}")
-                if audio_urls:
-                    for i, url in enumerate(audio_urls[:3]):
-                        print(f"     {i+1}. {url[:100]}")
+                logger.error("\n❌ FAILED: Could not capture audio automatically")
+                logger.info("   Debug info:")
+                logger.info("   - Audio responses captured: %s", len(audio_responses))
+                for i, response in enumerate(audio_responses[:3]):
+                    logger.info("     %s. %s", i+1, response.url[:100])
                 return None
 
         except Exception as e:
-            print(f"\n❌ Error in VoiceoverAgent: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n❌ Error in VoiceoverAgent: %s", e)
             return None
@@ -0,0 +1,78 @@
+"""
+Asset manifest: one os.scandir pass over the assets dir instead of a glob per
+asset kind plus separate exists/getsize checks. Also the asset report helpers
+the test scripts share.
+"""
+
+import os
+import sys
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Asset lists by file name: key -> (prefix, suffix)
+ASSET_PATTERNS = {
+    "videos": ("video_", ".mp4"),
+    "clips": ("clip_", ".mp4"),
+    "images": ("gen_image_", "_processed.png"),
+    "post_screenshot": ("post_screenshot_", ".png"),
+    "comment_screenshots": ("comment_thread_", ".png"),
+}
+
+
+def file_size(path: str) -> Optional[int]:
+    """Size in bytes, or None if the file doesn't exist (one stat for exists + getsize)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def scan(assets_dir: str, sized: Optional[Iterable[str]] = None) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """
+    One pass over assets_dir: file sizes by name, plus the asset lists by pattern.
+    With `sized`, only those file names are stat'ed and kept in the sizes dict.
+    """
+    sized = None if sized is None else frozenset(sized)
+    sizes = {}
+    found = {key: [] for key in ASSET_PATTERNS}
+    # scandir yields entries lazily; only matching paths (and wanted sizes) are kept
+    with os.scandir(assets_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            if sized is None or name in sized:
+                sizes[name] = entry.stat().st_size  # Stat'ed once, then cached on the DirEntry
+            for key, (prefix, suffix) in ASSET_PATTERNS.items():
+                # Length check: the glob's * can't share characters with prefix/suffix
+                if (name.startswith(prefix) and name.endswith(suffix)
+                        and len(name) >= len(prefix) + len(suffix)):
+                    found[key].append(entry.path)
+                    break
+    return sizes, found
+
+
+async def scan_async(assets_dir: str, sized: Optional[Iterable[str]] = None) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """scan() off the event loop."""
+    return await asyncio.to_thread(scan, assets_dir, sized)
+
+
+def write_report(lines: List[str]):
+    """Print a block of report lines with one stdout write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def report_assets(assets: Dict[str, Any]):
+    """Print `<key>: <file> - ✅/❌` for every path in an assets dict (lists expanded)."""
+    # Flatten to (key, path) in print order, then stat them all at once off the loop
+    checks = []
+    for key, value in assets.items():
+        if value:
+            for path in (value if isinstance(value, list) else [value]):
+                checks.append((key, path))
+    found = await asyncio.gather(*(asyncio.to_thread(os.path.exists, path) for _, path in checks))
+    write_report([
+        f"   {key}: {os.path.basename(path)} - {'✅' if exists else '❌'}"
+        for (key, path), exists in zip(checks, found)
+    ])
@@ -1,6 +1,28 @@
 import asyncio
+import atexit
 import os
-from playwright.async_api import async_playwright, Page, BrowserContext
+from playwright.async_api import async_playwright, Page, BrowserContext, APIRequestContext
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# Installed once per worker tab (runs on every navigation), so the page only has to
+# call it: window.__blobToDataURL(url) -> "data:<mime>;base64,...",
+# window.__blobToBase64(url) -> just the base64 payload
+BLOB_TO_DATA_URL_SCRIPT = """
+window.__blobToDataURL = async (url) => {
+    const blob = await (await fetch(url)).blob();
+    return await new Promise((resolve) => {
+        const reader = new FileReader();
+        reader.onloadend = () => resolve(reader.result);
+        reader.readAsDataURL(blob);
+    });
+};
+window.__blobToBase64 = async (url) => {
+    const dataUrl = await window.__blobToDataURL(url);
+    return dataUrl ? dataUrl.slice(dataUrl.indexOf(",") + 1) : null;
+};
+"""
 
 class BrowserManager:
     _instance = None
@@ -8,61 +30,166 @@ class BrowserManager:
     _browser = None
     _context = None
     _page = None
+    # Reusable worker tabs (see acquire_page)
+    _page_pool = None
+    _pool_size = 0
+    # Serializes the cold start so concurrent agents don't each connect_over_cdp
+    _lock = None
+    # Keep the CDP connection (and Node driver) for the whole process; close() is a
+    # no-op between agents and the real teardown happens at interpreter exit.
+    KEEP_ALIVE = True
+    _loop = None
 
     @classmethod
     async def get_page(cls) -> Page:
+        # Handles are bound to the loop they were created on; a new asyncio.run() reconnects
+        if cls._loop is not None and cls._loop is not asyncio.get_running_loop():
+            cls._reset()
+
         if cls._page:
             return cls._page
 
-        if not cls._playwright:
-            cls._playwright = await async_playwright().start()
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._page:
+                return cls._page
+
+            if not cls._playwright:
+                cls._playwright = await async_playwright().start()
         
-        # Connect to existing Chrome with remote debugging
-        if not cls._browser:
-            print("🔗 Connecting to Chrome (Remote Debugging Port: 9222)...")
+            # Connect to existing Chrome with remote debugging
+            if not cls._browser:
+                logger.info("🔗 Connecting to Chrome (Remote Debugging Port: 9222)...")
             
-            try:
-                # Connect to the Chrome instance with remote debugging
-                cls._browser = await cls._playwright.chromium.connect_over_cdp("http://localhost:9222")
-                print("✅ Successfully connected to Chrome!")
+                try:
+                    # Connect to the Chrome instance with remote debugging
+                    cls._browser = await cls._playwright.chromium.connect_over_cdp("http://localhost:9222")
+                    cls._loop = asyncio.get_running_loop()
+                    logger.info("✅ Successfully connected to Chrome!")
                 
-                # Get the default context
-                contexts = cls._browser.contexts
-                if contexts:
-                    cls._context = contexts[0]
-                else:
-                    print("⚠️  No context found, creating new one...")
-                    cls._context = await cls._browser.new_context()
+                    # Get the default context
+                    contexts = cls._browser.contexts
+                    if contexts:
+                        cls._context = contexts[0]
+                    else:
+                        logger.warning("⚠️  No context found, creating new one...")
+                        cls._context = await cls._browser.new_context()
                     
-            except Exception as e:
-                print(f"\n❌ Failed to connect to Chrome: {e}")
-                print("\n⚠️  Make sure Chrome is running with remote debugging:")
-                print("   /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome \\")
-                print("   --remote-debugging-port=9222 \\")
-                print("   --user-data-dir=\"$HOME/Library/Application Support/Google/Chrome\"")
-                raise
-            
-        if not cls._page:
-            if cls._context and cls._context.pages:
-                cls._page = cls._context.pages[0]
-            else:
-                cls._page = await cls._context.new_page()
+                except Exception as e:
+                    logger.error("\n❌ Failed to connect to Chrome: %s", e)
+                    logger.warning("\n⚠️  Make sure Chrome is running with remote debugging:")
+                    logger.info("   /Applications/Google\\ Chrome.app/Contents/MacOS/Google\\ Chrome \\")
+                    logger.info("   --remote-debugging-port=9222 \\")
+                    logger.info("   --user-data-dir=\"$HOME/Library/Application Support/Google/Chrome\"")
+                    raise
             
+            if not cls._page:
+                if cls._context and cls._context.pages:
+                    cls._page = cls._context.pages[0]
+                else:
+                    cls._page = await cls._context.new_page()
+
         return cls._page
 
     @classmethod
-    async def close(cls):
+    async def new_page(cls) -> Page:
+        """
+        Open a fresh tab in the shared (logged-in) context.
+        Used when several generations run at once, so they don't share one page's DOM.
+        The caller closes it.
+        """
+        await cls.get_page()
+        page = await cls._context.new_page()
+        await page.add_init_script(BLOB_TO_DATA_URL_SCRIPT)
+        return page
+
+    @classmethod
+    async def acquire_page(cls, max_pages: int) -> Page:
+        """
+        Get a worker tab from the pool, opening a new one while fewer than
+        max_pages exist. Hand it back with release_page.
+        """
+        if cls._page_pool is None:
+            cls._page_pool = asyncio.Queue()
+        if cls._page_pool.empty() and cls._pool_size < max_pages:
+            cls._pool_size += 1
+            try:
+                return await cls.new_page()
+            except Exception:
+                cls._pool_size -= 1
+                raise
+        return await cls._page_pool.get()
+
+    @classmethod
+    async def release_page(cls, page: Page, reusable: bool = True):
+        """Return a worker tab to the pool, or close it if its state can't be trusted."""
+        if reusable and not page.is_closed():
+            cls._page_pool.put_nowait(page)
+            return
+        cls._pool_size -= 1
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    @classmethod
+    async def api_request(cls) -> APIRequestContext:
+        """
+        HTTP client of the shared context, for downloads. One per context, so its
+        connections outlive the per-generation tabs; it also carries the context's
+        cookies, which a standalone playwright.request context would not.
+        """
+        await cls.get_page()
+        return cls._context.request
+
+    @classmethod
+    async def close(cls, force: bool = False):
+        """
+        Disconnect from Chrome. With KEEP_ALIVE this only happens when forced (at exit),
+        so agents shouldn't close between steps; the next get_page() reuses the connection.
+        """
+        if cls.KEEP_ALIVE and not force:
+            return
+
         # Don't close context or browser when using CDP
-        # Just disconnect
+        # Just disconnect (after closing our own worker tabs)
+        while cls._page_pool is not None and not cls._page_pool.empty():
+            page = cls._page_pool.get_nowait()
+            try:
+                await page.close()
+            except Exception:
+                pass
         if cls._browser:
             await cls._browser.close()
         if cls._playwright:
             await cls._playwright.stop()
         
+        cls._reset()
+
+    @classmethod
+    def _reset(cls):
         cls._page = None
+        cls._page_pool = None
+        cls._pool_size = 0
         cls._context = None
         cls._browser = None
         cls._playwright = None
+        cls._lock = None
+        cls._loop = None
+
+    @classmethod
+    def _close_at_exit(cls):
+        """Forced teardown on interpreter exit, if the owning loop can still run it."""
+        loop = cls._loop
+        if loop is None or loop.is_closed() or loop.is_running():
+            # Loop already gone: the driver process exits with us and CDP never owned Chrome
+            return
+        try:
+            loop.run_until_complete(cls.close(force=True))
+        except Exception:
+            pass
 
     @classmethod
     async def ensure_logged_in(cls, url: str = "https://aistudio.google.com/"):
@@ -70,3 +197,6 @@ class BrowserManager:
         page = await cls.get_page()
         # Just return the page, assume user already logged in via Chrome
         return page
+
+
+atexit.register(BrowserManager._close_at_exit)
@@ -0,0 +1,67 @@
+import asyncio
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright, BrowserContext
+
+class BrowserPool:
+    """
+    Shared headless Chromium for scraping.
+    Launching the browser is the expensive part, so it is started once and
+    every scrape only opens (and closes) a page. Concurrent pages are bounded
+    by a semaphore.
+    """
+    concurrency = 3
+
+    _playwright = None
+    _browser = None
+    _context = None
+    _semaphore = None
+    _lock = None
+
+    @classmethod
+    async def get_context(cls, **context_options) -> BrowserContext:
+        """Return the shared context, launching the browser on first use."""
+        if cls._context:
+            return cls._context
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._context:
+                return cls._context
+
+            if not cls._playwright:
+                cls._playwright = await async_playwright().start()
+
+            if not cls._browser:
+                print("🌐 Launching headless Chromium (shared)...")
+                cls._browser = await cls._playwright.chromium.launch(headless=True)
+
+            cls._context = await cls._browser.new_context(**context_options)
+
+        return cls._context
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls):
+        """Bound the number of pages open at the same time."""
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(cls.concurrency)
+
+        async with cls._semaphore:
+            yield
+
+    @classmethod
+    async def close(cls):
+        if cls._context:
+            await cls._context.close()
+        if cls._browser:
+            await cls._browser.close()
+        if cls._playwright:
+            await cls._playwright.stop()
+
+        cls._context = None
+        cls._browser = None
+        cls._playwright = None
+        cls._semaphore = None
+        cls._lock = None
@@ -3,46 +3,121 @@ Caption Validator - Aligns SRT captions with original script using Gemini
 """
 
 import os
+import json
 import srt
 from datetime import timedelta
+from itertools import accumulate
 import google.generativeai as genai
 from typing import List, Tuple
 
+VALIDATOR_MODEL = "models/gemini-flash-latest"
+
+# One corrected string per input caption, same order
+_SPANS_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": list[str],
+}
+
+# model_name -> GenerativeModel, so new validators skip configure + client setup.
+# `genai.configure` is process-global, so models can't be per key: the first
+# validator's key configures it, and later validators share that model.
+_MODEL_CACHE = {}
+
+
+def _get_model(api_key: str, model_name: str = VALIDATOR_MODEL):
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        if not _MODEL_CACHE:
+            genai.configure(api_key=api_key)
+        model = _MODEL_CACHE[model_name] = genai.GenerativeModel(model_name)
+    return model
+
+
 class CaptionValidator:
     def __init__(self, api_key: str):
         self.api_key = api_key
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel("models/gemini-flash-latest")
+        self.model = _get_model(self.api_key)
     
     def validate_and_correct(self, srt_path: str, original_script: str) -> str:
         """
         Validates SRT captions against original script and corrects mismatches.
         Returns path to corrected SRT file.
         """
-        print("📝 Validating captions against script...")
-        
         # 1. Parse existing SRT
         with open(srt_path, 'r', encoding='utf-8') as f:
             srt_content = f.read()
         
         subtitles = list(srt.parse(srt_content))
         
-        # 2. Extract SRT text
-        srt_text = " ".join([sub.content for sub in subtitles])
-        
-        # 3. Use Gemini to align
-        corrected_text = self._align_with_gemini(srt_text, original_script)
+        output_path, _ = self.validate_and_correct_subs(subtitles, original_script, srt_path)
+        return output_path
+    
+    def validate_and_correct_subs(self, subtitles: List, original_script: str, srt_path: str) -> Tuple[str, List]:
+        """
+        Same as validate_and_correct, for captions that are already parsed.
+        Only the corrected file is written. Returns (corrected_path, corrected_subtitles).
+        """
+        print("📝 Validating captions against script...")
         
-        # 4. Rebuild SRT with corrected text
-        corrected_srt = self._rebuild_srt(subtitles, corrected_text, original_script)
+        # 2-3. Correct caption by caption, so each keeps its own timing
+        corrected = self._align_spans_with_gemini(subtitles, original_script)
+        
+        if corrected is not None:
+            # 4. Same subtitles, corrected content (empty answers keep the original)
+            corrected_subs = [
+                srt.Subtitle(index=sub.index, start=sub.start, end=sub.end,
+                             content=text.strip() or sub.content)
+                for sub, text in zip(subtitles, corrected)
+            ]
+        else:
+            # Fallback: correct the joined text and redistribute words by count
+            srt_text = " ".join([sub.content for sub in subtitles])
+            corrected_text = self._align_with_gemini(srt_text, original_script)
+            corrected_subs = self._rebuild_subs(subtitles, corrected_text)
         
         # 5. Save corrected SRT
         output_path = srt_path.replace(".srt", "_validated.srt")
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(corrected_srt)
+            f.write(srt.compose(corrected_subs))
         
         print(f"   ✅ Validated captions saved to: {os.path.basename(output_path)}")
-        return output_path
+        return output_path, corrected_subs
+    
+    def _align_spans_with_gemini(self, subtitles: List, script: str):
+        """
+        Correct each caption against the script. Returns one string per subtitle,
+        or None if the answer can't be mapped 1:1 (caller falls back to _align_with_gemini).
+        """
+        lines = "\n".join(f"{i}: {sub.content}" for i, sub in enumerate(subtitles))
+        prompt = f"""
+        Kamu adalah expert transcription validator. 
+        
+        SCRIPT ASLI (yang benar):
+        {script}
+        
+        TRANSCRIPTION (dari Whisper, per caption, format "nomor: teks"):
+        {lines}
+        
+        TUGAS:
+        1. Perbaiki kata-kata yang salah di setiap caption berdasarkan script asli
+        2. Pastikan nama brand, istilah teknis, dan kata kunci penting (seperti "Red Bull", "slackline", dll) PERSIS seperti di script
+        3. Jangan pindahkan kata antar caption, jangan gabung atau pecah caption
+        
+        Output: JSON array berisi {len(subtitles)} string, satu per caption sesuai urutan nomor (tanpa nomor).
+        """
+        
+        try:
+            response = self.model.generate_content(prompt, generation_config=_SPANS_CONFIG)
+            corrected = json.loads(response.text)
+        except Exception as e:
+            print(f"   ⚠️ Gemini caption alignment error: {e}")
+            return None
+        
+        if not isinstance(corrected, list) or len(corrected) != len(subtitles) \
+                or not all(isinstance(text, str) for text in corrected):
+            print("   ⚠️ Caption count mismatch in Gemini answer, using text alignment")
+            return None
+        return corrected
     
     def _align_with_gemini(self, srt_text: str, script: str) -> str:
         """Use Gemini to correct SRT text based on script."""
@@ -86,35 +161,31 @@ class CaptionValidator:
         """
         Rebuild SRT file with corrected text while preserving timing.
         """
-        # Split corrected text into words
+        return srt.compose(self._rebuild_subs(original_subs, corrected_text))
+    
+    def _rebuild_subs(self, original_subs: List, corrected_text: str) -> List:
+        """
+        Rebuild subtitles with corrected text while preserving timing.
+        """
+        if not original_subs:
+            return []
         corrected_words = corrected_text.split()
         
-        # Calculate words per subtitle (average)
-        total_subs = len(original_subs)
-        words_per_sub = max(1, len(corrected_words) // total_subs)
+        # Word boundaries from cumulative original word counts; the last
+        # subtitle gets whatever words remain
+        ends = list(accumulate(len(sub.content.split()) for sub in original_subs))
+        starts = [0] + ends[:-1]
+        ends[-1] = len(corrected_words)
         
-        # Rebuild subtitles
+        # Rebuild subtitles with corrected text but original timing
         new_subtitles = []
-        word_index = 0
-        
-        for i, original_sub in enumerate(original_subs):
-            # Determine how many words for this subtitle
-            if i == total_subs - 1:
-                # Last subtitle gets remaining words
-                sub_words = corrected_words[word_index:]
-            else:
-                # Try to match original word count
-                original_word_count = len(original_sub.content.split())
-                sub_words = corrected_words[word_index:word_index + original_word_count]
-                word_index += original_word_count
-            
-            # Create new subtitle with corrected text but original timing
-            new_sub = srt.Subtitle(
+        for original_sub, start, end in zip(original_subs, starts, ends):
+            sub_words = corrected_words[start:end]
+            new_subtitles.append(srt.Subtitle(
                 index=original_sub.index,
                 start=original_sub.start,
                 end=original_sub.end,
                 content=" ".join(sub_words) if sub_words else original_sub.content
-            )
-            new_subtitles.append(new_sub)
+            ))
         
-        return srt.compose(new_subtitles)
+        return new_subtitles
@@ -4,20 +4,47 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
-import random
+import time
+import itertools
+import threading
+from pathlib import Path
+from dataclasses import dataclass
 from typing import List
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@dataclass(frozen=True)
+class _AssetPaths:
+    """Fixed files in the assets dir, joined once (see Config.PATHS)."""
+    VOICEOVER: str
+    CAPTIONS: str
+    TIMELINE: str
+
 class Config:
-    _GEMINI_KEYS = os.getenv("GEMINI_API_KEYS", "").split(",")
+    _GEMINI_KEYS = tuple(k.strip() for k in os.getenv("GEMINI_API_KEYS", "").split(",") if k.strip())
+    # Round-robin over the keys (shared by every agent and thread in the process)
+    _GEMINI_CYCLE = itertools.cycle(_GEMINI_KEYS)
+    _GEMINI_LOCK = threading.Lock()
+    _GEMINI_EXHAUSTED = {}  # key -> monotonic time it may be used again
+    KEY_COOLDOWN = 60  # seconds a quota-hit key is skipped
     PIXABAY_API_KEY = os.getenv("PIXABAY_API_KEY")
     
-    # Paths
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    ASSETS_DIR = os.path.join(BASE_DIR, "assets")
-    OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+    # Paths (resolved once at import). *_PATH are pathlib.Path; the *_DIR strings are
+    # what the agents join against and use as cache keys, so they stay plain str.
+    BASE_PATH = Path(__file__).resolve().parents[1]
+    ASSETS_PATH = BASE_PATH / "assets"
+    OUTPUT_PATH = BASE_PATH / "output"
+    BASE_DIR = os.fspath(BASE_PATH)
+    ASSETS_DIR = os.fspath(ASSETS_PATH)
+    OUTPUT_DIR = os.fspath(OUTPUT_PATH)
+    ASSETS_PATH.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    PATHS = _AssetPaths(
+        VOICEOVER=os.path.join(ASSETS_DIR, "voiceover.mp3"),
+        CAPTIONS=os.path.join(ASSETS_DIR, "captions.srt"),
+        TIMELINE=os.path.join(ASSETS_DIR, "timeline.json"),
+    )
     
     # Models - Updated to latest/requested
     # Scriptwriter: Using reliable model to avoid rate limits
@@ -46,6 +73,21 @@ class Config:
 
     @staticmethod
     def get_gemini_key() -> str:
-        """Returns a random Gemini API key from the pool."""
-        return random.choice(Config._GEMINI_KEYS).strip()
+        """Returns the next Gemini API key (round-robin), skipping keys marked exhausted."""
+        if not Config._GEMINI_KEYS:
+            return ""
+        with Config._GEMINI_LOCK:
+            now = time.monotonic()
+            for _ in range(len(Config._GEMINI_KEYS)):
+                key = next(Config._GEMINI_CYCLE)
+                if Config._GEMINI_EXHAUSTED.get(key, 0) <= now:
+                    return key
+            # Every key is cooling down; hand out the next one anyway
+            return next(Config._GEMINI_CYCLE)
+
+    @staticmethod
+    def mark_exhausted(key: str, cooldown: float = None):
+        """Skip a key for `cooldown` seconds (default KEY_COOLDOWN), e.g. after a quota error."""
+        with Config._GEMINI_LOCK:
+            Config._GEMINI_EXHAUSTED[key] = time.monotonic() + (cooldown or Config.KEY_COOLDOWN)
 
@@ -0,0 +1,74 @@
+import numpy as np
+
+# numba is optional: with it the scan is a single compiled pass over the image,
+# without it we fall back to the equivalent numpy reductions.
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+DARK_THRESHOLD = 50
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _dark_counts(img, y0, y1):
+        """Count dark pixels per column and per row inside rows [y0, y1)."""
+        height = y1 - y0
+        width = img.shape[1]
+        col_counts = np.zeros(width, dtype=np.int64)
+        row_counts = np.zeros(height, dtype=np.int64)
+
+        # Rows are independent, so each thread owns its row_counts slot
+        for yi in prange(height):
+            y = y0 + yi
+            count = 0
+            for x in range(width):
+                if img[y, x, 0] < 50 and img[y, x, 1] < 50 and img[y, x, 2] < 50:
+                    count += 1
+            row_counts[yi] = count
+
+        # Same for columns (kept as a separate loop to avoid write races)
+        for x in prange(width):
+            count = 0
+            for y in range(y0, y1):
+                if img[y, x, 0] < 50 and img[y, x, 1] < 50 and img[y, x, 2] < 50:
+                    count += 1
+            col_counts[x] = count
+
+        return col_counts, row_counts
+
+    @njit(cache=True)
+    def _first_last_above(counts, thresh):
+        first = -1
+        last = -1
+        for i in range(counts.shape[0]):
+            if counts[i] > thresh:
+                if first == -1:
+                    first = i
+                last = i
+        return first, last
+
+
+def detect_dark_bbox(img, y0, y1, col_thresh, row_thresh):
+    """
+    Find the extent of dark columns/rows between rows y0 and y1.
+    Returns (left, right, top, bottom) in image coordinates, or None.
+    """
+    if HAS_NUMBA:
+        col_counts, row_counts = _dark_counts(np.ascontiguousarray(img), y0, y1)
+        left, right = _first_last_above(col_counts, col_thresh)
+        top, bottom = _first_last_above(row_counts, row_thresh)
+        if left == -1 or top == -1:
+            return None
+        return int(left), int(right), int(top) + y0, int(bottom) + y0
+
+    # Slice the middle band first so rows outside it are never compared
+    middle = img[y0:y1, :, :3]
+    dark_mask = (middle < DARK_THRESHOLD).all(axis=2)
+    dark_cols = np.where(np.count_nonzero(dark_mask, axis=0) > col_thresh)[0]
+    dark_rows = np.where(np.count_nonzero(dark_mask, axis=1) > row_thresh)[0]
+    if len(dark_cols) == 0 or len(dark_rows) == 0:
+        return None
+    return int(dark_cols[0]), int(dark_cols[-1]), int(dark_rows[0]) + y0, int(dark_rows[-1]) + y0
@@ -0,0 +1,45 @@
+"""
+Small on-disk cache for LLM responses: one JSON file per request,
+named by a hash of everything the response depends on.
+"""
+
+import os
+import json
+import time
+import hashlib
+from .config import Config
+
+# Bump to invalidate every cached LLM response (e.g. after a prompt change)
+CACHE_VERSION = "1"
+
+
+def cache_path(*parts: str) -> str:
+    """assets/cache/llm/<hash>.json for a request's inputs."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (CACHE_VERSION, *parts):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return os.path.join(Config.ASSETS_DIR, "cache", "llm", h.hexdigest() + ".json")
+
+
+def cache_get(path: str, max_age: float = None):
+    """Cached value, or None if missing, unreadable or older than max_age seconds."""
+    try:
+        if max_age is not None and time.time() - os.stat(path).st_mtime > max_age:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(path: str, value):
+    # Write to a temp file and rename so a crash never leaves a half-written entry
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"   ⚠️ Could not write LLM cache: {e}")
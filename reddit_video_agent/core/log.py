@@ -0,0 +1,33 @@
+"""
+Console logging for the agents' hot paths.
+Records go through a QueueHandler and are written to stdout by one background
+QueueListener thread, so concurrent tasks never block the event loop on
+terminal writes. Output looks the same as print() (message only).
+"""
+
+import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_queue = queue.SimpleQueue()
+_listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger that writes plain messages to stdout through the shared queue."""
+    global _listener
+    if _listener is None:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(_queue, stream)
+        _listener.start()
+        atexit.register(_listener.stop)  # Flush what's left on exit
+
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
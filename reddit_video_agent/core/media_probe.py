@@ -0,0 +1,38 @@
+"""
+Media durations via ffprobe, cached per (path, mtime).
+One short subprocess per file instead of opening a moviepy reader just for .duration.
+"""
+
+import os
+import subprocess
+from functools import lru_cache
+
+_VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".webm", ".avi"}
+
+
+def duration(path: str) -> float:
+    """Duration of an audio/video file in seconds. Raises if it can't be read."""
+    return _duration(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=1024)
+def _duration(path: str, mtime: float) -> float:
+    # mtime is only part of the key, so a rewritten file is probed again
+    try:
+        out = subprocess.run(
+            ["ffprobe", "-v", "error",
+             "-show_entries", "format=duration",
+             "-of", "default=nw=1:nk=1",
+             path],
+            capture_output=True, text=True, check=True
+        ).stdout
+        return float(out.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        # No ffprobe on PATH / unreadable output: let moviepy read it
+        from moviepy.editor import AudioFileClip, VideoFileClip
+        is_video = os.path.splitext(path)[1].lower() in _VIDEO_EXTENSIONS
+        clip = VideoFileClip(path) if is_video else AudioFileClip(path)
+        try:
+            return clip.duration
+        finally:
+            clip.close()
@@ -6,12 +6,86 @@ Builds precise timeline based on SRT word timestamps and keyword mapping.
 import os
 import re
 import srt
+import heapq
+import numpy as np
+from bisect import bisect_right
+from operator import itemgetter
 from typing import Dict, List, Any
 from datetime import timedelta
 
+from .log import get_logger
+
+# ahocorasick_rs is optional: one automaton pass over the whole transcript for the
+# keyword scan, per-word regex otherwise
+try:
+    import ahocorasick_rs
+except ImportError:
+    ahocorasick_rs = None
+
+logger = get_logger(__name__)
+
+_BY_START = itemgetter("start")
+_REGEX_META = set(r".^$*+?{}[]\|()")
+
+# Transition per keyword group, checked in this order (first group whose word
+# appears anywhere in the keyword wins); bounce_in otherwise
+_TRANSITION_GROUPS = [
+    # Action/Impact keywords -> shake
+    ('shake', ['potong', 'iris', 'tebas', 'slice', 'cut']),
+    # Extreme surprise -> spin
+    ('spin', ['gila', 'sumpah', 'gokil', 'anjay', 'wow']),
+    # Funny/awkward -> wobble
+    ('wobble', ['toxic', 'gagal', 'fail', 'awkward', 'lucu']),
+    # Technical/focus -> zoom_in
+    ('zoom_in', ['fisika', 'geometri', 'physics', 'geometry', 'sudut', 'angle']),
+    # Comments/social -> popup
+    ('popup', ['komentar', 'netizen', 'comment', 'kata', 'bilang']),
+]
+# One compiled alternation per group instead of an any() generator per group
+_TRANSITION_RES = [
+    (transition, re.compile("|".join(map(re.escape, words))))
+    for transition, words in _TRANSITION_GROUPS
+]
+
+
+def _literal_alternatives(pattern: str):
+    """
+    Lowercase literals of a plain `a|b|c` pattern (optionally in one group), or None
+    if it uses any other regex syntax. Words are already lowercased, so `lit in word`
+    is the same test the case-insensitive regex made.
+    """
+    body = pattern[1:-1] if pattern.startswith('(') and pattern.endswith(')') else pattern
+    alternatives = body.split('|')
+    if any(not alt or any(c in _REGEX_META for c in alt) for alt in alternatives):
+        return None
+    return tuple(alt.lower() for alt in alternatives)
+
+
+def _layer_type(asset_name: str) -> str:
+    if "clip" in asset_name:
+        return "video_clip"
+    if "comment" in asset_name or "screenshot" in asset_name:
+        return "screenshot"
+    return "ai_image"
+
+
+def _asset_entry(path: str):
+    """(path, asset_name, layer_type) for a pooled asset."""
+    name = os.path.basename(path)
+    return (path, name, _layer_type(name))
+
+
+def _transition_for(keyword_lower: str) -> str:
+    for transition, pattern in _TRANSITION_RES:
+        if pattern.search(keyword_lower):
+            return transition
+    # Default: bounce_in (energetic and safe)
+    return 'bounce_in'
+
 class AudioDrivenTimelineBuilder:
     def __init__(self):
-        # Keyword to asset type mapping
+        # Keyword to asset type mapping. Patterns are written in lowercase and
+        # matched case-sensitively against the pre-lowered words from parse_srt_to_words.
         self.keyword_map = {
             # Weapon/Action keywords
             r'bokken|pedang|katana|sword': 'sword_visual',
@@ -30,56 +104,118 @@ class AudioDrivenTimelineBuilder:
             r'^(gila|wow|halo|guys|kalian)': 'intro_hook',  # First words
             r'(subscribe|like|comment|jangan lupa)': 'outro_cta',  # CTA words
         }
+        
+        self._asset_types = list(dict.fromkeys(self.keyword_map.values()))
+        # Lowercased keyword -> transition. Seeded with the group words themselves, so
+        # exact keywords are one dict lookup; other words are added on first use.
+        self._transition_cache = {
+            word: _transition_for(word) for _, words in _TRANSITION_GROUPS for word in words
+        }
+        
+        # Per pattern, in keyword_map order: plain alternations become a tuple of
+        # literals (substring test, no regex engine); the rest are compiled once.
+        # The union rejects non-keyword words with a single search.
+        self._matchers = []
+        for pattern, asset_type in self.keyword_map.items():
+            literals = _literal_alternatives(pattern)
+            if literals is not None:
+                self._matchers.append((literals, None, asset_type))
+            else:
+                self._matchers.append((None, re.compile(pattern.encode()), asset_type))
+        # Regexes run on the UTF-8 bytes of each word (no Unicode range handling in
+        # the matcher); fine for the keyword patterns, which are plain lowercase text
+        self._union = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.keyword_map).encode()
+        )
+        self._ac = self._build_automaton() if ahocorasick_rs is not None else None
     
-    def parse_srt_to_words(self, srt_path: str) -> List[Dict]:
+    def _build_automaton(self):
         """
-        Parse SRT file to get word-level timestamps.
-        Returns: [{"word": "gila", "start": 0.5, "end": 0.8}, ...]
+        Aho-Corasick over the literal alternatives of keyword_map. Each literal maps
+        to its (asset_type, anchored) targets; a '^' pattern only counts at word start.
         """
-        words = []
-        
+        targets = {}
+        for pattern, asset_type in self.keyword_map.items():
+            anchored = pattern.startswith('^')
+            for literal in pattern.lstrip('^').strip('()').split('|'):
+                targets.setdefault(literal.lower(), []).append((asset_type, anchored))
+        self._ac_literals = list(targets)
+        self._ac_targets = [targets[literal] for literal in self._ac_literals]
+        return ahocorasick_rs.AhoCorasick(self._ac_literals)
+    
+    def parse_srt_to_words(self, srt_path: str) -> Dict[str, Any]:
+        """
+        Parse SRT file to get word-level timestamps, as parallel columns.
+        Returns: {"word": ["gila", ...], "start": array([0.5, ...]), "end": array([0.8, ...])}
+        """
+        words = {"word": [], "start": np.empty(0), "end": np.empty(0)}
+        
+        # Per subtitle: its words, start and per-word duration; the timestamp math
+        # then runs once over all words in numpy. The generator is consumed as it's
+        # read and the file text has no other reference, so neither a list of
+        # Subtitles nor the raw text outlives this loop.
+        text_words = []
+        sub_starts = []
+        time_per_word = []
+        counts = []
         with open(srt_path, 'r', encoding='utf-8') as f:
-            srt_content = f.read()
-        
-        subtitles = list(srt.parse(srt_content))
-        
+            subtitles = srt.parse(f.read())
         for sub in subtitles:
-            # Split subtitle into words
-            text_words = sub.content.split()
-            word_count = len(text_words)
-            
-            if word_count == 0:
+            sub_words = sub.content.split()
+            if not sub_words:
                 continue
-            
-            # Calculate time per word
-            sub_duration = (sub.end - sub.start).total_seconds()
-            time_per_word = sub_duration / word_count
-            
-            for i, word in enumerate(text_words):
-                start_time = sub.start.total_seconds() + (i * time_per_word)
-                end_time = start_time + time_per_word
-                
-                words.append({
-                    "word": word.lower(),
-                    "original": word,
-                    "start": start_time,
-                    "end": end_time
-                })
-        
-        return words
+            start = sub.start.total_seconds()
+            text_words.extend(sub_words)
+            sub_starts.append(start)
+            time_per_word.append((sub.end - sub.start).total_seconds() / len(sub_words))
+            counts.append(len(sub_words))
+        del subtitles
+        
+        if not text_words:
+            return words
+        
+        counts = np.asarray(counts)
+        # Position of each word inside its subtitle: 0..n-1 per subtitle
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        per_word = np.repeat(time_per_word, counts)
+        starts = np.repeat(sub_starts, counts) + offsets * per_word
+        ends = starts + per_word
+        
+        # Only the lowercased text is used downstream, so the original casing is dropped
+        return {"word": [word.lower() for word in text_words], "start": starts, "end": ends}
+    
+    @staticmethod
+    def _word_info(words: Dict[str, Any], index: int) -> Dict:
+        """Row view of one word, built only for the words that matched."""
+        return {
+            "word": words["word"][index],
+            "start": float(words["start"][index]),
+            "end": float(words["end"][index]),
+        }
     
-    def match_keywords(self, words: List[Dict]) -> List[Dict]:
+    def match_keywords(self, words: Dict[str, Any]) -> List[Dict]:
         """
-        Match keywords in words to asset types.
+        Match keywords in words to asset types. Takes the columns returned by
+        parse_srt_to_words (the "word" column is already lowercase).
         Returns: [{"keyword": "bokken", "asset_type": "sword_visual", "timestamp": 5.2}, ...]
         """
+        if self._ac is not None:
+            return self._match_keywords_ac(words)
+        
         matches = []
         
-        for word_info in words:
-            word = word_info["word"]
+        for i, word in enumerate(words["word"]):
+            word_bytes = word.encode()
+            if not self._union.search(word_bytes):
+                continue
             
-            for pattern, asset_type in self.keyword_map.items():
-                if re.search(pattern, word, re.IGNORECASE):
+            # A word can trigger several types (e.g. "gila": reaction + intro hook)
+            word_info = None
+            for literals, pattern, asset_type in self._matchers:
+                if (any(lit in word for lit in literals) if literals is not None
+                        else pattern.search(word_bytes)):
+                    if word_info is None:
+                        word_info = self._word_info(words, i)
                     matches.append({
                         "keyword": word,
                         "asset_type": asset_type,
@@ -89,6 +225,41 @@ class AudioDrivenTimelineBuilder:
         
         return matches
     
+    def _match_keywords_ac(self, words: Dict[str, Any]) -> List[Dict]:
+        """match_keywords in one automaton pass over the joined (lowercased) words."""
+        word_list = words["word"]
+        starts = []
+        offset = 0
+        for word in word_list:
+            starts.append(offset)
+            offset += len(word) + 1
+        text = " ".join(word_list)
+        
+        # word index -> asset types it triggered
+        hits = {}
+        for literal_index, start, end in self._ac.find_matches_as_indexes(text, overlapping=True):
+            word_index = bisect_right(starts, start) - 1
+            word_start = starts[word_index]
+            if end > word_start + len(word_list[word_index]):
+                continue  # Spans two words; the per-word scan never sees these
+            for asset_type, anchored in self._ac_targets[literal_index]:
+                if not anchored or start == word_start:
+                    hits.setdefault(word_index, set()).add(asset_type)
+        
+        # Same order as the regex scan: by word, then by keyword_map order
+        matches = []
+        for word_index in sorted(hits):
+            word_info = self._word_info(words, word_index)
+            for asset_type in self._asset_types:
+                if asset_type in hits[word_index]:
+                    matches.append({
+                        "keyword": word_info["word"],
+                        "asset_type": asset_type,
+                        "timestamp": word_info["start"],
+                        "word_info": word_info
+                    })
+        return matches
+    
     def build_timeline(
         self, 
         srt_path: str, 
@@ -98,15 +269,15 @@ class AudioDrivenTimelineBuilder:
         """
         Build timeline based on audio timestamps and available assets.
         """
-        print("🎯 Building Audio-Driven Timeline...")
+        logger.info("🎯 Building Audio-Driven Timeline...")
         
         # Parse SRT
         words = self.parse_srt_to_words(srt_path)
-        print(f"   Parsed {len(words)} words from SRT")
+        logger.info("   Parsed %d words from SRT", len(words["word"]))
         
         # Match keywords
         keyword_matches = self.match_keywords(words)
-        print(f"   Found {len(keyword_matches)} keyword matches")
+        logger.info("   Found %d keyword matches", len(keyword_matches))
         
         # Build timeline layers
         timeline = {
@@ -127,69 +298,89 @@ class AudioDrivenTimelineBuilder:
             })
         
         # Rule 2: Map keyword matches to assets
-        used_assets = set()
         
-        for match in keyword_matches:
+        # Asset pools are loop-invariant: filter, lowercase, basename and classify
+        # once, not per match. Every distinct path gets one index into all_assets,
+        # whose entries are (path, asset_name, layer_type); pools hold indices.
+        all_assets = []
+        index_of = {}
+        
+        def pooled(path):
+            idx = index_of.get(path)
+            if idx is None:
+                idx = index_of[path] = len(all_assets)
+                all_assets.append(_asset_entry(path))
+            return idx
+        
+        images = [pooled(img) for img in assets.get("images", [])]
+        images_lower = [(idx, all_assets[idx][0].lower()) for idx in images]
+        sword_images = [idx for idx, low in images_lower if "bokken" in low or "sword" in low]
+        reaction_images = [idx for idx, low in images_lower if "shock" in low or "face" in low]
+        comment_shots = [pooled(shot) for shot in assets.get("comment_screenshots", [])]
+        
+        # Used flags per asset index (a bitmap instead of a set of path strings)
+        used = bytearray(len(all_assets))
+        action_clip = assets.get("video_clips", {}).get("action")
+        if action_clip is not None:
+            clip_path = action_clip.get("path") if isinstance(action_clip, dict) else action_clip
+            action_entry = (clip_path, "clip_action", _layer_type("clip_action"))
+        else:
+            action_entry = None
+        
+        # Assets are never unmarked, so "first unused" pointers never move back
+        next_unused = {"comments": 0, "images": 0}
+        
+        def first_unused(pool_name, pool):
+            i = next_unused[pool_name]
+            while i < len(pool) and used[pool[i]]:
+                i += 1
+            next_unused[pool_name] = i
+            return pool[i] if i < len(pool) else None
+        
+        # Place every asset 0.5s BEFORE its keyword is spoken (anticipation), never
+        # over the intro, shown for 4 seconds: one vector clamp for all matches
+        timestamps = np.array([match["timestamp"] for match in keyword_matches], dtype=float)
+        starts = np.clip(timestamps - 0.5, 5.0, None)
+        ends = np.minimum(starts + 4.0, total_duration)
+        
+        for match, start, end in zip(keyword_matches, starts.tolist(), ends.tolist()):
             asset_type = match["asset_type"]
             timestamp = match["timestamp"]
             
             # Determine which asset to use
-            asset_path = None
-            asset_name = None
+            idx = None
+            entry = None
             
             if asset_type == "sword_visual":
                 # Use AI image of sword
-                sword_images = [img for img in assets.get("images", []) if "bokken" in img.lower() or "sword" in img.lower()]
-                if sword_images and sword_images[0] not in used_assets:
-                    asset_path = sword_images[0]
-                    asset_name = os.path.basename(asset_path)
-                    used_assets.add(asset_path)
+                if sword_images and not used[sword_images[0]]:
+                    idx = sword_images[0]
             
             elif asset_type == "action_clip":
-                # Use action video clip
-                if "action" in assets.get("video_clips", {}):
-                    clip_info = assets["video_clips"]["action"]
-                    asset_path = clip_info.get("path") if isinstance(clip_info, dict) else clip_info
-                    asset_name = "clip_action"
+                # Use action video clip (not pooled: it may repeat)
+                entry = action_entry
             
             elif asset_type == "comment_screenshot":
                 # Use next available comment screenshot
-                comment_shots = assets.get("comment_screenshots", [])
-                available = [c for c in comment_shots if c not in used_assets]
-                if available:
-                    asset_path = available[0]
-                    asset_name = os.path.basename(asset_path)
-                    used_assets.add(asset_path)
+                idx = first_unused("comments", comment_shots)
             
             elif asset_type == "reaction_image":
                 # Use shocked face image
-                reaction_images = [img for img in assets.get("images", []) if "shock" in img.lower() or "face" in img.lower()]
-                if reaction_images and reaction_images[0] not in used_assets:
-                    asset_path = reaction_images[0]
-                    asset_name = os.path.basename(asset_path)
-                    used_assets.add(asset_path)
+                if reaction_images and not used[reaction_images[0]]:
+                    idx = reaction_images[0]
             
             elif asset_type == "technical_image":
                 # Use technical/physics image
-                tech_images = [img for img in assets.get("images", []) if img not in used_assets]
-                if tech_images:
-                    asset_path = tech_images[0]
-                    asset_name = os.path.basename(asset_path)
-                    used_assets.add(asset_path)
+                idx = first_unused("images", images)
+            
+            if idx is not None:
+                entry = all_assets[idx]
             
             # Add to timeline if asset found
-            if asset_path:
-                # Place asset 0.5s BEFORE keyword is spoken (anticipation)
-                start = max(5.0, timestamp - 0.5)  # Don't overlap with intro
-                end = min(total_duration, start + 4.0)  # Show for 4 seconds
-                
-                # Determine layer type
-                if "clip" in asset_name:
-                    layer_type = "video_clip"
-                elif "comment" in asset_name or "screenshot" in asset_name:
-                    layer_type = "screenshot"
-                else:
-                    layer_type = "ai_image"
+            if entry and entry[0]:
+                asset_path, asset_name, layer_type = entry
+                if idx is not None:
+                    used[idx] = 1
                 
                 # INTELLIGENT TRANSITION SELECTION based on keyword context
                 transition = self._select_transition(match['keyword'], asset_type)
@@ -206,19 +397,18 @@ class AudioDrivenTimelineBuilder:
                 })
         
         # Rule 3: Fill remaining gaps with unused assets
-        timeline = self._fill_gaps(timeline, assets, used_assets)
-        
-        # Rule 4: Validate and resolve conflicts
-        timeline = self._validate_timeline(timeline)
+        # Rule 4: Validate and resolve conflicts (same pass, see _fill_gaps)
+        unused_images = [all_assets[idx] for idx in images if not used[idx]]
+        timeline = self._fill_gaps(timeline, unused_images)
         
-        print(f"   ✅ Built timeline with {len(timeline['layers'])} layers")
+        logger.info("   ✅ Built timeline with %d layers", len(timeline["layers"]))
         return timeline
     
     def add_sfx_markers(self, timeline: Dict, keywords: List[Dict]):
         """
         Add SFX markers to timeline layers.
         """
-        print("   🔊 Adding SFX markers...")
+        logger.info("   🔊 Adding SFX markers...")
         
         # 1. Transition SFX (Whoosh) for every image
         for layer in timeline["layers"]:
@@ -244,13 +434,13 @@ class AudioDrivenTimelineBuilder:
         
         return timeline
     
-    def _fill_gaps(self, timeline: Dict, assets: Dict, used_assets: set) -> Dict:
-        """Fill gaps in timeline with unused assets."""
+    def _fill_gaps(self, timeline: Dict, unused_images: List[tuple]) -> Dict:
+        """Fill gaps in timeline with unused images ((path, asset_name, layer_type) entries)."""
         layers = timeline["layers"]
         total_duration = timeline["total_duration"]
         
         # Sort layers by start time
-        layers.sort(key=lambda x: x["start"])
+        layers.sort(key=_BY_START)
         
         # Find gaps
         gaps = []
@@ -266,24 +456,27 @@ class AudioDrivenTimelineBuilder:
             gaps.append((current_time, total_duration))
         
         # Fill gaps with unused images
-        unused_images = [img for img in assets.get("images", []) if img not in used_assets]
-        
+        fillers = []
         for i, (gap_start, gap_end) in enumerate(gaps):
             if i < len(unused_images):
                 gap_duration = gap_end - gap_start
                 display_duration = min(gap_duration, 3.0)
+                image_path, image_name, _ = unused_images[i]
                 
-                layers.append({
+                fillers.append({
                     "type": "ai_image",
-                    "asset_name": os.path.basename(unused_images[i]),
-                    "asset_path": unused_images[i],
+                    "asset_name": image_name,
+                    "asset_path": image_path,
                     "start": gap_start,
                     "end": gap_start + display_duration,
                     "position": "center",
                     "reason": f"Fill gap {gap_start:.1f}s-{gap_end:.1f}s"
                 })
         
-        timeline["layers"] = layers
+        # Fillers come out in start order too, so a merge replaces append + re-sort
+        # (ties keep the existing layer first, as the stable sort did)
+        merged = list(heapq.merge(layers, fillers, key=_BY_START))
+        timeline["layers"] = self._resolve_overlaps(merged)
         return timeline
     
     def _validate_timeline(self, timeline: Dict) -> Dict:
@@ -291,31 +484,35 @@ class AudioDrivenTimelineBuilder:
         layers = timeline["layers"]
         
         # Sort by start time
-        layers.sort(key=lambda x: x["start"])
+        layers.sort(key=_BY_START)
         
-        # Remove overlaps (keep first layer, trim second)
-        validated = []
-        
-        for i, layer in enumerate(layers):
-            if i == 0:
-                validated.append(layer)
-                continue
-            
-            prev_layer = validated[-1]
+        timeline["layers"] = self._resolve_overlaps(layers)
+        return timeline
+    
+    def _resolve_overlaps(self, layers: List[Dict]) -> List[Dict]:
+        """
+        Walk layers in start order: keep first layer, trim the next (drop if < 1s).
+        Compacts the list in place (write index w) and returns it.
+        """
+        w = 1
+        for r in range(1, len(layers)):
+            layer = layers[r]
+            prev_end = layers[w - 1]["end"]
             
             # Check overlap
-            if layer["start"] < prev_layer["end"]:
+            if layer["start"] < prev_end:
                 # Trim current layer to start after previous
-                layer["start"] = prev_layer["end"]
+                layer["start"] = prev_end
                 
                 # Skip if too short
                 if layer["end"] - layer["start"] < 1.0:
                     continue
             
-            validated.append(layer)
+            layers[w] = layer
+            w += 1
         
-        timeline["layers"] = validated
-        return timeline
+        del layers[w:]
+        return layers
     
     def _select_transition(self, keyword: str, asset_type: str) -> str:
         """
@@ -331,26 +528,7 @@ class AudioDrivenTimelineBuilder:
         - fade_in: Calm, informative (default fallback)
         """
         keyword_lower = keyword.lower()
-        
-        # Action/Impact keywords -> shake
-        if any(word in keyword_lower for word in ['potong', 'iris', 'tebas', 'slice', 'cut']):
-            return 'shake'
-        
-        # Extreme surprise -> spin
-        if any(word in keyword_lower for word in ['gila', 'sumpah', 'gokil', 'anjay', 'wow']):
-            return 'spin'
-        
-        # Funny/awkward -> wobble
-        if any(word in keyword_lower for word in ['toxic', 'gagal', 'fail', 'awkward', 'lucu']):
-            return 'wobble'
-        
-        # Technical/focus -> zoom_in
-        if any(word in keyword_lower for word in ['fisika', 'geometri', 'physics', 'geometry', 'sudut', 'angle']):
-            return 'zoom_in'
-        
-        # Comments/social -> popup
-        if any(word in keyword_lower for word in ['komentar', 'netizen', 'comment', 'kata', 'bilang']):
-            return 'popup'
-        
-        # Default: bounce_in (energetic and safe)
-        return 'bounce_in'
+        transition = self._transition_cache.get(keyword_lower)
+        if transition is None:
+            transition = self._transition_cache[keyword_lower] = _transition_for(keyword_lower)
+        return transition
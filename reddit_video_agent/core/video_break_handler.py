@@ -3,7 +3,14 @@ Video Break Handler - Parses script with VIDEO_BREAK markers and manages audio s
 """
 
 import re
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional
+from .media_probe import duration as media_duration
+
+_BREAK_RE = re.compile(r'\[VIDEO_BREAK:\s*duration=(\d+(?:-\d+)?s?),\s*(?:clip|type)=(\w+)\]')
+# End of a sentence: run of . ! ? plus trailing whitespace
+_SENTENCE_END_RE = re.compile(r'[.!?]+\s*')
 
 class VideoBreakHandler:
     def __init__(self):
@@ -26,9 +33,20 @@ class VideoBreakHandler:
             ]
         }
         """
+        parsed = self._parse_cached(script)
+        # The cached result is shared, so hand out fresh segment dicts (values are
+        # plain str/int, a shallow copy per segment is enough)
+        return {
+            "has_breaks": parsed["has_breaks"],
+            "segments": [dict(segment) for segment in parsed["segments"]]
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_cached(script: str) -> Dict:
+        """parse_script without the copy; pure, so memoized per script text (retries re-parse the same one)."""
         # Find all VIDEO_BREAK markers
-        break_pattern = r'\[VIDEO_BREAK:\s*duration=(\d+(?:-\d+)?s?),\s*(?:clip|type)=(\w+)\]'
-        breaks = list(re.finditer(break_pattern, script))
+        breaks = list(_BREAK_RE.finditer(script))
         
         if not breaks:
             # No breaks found
@@ -49,18 +67,16 @@ class VideoBreakHandler:
             if narration_text:
                 # Split attention cue from main narration
                 # Attention cue = last sentence (ends with ! or ?)
-                sentences = re.split(r'([.!?]+\s*)', narration_text)
-                
-                # Reconstruct sentences
-                full_sentences = []
-                for j in range(0, len(sentences)-1, 2):
-                    if j+1 < len(sentences):
-                        full_sentences.append(sentences[j] + sentences[j+1])
+                # Only the last two sentence ends matter: cue = text between them,
+                # main narration = everything before (text after the last end is dropped)
+                cue_start = cue_end = None
+                for end_match in _SENTENCE_END_RE.finditer(narration_text):
+                    cue_start, cue_end = cue_end, end_match.end()
                 
-                if len(full_sentences) > 1:
+                if cue_start is not None:
                     # Last sentence = attention cue
-                    attention_cue = full_sentences[-1].strip()
-                    main_narration = ''.join(full_sentences[:-1]).strip()
+                    attention_cue = narration_text[cue_start:cue_end].strip()
+                    main_narration = narration_text[:cue_start].strip()
                     
                     # Add main narration
                     if main_narration:
@@ -156,22 +172,30 @@ class VideoBreakHandler:
             "total_duration": 0
         }
         
+        # Probe every file the loop below will place, all at once
+        segments = parsed_script["segments"]
+        narration_count = sum(1 for seg in segments if seg["type"] in ["narration", "attention_cue"])
+        clip_paths = []
+        for segment in segments:
+            if segment["type"] == "video_break":
+                clip_key = segment["break_type"] if segment["break_type"] in video_clips else "action"
+                if clip_key in video_clips:
+                    clip_info = video_clips[clip_key]
+                    clip_paths.append(clip_info.get("path") if isinstance(clip_info, dict) else clip_info)
+        durations = self._probe_durations(list(narration_audio_paths[:narration_count]) + clip_paths)
+        
         current_time = 0
         narration_index = 0
         
-        for segment in parsed_script["segments"]:
+        for segment in segments:
             if segment["type"] in ["narration", "attention_cue"]:
                 # Get corresponding audio file
                 if narration_index < len(narration_audio_paths):
                     audio_path = narration_audio_paths[narration_index]
                     
                     # Get audio duration
-                    from moviepy.editor import AudioFileClip
-                    try:
-                        audio = AudioFileClip(audio_path)
-                        duration = audio.duration
-                        audio.close()
-                    except:
+                    duration = durations.get(audio_path)
+                    if duration is None:
                         duration = 5.0  # Fallback
                     
                     timeline["segments"].append({
@@ -195,15 +219,11 @@ class VideoBreakHandler:
                     clip_path = clip_info.get("path") if isinstance(clip_info, dict) else clip_info
                     
                     # Get video duration (use specified duration or actual clip duration)
-                    from moviepy.editor import VideoFileClip
-                    try:
-                        vid = VideoFileClip(clip_path)
-                        actual_duration = vid.duration
-                        vid.close()
-                        
+                    actual_duration = durations.get(clip_path)
+                    if actual_duration is not None:
                         # Use min of specified duration and actual duration
                         duration = min(segment["duration"], actual_duration)
-                    except:
+                    else:
                         duration = segment["duration"]
                     
                     timeline["segments"].append({
@@ -219,3 +239,19 @@ class VideoBreakHandler:
         
         timeline["total_duration"] = current_time
         return timeline
+    
+    @staticmethod
+    def _probe_durations(paths: List[str]) -> Dict[str, Optional[float]]:
+        """Durations of all paths, probed in parallel (ffprobe subprocesses). None if unreadable."""
+        unique = list(dict.fromkeys(p for p in paths if p))
+        
+        def probe(path):
+            try:
+                return media_duration(path)
+            except Exception:
+                return None
+        
+        if len(unique) <= 1:
+            return {path: probe(path) for path in unique}
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+            return dict(zip(unique, pool.map(probe, unique)))
@@ -26,9 +26,11 @@ async def main():
         # Run
         await director.execute(url)
     finally:
-        # Cleanup Browser
+        # Cleanup Browsers
         from reddit_video_agent.core.browser_manager import BrowserManager
-        await BrowserManager.close()
+        from reddit_video_agent.core.browser_pool import BrowserPool
+        await BrowserManager.close(force=True)  # End of the run, not between agents
+        await BrowserPool.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,15 +1,16 @@
 import asyncio
 import os
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.audio_agent import AudioAgent
 
 async def regenerate_captions():
+    from reddit_video_agent.agents.audio_agent import AudioAgent
+    
     print("🔄 Regenerating captions with Whisper...")
     
     config = {}
     agent = AudioAgent(config)
     
-    audio_path = os.path.join(Config.ASSETS_DIR, "voiceover.mp3")
+    audio_path = Config.PATHS.VOICEOVER
     
     if not os.path.exists(audio_path):
         print("❌ voiceover.mp3 not found!")
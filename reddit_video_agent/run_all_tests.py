@@ -0,0 +1,84 @@
+"""
+Run the test_* scripts in one event loop, concurrently.
+
+Stage 1 runs the generators (scraper, scriptwriter, visual, voiceover) side by
+side, so network and browser waits overlap. Stage 2 runs the checks that read
+what stage 1 wrote to the assets dir (clipper, audio timeline). Rendering
+(test_editor / test_render_only) and the full Director pipeline still run on
+their own: they write the same output files.
+"""
+
+import asyncio
+import time
+import traceback
+from reddit_video_agent.core.browser_manager import BrowserManager
+from reddit_video_agent.core.browser_pool import BrowserPool
+from reddit_video_agent.test_scraper_comments import test_scraper
+from reddit_video_agent.test_scriptwriter import test_scriptwriter
+from reddit_video_agent.test_visual import test_visual
+from reddit_video_agent.test_voiceover import test_voiceover
+from reddit_video_agent.test_clipper import test_clipper
+from reddit_video_agent.test_audio_timeline import test_audio_timeline
+
+# uvloop is optional: a faster event loop for the whole sweep, asyncio's default otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+STAGES = [
+    [test_scraper, test_scriptwriter, test_visual, test_voiceover],
+    [test_clipper, test_audio_timeline],
+]
+
+# At most this many heavy flows at once, so parallel runs don't thrash the shared
+# Chrome (AI Studio tabs) or hit Reddit / API rate limits
+BROWSER_LIMIT = 2
+NET_LIMIT = 4
+BROWSER_TESTS = {test_visual, test_voiceover}
+NET_TESTS = {test_scraper, test_scriptwriter}
+
+async def gated(semaphore, test):
+    if semaphore is None:
+        return await test()
+    async with semaphore:
+        return await test()
+
+async def run_stage(tests, gates):
+    """Run tests concurrently; returns [(test name, exception)] for the ones that raised."""
+    # return_exceptions: one failing test doesn't cancel the others, and its
+    # traceback is printed after the sweep instead of interleaving with live output
+    results = await asyncio.gather(
+        *(gated(gates.get(test), test) for test in tests),
+        return_exceptions=True
+    )
+    return [
+        (test.__name__, result)
+        for test, result in zip(tests, results)
+        if isinstance(result, BaseException)
+    ]
+
+async def main():
+    start = time.perf_counter()
+    browser_sem = asyncio.Semaphore(BROWSER_LIMIT)
+    net_sem = asyncio.Semaphore(NET_LIMIT)
+    gates = {test: browser_sem for test in BROWSER_TESTS}
+    gates.update({test: net_sem for test in NET_TESTS})
+    failures = []
+    try:
+        for tests in STAGES:
+            failures += await run_stage(tests, gates)
+    finally:
+        # One teardown for the whole sweep (the tests share the browsers)
+        await BrowserManager.close(force=True)
+        await BrowserPool.close()
+    
+    for name, error in failures:
+        print(f"\n❌ {name} failed:")
+        traceback.print_exception(type(error), error, error.__traceback__)
+    print(f"\n⏱️  All tests finished in {time.perf_counter() - start:.1f}s ({len(failures)} failed)")
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
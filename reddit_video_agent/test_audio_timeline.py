@@ -1,29 +1,33 @@
 import asyncio
 import os
-import glob
 import json
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.core.timeline_builder import AudioDrivenTimelineBuilder
+from reddit_video_agent.core.asset_manifest import scan_async, write_report
 
 async def test_audio_timeline():
+    from reddit_video_agent.core.timeline_builder import AudioDrivenTimelineBuilder
+    
     print("🎯 Testing Audio-Driven Timeline Builder...")
     
     assets_dir = Config.ASSETS_DIR
     
     # Check required files
-    voiceover = os.path.join(assets_dir, "voiceover.mp3")
-    captions = os.path.join(assets_dir, "captions.srt")
+    voiceover = Config.PATHS.VOICEOVER
+    captions = Config.PATHS.CAPTIONS
+    
+    # One directory scan for the file checks and every asset list
+    sizes, found = await scan_async(assets_dir, sized=("captions.srt", "voiceover.mp3"))
     
-    if not os.path.exists(captions):
+    if "captions.srt" not in sizes:
         print("❌ captions.srt not found!")
         return
     
     # Collect assets
-    video_files = glob.glob(os.path.join(assets_dir, "video_*.mp4"))
-    clip_files = glob.glob(os.path.join(assets_dir, "clip_*.mp4"))
-    image_files = glob.glob(os.path.join(assets_dir, "gen_image_*_processed.png"))
-    post_screenshot = glob.glob(os.path.join(assets_dir, "post_screenshot_*.png"))
-    comment_screenshots = glob.glob(os.path.join(assets_dir, "comment_thread_*.png"))
+    video_files = found["videos"]
+    clip_files = found["clips"]
+    image_files = found["images"]
+    post_screenshot = found["post_screenshot"]
+    comment_screenshots = found["comment_screenshots"]
     
     # Prepare assets dict
     assets = {
@@ -44,7 +48,7 @@ async def test_audio_timeline():
         }
     
     # Get audio duration
-    if os.path.exists(voiceover):
+    if "voiceover.mp3" in sizes:
         from moviepy.editor import AudioFileClip
         audio = AudioFileClip(voiceover)
         duration = audio.duration
@@ -61,14 +65,17 @@ async def test_audio_timeline():
     )
     
     # Display results
+    layers = timeline['layers']
     print(f"\n📊 Timeline Summary:")
     print(f"   Total Duration: {timeline['total_duration']:.2f}s")
-    print(f"   Total Layers: {len(timeline['layers'])}")
+    print(f"   Total Layers: {len(layers)}")
     
     print(f"\n📋 Layer Details:")
-    for i, layer in enumerate(timeline['layers']):
-        print(f"   {i+1}. [{layer['start']:.1f}s-{layer['end']:.1f}s] {layer['type']}: {layer['asset_name']}")
-        print(f"      Reason: {layer['reason']}")
+    details = []
+    for i, layer in enumerate(layers):
+        details.append(f"   {i+1}. [{layer['start']:.1f}s-{layer['end']:.1f}s] {layer['type']}: {layer['asset_name']}")
+        details.append(f"      Reason: {layer['reason']}")
+    write_report(details)
     
     # Save
     output_path = os.path.join(assets_dir, "timeline_audio_driven.json")
@@ -1,9 +1,10 @@
 import asyncio
 import os
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.clipper_agent import ClipperAgent
 
 async def test_clipper():
+    from reddit_video_agent.agents.clipper_agent import ClipperAgent
+    
     print("🧪 Testing Clipper Agent...")
     
     config = {}
@@ -15,19 +16,15 @@ async def test_clipper():
         print("❌ downloaded_video.mp4 not found! Please run scraper test first.")
         return
 
-    try:
-        clips = await agent.execute(video_path)
-        
-        if clips:
-            print("\n✅ Clips created:")
-            for key, path in clips.items():
-                size = os.path.getsize(path)
-                print(f"   - {key}: {os.path.basename(path)} ({size/1024:.2f} KB)")
-        else:
-            print("\n❌ No clips created.")
-            
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
+    clips = await agent.execute(video_path)
+    
+    if clips:
+        print("\n✅ Clips created:")
+        for key, path in clips.items():
+            size = os.path.getsize(path)
+            print(f"   - {key}: {os.path.basename(path)} ({size/1024:.2f} KB)")
+    else:
+        print("\n❌ No clips created.")
 
 if __name__ == "__main__":
     asyncio.run(test_clipper())
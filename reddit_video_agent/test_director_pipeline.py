@@ -1,9 +1,56 @@
 import asyncio
 import json
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.director import Director
+
+# aiofiles is optional: without it the read runs in a worker thread instead
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+async def _read_text(path):
+    """Read a text file without blocking the event loop."""
+    if aiofiles is not None:
+        async with aiofiles.open(path, 'r') as f:
+            return await f.read()
+    def read():
+        with open(path, 'r') as f:
+            return f.read()
+    return await asyncio.to_thread(read)
+
+# ijson is optional: it streams just the summary fields out of timeline.json,
+# without it the whole file is parsed into one dict
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+SUMMARY_LAYERS = 5
+
+def _stream_summary(path):
+    """(total_duration, layer count, first SUMMARY_LAYERS layers), one layer in memory at a time."""
+    with open(path, 'rb') as f:
+        # total_duration is the first key the timeline builder writes, so this stops early
+        total_duration = next(ijson.items(f, 'total_duration', use_float=True), 0)
+        f.seek(0)
+        layer_count = 0
+        first_layers = []
+        for layer in ijson.items(f, 'layers.item', use_float=True):
+            if layer_count < SUMMARY_LAYERS:
+                first_layers.append(layer)
+            layer_count += 1
+    return total_duration, layer_count, first_layers
+
+async def _timeline_summary(path):
+    if ijson is not None:
+        return await asyncio.to_thread(_stream_summary, path)
+    timeline = json.loads(await _read_text(path))
+    layers = timeline.get('layers', [])
+    return timeline.get('total_duration', 0), len(layers), layers[:SUMMARY_LAYERS]
 
 async def test_director_pipeline():
+    from reddit_video_agent.agents.director import Director
+    
     print("🧪 Testing Director 4-Stage Fine-Tuning Pipeline...")
     
     config = {}
@@ -20,20 +67,19 @@ async def test_director_pipeline():
             
             # Check if timeline was created
             import os
-            timeline_path = os.path.join(Config.ASSETS_DIR, "timeline.json")
+            timeline_path = Config.PATHS.TIMELINE
             if os.path.exists(timeline_path):
-                with open(timeline_path, 'r') as f:
-                    timeline = json.load(f)
-                    print(f"\n📋 Timeline Summary:")
-                    print(f"   Total Duration: {timeline.get('total_duration', 0):.2f}s")
-                    print(f"   Layers: {len(timeline.get('layers', []))}")
-                    
-                    # Show first few layers
-                    for i, layer in enumerate(timeline.get('layers', [])[:5]):
-                        print(f"   Layer {i+1}: {layer.get('type')} at {layer.get('start'):.1f}s-{layer.get('end'):.1f}s")
-                    
-                    if len(timeline.get('layers', [])) > 5:
-                        print(f"   ... and {len(timeline['layers']) - 5} more layers")
+                total_duration, layer_count, first_layers = await _timeline_summary(timeline_path)
+                print(f"\n📋 Timeline Summary:")
+                print(f"   Total Duration: {total_duration:.2f}s")
+                print(f"   Layers: {layer_count}")
+                
+                # Show first few layers
+                for i, layer in enumerate(first_layers):
+                    print(f"   Layer {i+1}: {layer.get('type')} at {layer.get('start'):.1f}s-{layer.get('end'):.1f}s")
+                
+                if layer_count > SUMMARY_LAYERS:
+                    print(f"   ... and {layer_count - SUMMARY_LAYERS} more layers")
         else:
             print("\n❌ FAILED: No video created")
             
@@ -1,9 +1,11 @@
 import asyncio
 import os
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.editor_agent import EditorAgent
+from reddit_video_agent.core.asset_manifest import file_size, report_assets
 
 async def test_editor():
+    from reddit_video_agent.agents.editor_agent import EditorAgent
+    
     print("🧪 Testing Editor Agent (Phase 1)...")
     
     # Initialize
@@ -12,8 +14,8 @@ async def test_editor():
     
     # Prepare test assets
     assets = {
-        "voiceover_path": os.path.join(Config.ASSETS_DIR, "voiceover.mp3"),
-        "captions_path": os.path.join(Config.ASSETS_DIR, "captions.srt"),
+        "voiceover_path": Config.PATHS.VOICEOVER,
+        "captions_path": Config.PATHS.CAPTIONS,
         "images": [
             os.path.join(Config.ASSETS_DIR, "gen_image_0_processed.png"),
             os.path.join(Config.ASSETS_DIR, "gen_image_1_processed.png"),
@@ -25,28 +27,28 @@ async def test_editor():
     
     # Check if assets exist
     print("\n📁 Checking assets...")
-    for key, value in assets.items():
-        if value:
-            if isinstance(value, list):
-                for item in value:
-                    exists = os.path.exists(item)
-                    print(f"   {key}: {os.path.basename(item)} - {'✅' if exists else '❌'}")
-            else:
-                exists = os.path.exists(value)
-                print(f"   {key}: {os.path.basename(value)} - {'✅' if exists else '❌'}")
+    await report_assets(assets)
     
     # Execute
     print("\n🎬 Starting video composition...")
     try:
         output_path = await agent.execute(assets)
         
-        if output_path and os.path.exists(output_path):
-            size = os.path.getsize(output_path)
+        size = file_size(output_path) if output_path else None
+        if size is not None:
             print(f"\n✅ SUCCESS! Video created:")
             print(f"   Path: {output_path}")
             print(f"   Size: {size / 1024 / 1024:.2f} MB")
             print(f"\n🎥 Opening video...")
-            os.system(f"open '{output_path}'")
+            # Launch the viewer without waiting for it (macOS `open`)
+            try:
+                await asyncio.create_subprocess_exec(
+                    "open", output_path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            except OSError as e:
+                print(f"   ⚠️ Could not open video: {e}")
         else:
             print("\n❌ Failed to create video.")
             
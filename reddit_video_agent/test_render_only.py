@@ -1,44 +1,65 @@
 import asyncio
 import os
-import glob
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.editor_agent import EditorAgent
-from reddit_video_agent.agents.director import Director
+from reddit_video_agent.core.asset_manifest import file_size, scan_async, write_report
+
+# aiofiles is optional: without it the read runs in a worker thread instead
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+async def _read_text(path):
+    """Read a text file without blocking the event loop."""
+    if aiofiles is not None:
+        async with aiofiles.open(path, 'r') as f:
+            return await f.read()
+    def read():
+        with open(path, 'r') as f:
+            return f.read()
+    return await asyncio.to_thread(read)
 
 async def test_rendering_only():
+    from reddit_video_agent.agents.editor_agent import EditorAgent
+    
     print("🎬 Testing Rendering Only (Using Existing Assets)...")
     
     # Check if assets exist
     assets_dir = Config.ASSETS_DIR
     
-    voiceover = os.path.join(assets_dir, "voiceover.mp3")
-    captions = os.path.join(assets_dir, "captions.srt")
-    timeline = os.path.join(assets_dir, "timeline.json")
+    voiceover = Config.PATHS.VOICEOVER
+    captions = Config.PATHS.CAPTIONS
+    timeline = Config.PATHS.TIMELINE
+    
+    # One directory scan answers every exists/size check and asset list below
+    sizes, found = await scan_async(assets_dir, sized=("voiceover.mp3", "captions.srt", "timeline.json"))
     
-    if not os.path.exists(voiceover):
+    if "voiceover.mp3" not in sizes:
         print("❌ voiceover.mp3 not found!")
         return
     
-    if not os.path.exists(captions):
+    if "captions.srt" not in sizes:
         print("❌ captions.srt not found!")
         return
     
-    print(f"✅ Found voiceover: {os.path.getsize(voiceover)} bytes")
-    print(f"✅ Found captions: {os.path.getsize(captions)} bytes")
+    print(f"✅ Found voiceover: {sizes['voiceover.mp3']} bytes")
+    print(f"✅ Found captions: {sizes['captions.srt']} bytes")
     
     # Collect all assets
-    video_files = glob.glob(os.path.join(assets_dir, "video_*.mp4"))
-    clip_files = glob.glob(os.path.join(assets_dir, "clip_*.mp4"))
-    image_files = glob.glob(os.path.join(assets_dir, "gen_image_*_processed.png"))
-    post_screenshot = glob.glob(os.path.join(assets_dir, "post_screenshot_*.png"))
-    comment_screenshots = glob.glob(os.path.join(assets_dir, "comment_thread_*.png"))
+    video_files = found["videos"]
+    clip_files = found["clips"]
+    image_files = found["images"]
+    post_screenshot = found["post_screenshot"]
+    comment_screenshots = found["comment_screenshots"]
     
-    print(f"\n📦 Assets Found:")
-    print(f"   Videos: {len(video_files)}")
-    print(f"   Clips: {len(clip_files)}")
-    print(f"   AI Images: {len(image_files)}")
-    print(f"   Post Screenshot: {len(post_screenshot)}")
-    print(f"   Comment Screenshots: {len(comment_screenshots)}")
+    write_report([
+        "\n📦 Assets Found:",
+        f"   Videos: {len(video_files)}",
+        f"   Clips: {len(clip_files)}",
+        f"   AI Images: {len(image_files)}",
+        f"   Post Screenshot: {len(post_screenshot)}",
+        f"   Comment Screenshots: {len(comment_screenshots)}",
+    ])
     
     # Prepare assets dict
     assets = {
@@ -62,10 +83,9 @@ async def test_rendering_only():
         }
     
     # Load timeline if exists
-    if os.path.exists(timeline):
+    if "timeline.json" in sizes:
         import json
-        with open(timeline, 'r') as f:
-            assets["timeline"] = json.load(f)
+        assets["timeline"] = json.loads(await _read_text(timeline))
         print(f"✅ Loaded timeline with {len(assets['timeline'].get('layers', []))} layers")
     else:
         print("⚠️  No timeline found, will use fallback distribution")
@@ -77,9 +97,10 @@ async def test_rendering_only():
     try:
         output_path = await editor.execute(assets)
         
-        if output_path and os.path.exists(output_path):
+        size = file_size(output_path) if output_path else None
+        if size is not None:
             print(f"\n✅ SUCCESS! Video created: {output_path}")
-            print(f"   File size: {os.path.getsize(output_path) / 1024 / 1024:.2f} MB")
+            print(f"   File size: {size / 1024 / 1024:.2f} MB")
         else:
             print("\n❌ FAILED: No video created")
     except Exception as e:
@@ -1,9 +1,11 @@
 import asyncio
 import os
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.scraper_agent import ScraperAgent
 
 async def test_scraper():
+    from reddit_video_agent.agents.scraper_agent import ScraperAgent
+    from reddit_video_agent.core.browser_pool import BrowserPool
+    
     print("🧪 Testing Scraper Agent (Comments)...")
     
     config = {}
@@ -31,9 +33,8 @@ async def test_scraper():
                 print(f"   - {os.path.basename(s)}")
         else:
             print("   ❌ No comment screenshots.")
-            
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
+    finally:
+        await BrowserPool.close()
 
 if __name__ == "__main__":
     asyncio.run(test_scraper())
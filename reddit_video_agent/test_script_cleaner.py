@@ -0,0 +1,44 @@
+import re
+from reddit_video_agent.agents.scriptwriter_agent import _clean_script
+
+def _sequential_clean(script):
+    """The original step-by-step cleanup, kept as the reference for _clean_script."""
+    script = script.replace("Narrator:", "").replace("Voiceover:", "").strip()
+    video_breaks = re.findall(r'\[VIDEO_BREAK:.*?\]', script)
+    for i, vb in enumerate(video_breaks):
+        script = script.replace(vb, f"<<<VIDEO_BREAK_{i}>>>")
+    script = re.sub(r'\[.*?\]', '', script)
+    script = re.sub(r'\(.*?\)', '', script)
+    script = re.sub(r'\*.*?\*', '', script)
+    script = script.replace('*', '')
+    for i, vb in enumerate(video_breaks):
+        script = script.replace(f"<<<VIDEO_BREAK_{i}>>>", vb)
+    script = script.replace('```', '')
+    return ' '.join(script.split())
+
+# Multi-line scripts: no bracket, parenthesis or asterisk block may span lines
+SCRIPTS = [
+    "Gila guys!* Ini keren\n\nLuar biasa kan? *swoosh* mantap",
+    "* poin satu\n* poin dua\n* poin tiga",
+    "Halo (guys\nini) oke",
+    "Narrator: Halo [musik\nnaik] semua (tertawa) ya\n[VIDEO_BREAK: duration=10s, clip=action]\nLanjut *zoom* lagi",
+    "```\nVoiceover: Pertama [VIDEO_BREAK: duration=5s,\nclip=x] kedua\n```",
+    "Kalimat (dengan [kurung] campur) dan *bintang (di) sini* selesai",
+    "[buka\n(tutup]\n) *a\nb* c*",
+]
+
+def test_script_cleaner():
+    print("🧪 Testing script cleanup against the sequential cleaner...")
+    failures = 0
+    for script in SCRIPTS:
+        expected = _sequential_clean(script)
+        actual = _clean_script(script)
+        if actual == expected:
+            print(f"   ✅ {script!r}")
+        else:
+            failures += 1
+            print(f"   ❌ {script!r}\n      expected: {expected!r}\n      got:      {actual!r}")
+    assert failures == 0, f"{failures} script(s) cleaned differently"
+
+if __name__ == "__main__":
+    test_script_cleaner()
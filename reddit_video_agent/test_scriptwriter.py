@@ -1,8 +1,9 @@
 import asyncio
 from reddit_video_agent.core.config import Config
-from reddit_video_agent.agents.scriptwriter_agent import ScriptwriterAgent
 
 async def test_scriptwriter():
+    from reddit_video_agent.agents.scriptwriter_agent import ScriptwriterAgent
+    
     print("🧪 Testing Scriptwriter Agent (with Comments)...")
     
     config = {}
@@ -29,16 +30,12 @@ async def test_scriptwriter():
         ]
     }
     
-    try:
-        script = await agent.execute(post_data)
-        
-        print("\n📝 Generated Script:")
-        print("-" * 40)
-        print(script)
-        print("-" * 40)
-            
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
+    script = await agent.execute(post_data)
+    
+    print("\n📝 Generated Script:")
+    print("-" * 40)
+    print(script)
+    print("-" * 40)
 
 if __name__ == "__main__":
     asyncio.run(test_scriptwriter())